@@ -1,17 +1,110 @@
 import sys
+import time
+from typing import Any
 from src.config_parser import parse_config
 from src.maze.generator import generate_maze
-from src.maze.print_output import print_output_main
+from src.maze.print_output import print_output_main, stream_output_main
 from src.maze.maze_solver import solve_maze
+from src.maze.cache import cache_from_config
+from src.maze.pattern import warn_if_pattern_skipped
+
+
+def show(args: list[str]) -> None:
+    """
+    `a_maze_ing.py show maze.txt [config.txt]`: loads a maze written
+    to OUTPUT_FILE before, solves it if the file has no path and
+    renders it, without generating it again. The config, if given,
+    supplies RENDER, BACKEND and the settings used to regenerate; the
+    size, entry, exit and output file are the loaded maze's. Mazes
+    regenerated from the display are not written, so the shown file
+    is never overwritten.
+    """
+    from src.maze.loader import load_maze_file
+
+    if len(args) not in (1, 2):
+        print("Usage: python3 a_maze_ing.py show maze.txt [config.txt]")
+        sys.exit(1)
+
+    config: dict[str, Any] = {'PERFECT': True}
+    try:
+        if len(args) == 2:
+            config = parse_config(args[1])
+        grid, result, recorded = load_maze_file(
+            args[0], config.get('BACKEND', 'CELL')
+        )
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}")
+        return
+    config.update(recorded)
+    if not result.path:
+        result = solve_maze(grid)
+
+    if config.get('RENDER', 'ASCII') == 'MLX':
+        try:
+            from src.rendering.mlx_renderer import print_maze_mlx
+            print_maze_mlx(grid, result, config, write_output=False)
+        except ModuleNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        from src.rendering.terminal_renderer import TerminalDisplay
+        TerminalDisplay(grid, result, config, write_output=False).render()
+
+
+def solve_file(args: list[str]) -> None:
+    """
+    `a_maze_ing.py solve maze.txt [scratch_dir]`: solves a maze file
+    without loading it (see disk_solver.solve_maze_file) and stores
+    the path in the file, e.g. for mazes streamed with ALGORITHM=ELLER.
+    """
+    from src.maze.disk_solver import solve_maze_file, write_path
+
+    if len(args) not in (1, 2):
+        print("Usage: python3 a_maze_ing.py solve maze.txt [scratch_dir]")
+        sys.exit(1)
+
+    try:
+        directions = solve_maze_file(
+            args[0], args[1] if len(args) == 2 else None
+        )
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}")
+        return
+    if not directions:
+        print("Error: the exit cannot be reached from the entry")
+        return
+    write_path(args[0], directions)
+    print(f"Path of {len(directions)} steps written to {args[0]}")
 
 
 def main() -> None:
     """
     Checks for amount of arguments, parses config,
     creates and solves a grid. Then picks render option.
+    With ALGORITHM=ELLER the maze is streamed to the
+    output file instead, without solving or rendering.
+    With CACHE_DIR set, seeded mazes come from the maze cache.
+    `a_maze_ing.py batch ...` hands over to src.batch, and
+    `a_maze_ing.py show ...` renders a maze file (see show) and
+    `a_maze_ing.py solve ...` solves one on disk (see solve_file).
     """
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        from src.batch import main as batch_main
+        batch_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'show':
+        show(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'solve':
+        solve_file(sys.argv[2:])
+        return
+
     if len(sys.argv) != 2:
         print("Usage: python3 a_maze_ing.py config.txt")
+        print("       python3 a_maze_ing.py batch config.txt "
+              "[--count N] [--seed-start S] [--workers K]")
+        print("       python3 a_maze_ing.py show maze.txt [config.txt]")
+        print("       python3 a_maze_ing.py solve maze.txt [scratch_dir]")
         sys.exit(1)
 
     try:
@@ -23,32 +116,45 @@ def main() -> None:
         print(f"Error: {e}")
         return
 
-    try:
-        grid = generate_maze(config)
-    except ValueError as e:
-        print(f"Error: {e}")
-        return
+    if (warn_if_pattern_skipped(config)
+            and config.get('ALGORITHM') != 'ELLER'):
+        # Leave time to read the warning before the display takes over
+        time.sleep(3)
 
-    config['RENDER'] = config.get('RENDER', 'ASCII')
+    if config.get('ALGORITHM') == 'ELLER':
+        try:
+            stream_output_main(config)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        print(f"Maze streamed to {config['OUTPUT_FILE']}")
+        return
 
+    cache = cache_from_config(config)
     try:
-        solve_maze(grid)
+        if cache is not None:
+            grid, result = cache.generate_and_solve(config)
+        else:
+            grid = generate_maze(config)
+            result = solve_maze(grid)
     except ValueError as e:
         print(f"Error: {e}")
         return
 
+    config['RENDER'] = config.get('RENDER', 'ASCII')
+
     if config['RENDER'] == 'MLX':
         try:
             from src.rendering.mlx_renderer import print_maze_mlx
-            print_maze_mlx(grid, config)
+            print_maze_mlx(grid, result, config)
         except ModuleNotFoundError as e:
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
     else:
         try:
             from src.rendering.terminal_renderer import TerminalDisplay
-            print_output_main(grid, config)
-            display = TerminalDisplay(grid, config)
+            print_output_main(grid, config, result)
+            display = TerminalDisplay(grid, result, config)
             display.render()
         except ValueError as e:
             print(f"Error: {e}")
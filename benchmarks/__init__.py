@@ -0,0 +1,23 @@
+from typing import Any
+
+
+def make_config(size: int, **entries: Any) -> dict[str, Any]:
+    """
+    Config of a size x size maze from corner to corner with a fixed
+    SEED, so every run generates the same maze. The maze is imperfect,
+    on the Cell backend, with the default BIAS and IMPRATE; entries are
+    config keys that replace or add to these, e.g. PERFECT=True.
+    """
+    config: dict[str, Any] = {
+        'WIDTH': size,
+        'HEIGHT': size,
+        'ENTRY': (0, 0),
+        'EXIT': (size - 1, size - 1),
+        'PERFECT': False,
+        'SEED': 42,
+        'BIAS': 0.5,
+        'IMPRATE': 65,
+        'BACKEND': 'CELL',
+    }
+    config.update(entries)
+    return config
@@ -0,0 +1,57 @@
+import argparse
+import time
+
+from benchmarks import make_config
+from src.maze.generator import generate_maze
+from src.maze.maze_solver import (
+    BIDIRECTIONAL_MAX_DEGREE, mean_degree, solve_maze
+)
+
+
+def main() -> None:
+    """
+    Solves mazes with more and more loops with A* and with the
+    bidirectional breadth-first search, checks the path lengths agree
+    and prints time and expanded cells of both, with the estimated mean
+    degree and the search solve_maze picks on its own.
+    """
+    parser = argparse.ArgumentParser(
+        description="A* against bidirectional search as loops are added"
+    )
+    parser.add_argument('--size', type=int, default=1000)
+    parser.add_argument(
+        '--imprates', nargs='*', type=int, default=[0, 10, 40, 65]
+    )
+    parser.add_argument('--backend', default='CELL')
+    args = parser.parse_args()
+
+    size = args.size
+    print(f"{size}x{size}, {args.backend} backend")
+    print(f"{'IMPRATE':>7} {'degree':>6} {'auto':>5} "
+          f"{'A* s':>7} {'expanded':>9} {'bidir s':>8} {'expanded':>9}")
+    for imprate in args.imprates:
+        grid = generate_maze(make_config(
+            size, PERFECT=imprate == 0, IMPRATE=imprate, PATTERN='',
+            BACKEND=args.backend
+        ))
+        degree = mean_degree(grid)
+
+        start = time.perf_counter()
+        astar = solve_maze(grid, bidirectional=False)
+        astar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bidir = solve_maze(grid, bidirectional=True)
+        bidir_time = time.perf_counter() - start
+
+        if astar.length != bidir.length:
+            raise RuntimeError("path lengths differ")
+
+        auto = 'bidir' if degree < BIDIRECTIONAL_MAX_DEGREE else 'A*'
+        print(f"{imprate:>7} {degree:>6.3f} {auto:>5} "
+              f"{astar_time:>7.2f} {astar.expanded:>9} "
+              f"{bidir_time:>8.2f} {bidir.expanded:>9}")
+
+
+if __name__ == "__main__":
+    main()
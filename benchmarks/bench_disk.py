@@ -0,0 +1,70 @@
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from benchmarks import make_config
+from src.maze.disk_solver import solve_maze_file
+from src.maze.loader import load_maze_file
+from src.maze.maze_solver import solve_maze
+from src.maze.print_output import stream_output_main
+
+
+def in_memory(path: str) -> str:
+    grid, _, _ = load_maze_file(path, 'BITPLANE')
+    return solve_maze(grid).directions
+
+
+def measure(
+        solver: Callable[[str], str], path: str
+        ) -> tuple[float, float, str]:
+    """
+    Seconds taken, then peak MB of Python allocations in a second run
+    (memory-mapped files do not count), and the path.
+    """
+    start = time.perf_counter()
+    directions = solver(path)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    solver(path)
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return elapsed, peak, directions
+
+
+def main() -> None:
+    """
+    Streams perfect size x size mazes to disk (ALGORITHM=ELLER), then
+    solves each by loading it and calling solve_maze, and on disk with
+    solve_maze_file, and prints the times and peak memory.
+    """
+    parser = argparse.ArgumentParser(
+        description="solve_maze on a loaded maze against solve_maze_file"
+    )
+    parser.add_argument(
+        'sizes', nargs='*', type=int, default=[500, 1000, 2000]
+    )
+    args = parser.parse_args()
+
+    print(f"{'size':>11} {'steps':>7} {'memory s':>9} {'MB':>6} "
+          f"{'disk s':>7} {'MB':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "maze.txt")
+        for size in args.sizes:
+            stream_output_main(make_config(
+                size, PERFECT=True, ALGORITHM='ELLER', OUTPUT_FILE=path
+            ))
+
+            memory_time, memory_mb, expected = measure(in_memory, path)
+            disk_time, disk_mb, directions = measure(solve_maze_file, path)
+            if len(directions) != len(expected):
+                raise RuntimeError("path lengths differ")
+            print(f"{size:>5}x{size:<5} {len(directions):>7} "
+                  f"{memory_time:>9.2f} {memory_mb:>6.1f} "
+                  f"{disk_time:>7.2f} {disk_mb:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import random
+import time
+
+from benchmarks import make_config
+from src.maze.generator import generate_maze
+from src.maze.maze_solver import DistanceField, SolverWorkspace
+
+
+def main() -> None:
+    """
+    Solves from many random starts to the exit, once with one A* run
+    per start and once with a single DistanceField from the exit, and
+    prints both times after checking the path lengths agree.
+    """
+    parser = argparse.ArgumentParser(
+        description="A* per start vs one distance field from the exit"
+    )
+    parser.add_argument('--size', type=int, default=500)
+    parser.add_argument('--starts', type=int, default=100)
+    args = parser.parse_args()
+
+    size = args.size
+    grid = generate_maze(make_config(size))
+    goal = grid[size - 1][size - 1]
+    rng = random.Random(0)
+    starts = [
+        grid[rng.randrange(size)][rng.randrange(size)]
+        for _ in range(args.starts)
+    ]
+
+    workspace = SolverWorkspace(size, size)
+    start = time.perf_counter()
+    lengths = [workspace.solve(grid, cell, goal).length for cell in starts]
+    astar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    field = DistanceField(grid, [goal])
+    field_lengths = [field.solve(cell).length for cell in starts]
+    field_time = time.perf_counter() - start
+
+    if lengths != field_lengths:
+        raise RuntimeError("path lengths differ")
+
+    print(f"{size}x{size} imperfect maze, {len(starts)} starts")
+    print(f"A* per start    {astar_time:>8.2f}s")
+    print(f"distance field  {field_time:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
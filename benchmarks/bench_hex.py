@@ -0,0 +1,106 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from typing import TextIO
+
+from src.maze.bitgrid import BitGrid, GridView
+from src.maze.generator import Cell
+from src.maze.print_output import print_maze_hex
+from src.rendering.render_utils import cell_to_tile_index
+
+
+def random_bits(size: int) -> BitGrid:
+    """
+    size x size BitGrid with random walls. The hex writer does not care
+    whether the walls form a maze, and carving a large one would take
+    far longer than writing it.
+    """
+    bits = BitGrid(size, size)
+    rng = random.Random(42)
+    low_bit = bytes(b & 1 for b in range(256))
+    bits.east[:] = rng.randbytes(size * size).translate(low_bit)
+    bits.south[:] = rng.randbytes(size * size).translate(low_bit)
+    return bits
+
+
+def cell_hex(grid: Sequence[Sequence[Cell]], f: TextIO) -> None:
+    """
+    The per cell writer used before, for Cell grids.
+    """
+    for row in grid:
+        for cell in row:
+            f.write(f"{cell_to_tile_index(cell):x}")
+        f.write("\n")
+
+
+def bits_hex(grid: GridView, f: TextIO) -> None:
+    """
+    The per cell writer used before, for BitGrid backed grids.
+    """
+    bits = grid.bits
+    w = bits.width
+    for y in range(bits.height):
+        row = y * w
+        f.write(''.join(
+            f"{bits.tile_index(i):x}" for i in range(row, row + w)
+        ))
+        f.write("\n")
+
+
+def timed_write(
+        writer: Callable[..., None], grid: Sequence[Sequence[Cell]],
+        path: str
+        ) -> tuple[float, bytes]:
+    start = time.perf_counter()
+    with open(path, "w") as f:
+        writer(grid, f)
+    elapsed = time.perf_counter() - start
+    with open(path, "rb") as f:
+        return elapsed, f.read()
+
+
+def main() -> None:
+    """
+    Writes the hex grid of a random size x size maze with the old per
+    cell writers and with print_maze_hex, for both backends, checks the
+    files are byte-identical and prints the times.
+    """
+    parser = argparse.ArgumentParser(
+        description="Per cell hex writer against the bulk one"
+    )
+    parser.add_argument(
+        'sizes', nargs='*', type=int, default=[1000, 2000, 5000]
+    )
+    parser.add_argument(
+        '--cell-max', type=int, default=2000,
+        help="largest size also written from Cell objects"
+    )
+    args = parser.parse_args()
+
+    print(f"{'backend':<9} {'size':>11} {'old s':>7} {'new s':>7} "
+          f"{'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "maze.txt")
+        for size in args.sizes:
+            bits = random_bits(size)
+            runs: list[tuple[str, Sequence[Sequence[Cell]],
+                             Callable[..., None]]] = [
+                ("BITPLANE", GridView(bits), bits_hex)
+            ]
+            if size <= args.cell_max:
+                runs.append(("CELL", bits.to_cells(), cell_hex))
+
+            for backend, grid, old_writer in runs:
+                old_time, old = timed_write(old_writer, grid, path)
+                new_time, new = timed_write(print_maze_hex, grid, path)
+                if old != new:
+                    raise RuntimeError("output differs")
+                print(f"{backend:<9} {size:>5}x{size:<5} {old_time:>7.2f} "
+                      f"{new_time:>7.2f} {old_time / new_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import argparse
+import random
+import time
+from typing import Any
+
+from benchmarks import make_config
+from src.maze.generator import generate_maze
+from src.maze.incremental import IncrementalSolver
+from src.maze.maze_solver import solve_maze
+
+
+def random_wall(grid: Any, rng: random.Random) -> tuple[Any, Any, bool]:
+    """
+    A random inner wall, with the state that toggles it.
+    """
+    size = len(grid)
+    x = rng.randrange(size - 1)
+    y = rng.randrange(size - 1)
+    direction = rng.choice('ES')
+    a = grid[y][x]
+    b = grid[y][x + 1] if direction == 'E' else grid[y + 1][x]
+    return a, b, not a.walls[direction]
+
+
+def path_wall(
+        grid: Any, path: list[Any], rng: random.Random
+        ) -> tuple[Any, Any, bool]:
+    """
+    Toggle a wall of a random cell on the current path: close a step
+    of the path, or open a closed side of the cell.
+    """
+    k = rng.randrange(len(path) - 1)
+    a = path[k]
+    if rng.random() < 0.5:
+        return a, path[k + 1], True
+
+    size = len(grid)
+    sides = [
+        (direction, a.x + dx, a.y + dy)
+        for direction, dx, dy in (
+            ('E', 1, 0), ('W', -1, 0), ('S', 0, 1), ('N', 0, -1)
+        )
+        if 0 <= a.x + dx < size and 0 <= a.y + dy < size
+    ]
+    direction, x, y = rng.choice(sides)
+    return a, grid[y][x], not a.walls[direction]
+
+
+def main() -> None:
+    """
+    Applies single wall edits to a solved maze and re-solves after
+    each one, with IncrementalSolver and with a full solve_maze, checks
+    the path lengths agree and prints mean and worst times. Edits are
+    either anywhere in the maze or on the current path.
+    """
+    parser = argparse.ArgumentParser(
+        description="Re-solving after single wall edits"
+    )
+    parser.add_argument('--size', type=int, default=1000)
+    parser.add_argument('--edits', type=int, default=20)
+    parser.add_argument('--imprate', type=int, default=65)
+    args = parser.parse_args()
+
+    size = args.size
+    # No pattern, so every wall can be edited
+    grid = generate_maze(make_config(
+        size, PERFECT=args.imprate == 0, IMPRATE=args.imprate, PATTERN=''
+    ))
+    rng = random.Random(0)
+
+    start = time.perf_counter()
+    solver = IncrementalSolver(grid)
+    result = solver.solve()
+    first_time = time.perf_counter() - start
+    print(f"{size}x{size} maze (IMPRATE={args.imprate}), "
+          f"first solve {first_time:.2f}s, {result.expanded} expanded")
+    print(f"{'edits':<9} {'full mean':>9} {'full max':>9} "
+          f"{'incr mean':>9} {'incr max':>9} {'incr expanded':>13}")
+
+    for kind in ('anywhere', 'on path'):
+        full_times = []
+        incr_times = []
+        expanded = 0
+        for _ in range(args.edits):
+            if kind == 'anywhere' or len(result.path) < 2:
+                a, b, closed = random_wall(grid, rng)
+            else:
+                a, b, closed = path_wall(grid, result.path, rng)
+
+            start = time.perf_counter()
+            solver.set_wall(a, b, closed)
+            result = solver.solve()
+            incr_times.append(time.perf_counter() - start)
+            expanded += result.expanded
+
+            start = time.perf_counter()
+            full = solve_maze(grid)
+            full_times.append(time.perf_counter() - start)
+            if full.length != result.length:
+                raise RuntimeError("path lengths differ")
+
+        print(f"{kind:<9} {sum(full_times) / len(full_times):>9.3f} "
+              f"{max(full_times):>9.3f} "
+              f"{sum(incr_times) / len(incr_times):>9.4f} "
+              f"{max(incr_times):>9.4f} "
+              f"{expanded / args.edits:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
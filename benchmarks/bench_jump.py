@@ -0,0 +1,70 @@
+import argparse
+import random
+import time
+
+from benchmarks import make_config
+from src.maze.generator import generate_maze
+from src.maze.jump_search import JumpSearch
+from src.maze.maze_solver import SolverWorkspace
+
+
+def main() -> None:
+    """
+    Answers the same path queries (corner to corner, then random
+    pairs) with A* and with JumpSearch, checks the path lengths agree
+    and prints the cells expanded per query and the times. The jump
+    tables are built once, their build time is printed separately.
+    """
+    parser = argparse.ArgumentParser(
+        description="A* against A* jumping along corridors"
+    )
+    parser.add_argument('--size', type=int, default=1000)
+    parser.add_argument('--queries', type=int, default=5)
+    parser.add_argument(
+        '--imprates', nargs='*', type=int, default=[20, 65, 90]
+    )
+    parser.add_argument('--bias', type=float, default=0.5)
+    args = parser.parse_args()
+
+    size = args.size
+    print(f"{size}x{size}, BIAS={args.bias}, {args.queries} queries")
+    print(f"{'IMPRATE':>7} {'build s':>8} {'A* s':>7} {'expanded':>9} "
+          f"{'jump s':>7} {'expanded':>9}")
+    for imprate in args.imprates:
+        grid = generate_maze(make_config(
+            size, IMPRATE=imprate, BIAS=args.bias
+        ))
+        rng = random.Random(0)
+        pairs = [(grid[0][0], grid[size - 1][size - 1])] + [
+            (
+                grid[rng.randrange(size)][rng.randrange(size)],
+                grid[rng.randrange(size)][rng.randrange(size)],
+            )
+            for _ in range(args.queries - 1)
+        ]
+
+        start = time.perf_counter()
+        jumps = JumpSearch(grid)
+        build_time = time.perf_counter() - start
+
+        workspace = SolverWorkspace(size, size)
+        start = time.perf_counter()
+        cell_results = [workspace.solve(grid, a, b) for a, b in pairs]
+        cell_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        jump_results = [jumps.solve(a, b) for a, b in pairs]
+        jump_time = time.perf_counter() - start
+
+        for cell_result, jump_result in zip(cell_results, jump_results):
+            if cell_result.length != jump_result.length:
+                raise RuntimeError("path lengths differ")
+
+        cells = sum(r.expanded for r in cell_results) / len(pairs)
+        ends = sum(r.expanded for r in jump_results) / len(pairs)
+        print(f"{imprate:>7} {build_time:>8.2f} {cell_time:>7.2f} "
+              f"{cells:>9.0f} {jump_time:>7.2f} {ends:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import random
+import time
+
+from benchmarks import make_config
+from src.maze.generator import generate_maze
+from src.maze.junctions import JunctionGraph
+from src.maze.maze_solver import SolverWorkspace
+
+
+def main() -> None:
+    """
+    Answers the same random path queries on an imperfect maze with A*
+    on the cells and with A* on the JunctionGraph, checks the path
+    lengths agree and prints the times. The graph is built once, its
+    build time is printed separately.
+    """
+    parser = argparse.ArgumentParser(
+        description="A* on cells vs A* on the corridor-contracted graph"
+    )
+    parser.add_argument('--size', type=int, default=1000)
+    parser.add_argument('--queries', type=int, default=20)
+    parser.add_argument('--imprate', type=int, default=65)
+    args = parser.parse_args()
+
+    size = args.size
+    grid = generate_maze(make_config(size, IMPRATE=args.imprate))
+    rng = random.Random(0)
+    pairs = [
+        tuple(
+            grid[rng.randrange(size)][rng.randrange(size)]
+            for _ in range(2)
+        )
+        for _ in range(args.queries)
+    ]
+
+    start = time.perf_counter()
+    graph = JunctionGraph(grid)
+    build_time = time.perf_counter() - start
+
+    workspace = SolverWorkspace(size, size)
+    start = time.perf_counter()
+    cell_results = [workspace.solve(grid, a, b) for a, b in pairs]
+    cell_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph_results = [graph.solve(a, b) for a, b in pairs]
+    graph_time = time.perf_counter() - start
+
+    for cell_result, graph_result in zip(cell_results, graph_results):
+        if cell_result.length != graph_result.length:
+            raise RuntimeError("path lengths differ")
+
+    cells = sum(r.expanded for r in cell_results) / len(pairs)
+    nodes = sum(r.expanded for r in graph_results) / len(pairs)
+    print(f"{size}x{size} imperfect maze (IMPRATE={args.imprate}), "
+          f"{len(pairs)} queries")
+    print(f"graph: {len(graph.node_cells)} nodes, {len(graph.ends)} edges, "
+          f"built in {build_time:.2f}s")
+    print(f"A* on cells  {cell_time:>8.2f}s  {cells:>10.0f} expanded/query")
+    print(f"A* on graph  {graph_time:>8.2f}s  {nodes:>10.0f} expanded/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.bench_hex import random_bits
+from src.maze.bitgrid import BitGrid, GridView
+from src.maze.loader import read_maze_hex
+from src.maze.print_output import print_maze_hex
+
+
+def naive_load(path: str) -> BitGrid:
+    """
+    Reads the grid one character at a time into a BitGrid, the way a
+    plain parser would, without checking anything.
+    """
+    with open(path) as f:
+        lines = f.read().split("\n\n")[0].split("\n")
+    bits = BitGrid(len(lines[0]), len(lines))
+    i = 0
+    for line in lines:
+        for char in line:
+            tile = int(char, 16)
+            bits.east[i] = tile >> 1 & 1
+            bits.south[i] = tile >> 2 & 1
+            i += 1
+    return bits
+
+
+def main() -> None:
+    """
+    Writes the hex file of a random size x size maze and prints the
+    time to read the file, to load it with read_maze_hex (decoding and
+    checking every wall) and, up to --naive-max, with a per character
+    parser.
+    """
+    parser = argparse.ArgumentParser(
+        description="Hex loader against a plain file read"
+    )
+    parser.add_argument(
+        'sizes', nargs='*', type=int, default=[1000, 5000, 10000]
+    )
+    parser.add_argument(
+        '--naive-max', type=int, default=2000,
+        help="largest size also loaded by the per character parser"
+    )
+    args = parser.parse_args()
+
+    print(f"{'size':>11} {'MB':>6} {'read s':>7} {'load s':>7} "
+          f"{'naive s':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "maze.txt")
+        for size in args.sizes:
+            bits = random_bits(size)
+            # Close the border as the writer does, to compare the walls
+            bits.east[size - 1::size] = b'\x01' * size
+            bits.south[-size:] = b'\x01' * size
+            with open(path, "w") as f:
+                print_maze_hex(GridView(bits), f)
+                f.write(f"\n0,0\n{size - 1},{size - 1}\n")
+
+            start = time.perf_counter()
+            with open(path, "rb") as binary:
+                binary.read()
+            read_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with open(path, "rb") as binary:
+                loaded, _ = read_maze_hex(binary)
+            load_time = time.perf_counter() - start
+            if (loaded.east, loaded.south) != (bits.east, bits.south):
+                raise RuntimeError("loaded walls differ")
+
+            naive = "-"
+            if size <= args.naive_max:
+                start = time.perf_counter()
+                naive_load(path)
+                naive = f"{time.perf_counter() - start:.2f}"
+
+            mb = os.path.getsize(path) / 2 ** 20
+            print(f"{size:>5}x{size:<5} {mb:>6.1f} {read_time:>7.2f} "
+                  f"{load_time:>7.2f} {naive:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.bench_hex import random_bits
+from src.maze.bitgrid import GridView
+from src.maze.maze_solver import SolveResult
+from src.maze.packed import PackedMaze, write_packed
+from src.maze.print_output import print_maze_hex, print_path
+
+
+def main() -> None:
+    """
+    Writes a random size x size maze in the hex and the packed format
+    and prints file sizes and write times, then the time to open the
+    packed file and to read random cells from it.
+    """
+    parser = argparse.ArgumentParser(
+        description="Hex text output against the packed binary format"
+    )
+    parser.add_argument(
+        'sizes', nargs='*', type=int, default=[1000, 5000, 10000]
+    )
+    parser.add_argument('--reads', type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'size':>11} {'hex MB':>7} {'hex s':>6} {'packed MB':>9} "
+          f"{'packed s':>8} {'open ms':>7} {'us/read':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        hex_path = os.path.join(tmp, "maze.txt")
+        packed_path = os.path.join(tmp, "maze.bin")
+        for size in args.sizes:
+            grid = GridView(random_bits(size))
+            # Any direction string will do for the size of the path
+            result = SolveResult([], 'ES' * size, 0)
+            entry, exit_pos = (0, 0), (size - 1, size - 1)
+
+            start = time.perf_counter()
+            with open(hex_path, "w") as f:
+                print_maze_hex(grid, f)
+                f.write(f"\n0,0\n{size - 1},{size - 1}")
+                print_path(result, f)
+            hex_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with open(packed_path, "wb") as binary:
+                write_packed(
+                    grid, binary, entry, exit_pos, result.directions
+                )
+            packed_time = time.perf_counter() - start
+
+            rng = random.Random(0)
+            cells = [
+                (rng.randrange(size), rng.randrange(size))
+                for _ in range(args.reads)
+            ]
+            start = time.perf_counter()
+            maze = PackedMaze(packed_path)
+            open_time = time.perf_counter() - start
+            start = time.perf_counter()
+            for x, y in cells:
+                maze.tile(x, y)
+            read_time = time.perf_counter() - start
+            maze.close()
+
+            hex_mb = os.path.getsize(hex_path) / 2 ** 20
+            packed_mb = os.path.getsize(packed_path) / 2 ** 20
+            print(f"{size:>5}x{size:<5} {hex_mb:>7.1f} {hex_time:>6.2f} "
+                  f"{packed_mb:>9.1f} {packed_time:>8.2f} "
+                  f"{open_time * 1e3:>7.2f} "
+                  f"{read_time / args.reads * 1e6:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.bench_hex import random_bits
+from src.maze.bitgrid import GridView
+from src.maze.loader import load_maze_file
+from src.maze.packed import write_packed
+from src.maze.print_output import print_maze_hex
+from src.maze.region import MazeFile
+
+
+def read_views(
+        maze: MazeFile, views: list[tuple[int, int]], width: int,
+        height: int
+        ) -> float:
+    """
+    Seconds per region read over the given view positions.
+    """
+    start = time.perf_counter()
+    for x, y in views:
+        maze.region_tiles(x, y, width, height)
+    return (time.perf_counter() - start) / len(views)
+
+
+def main() -> None:
+    """
+    Writes a random size x size maze in both formats, then prints the
+    time to load it whole, to open it as a MazeFile, and to read
+    viewport sized regions at random places and while panning across
+    the maze, with the block cache hit rate.
+    """
+    parser = argparse.ArgumentParser(
+        description="Loading whole mazes against reading regions"
+    )
+    parser.add_argument('--size', type=int, default=10000)
+    parser.add_argument('--view', type=int, nargs=2, default=[160, 50])
+    parser.add_argument('--views', type=int, default=1000)
+    args = parser.parse_args()
+
+    size = args.size
+    view_w, view_h = args.view
+    rng = random.Random(0)
+    scattered = [
+        (rng.randrange(size - view_w), rng.randrange(size - view_h))
+        for _ in range(args.views)
+    ]
+    # Scroll down a column of the maze a few rows at a time
+    panning = [
+        (size // 2, (k * 5) % (size - view_h)) for k in range(args.views)
+    ]
+
+    print(f"{size}x{size}, {view_w}x{view_h} views")
+    print(f"{'format':<7} {'MB':>6} {'load s':>7} {'open ms':>8} "
+          f"{'random ms':>9} {'pan ms':>7} {'pan hits':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        grid = GridView(random_bits(size))
+        entry, exit_pos = (0, 0), (size - 1, size - 1)
+        hex_path = os.path.join(tmp, "maze.txt")
+        with open(hex_path, "w") as f:
+            print_maze_hex(grid, f)
+            f.write(f"\n0,0\n{size - 1},{size - 1}\n")
+        packed_path = os.path.join(tmp, "maze.bin")
+        with open(packed_path, "wb") as binary:
+            write_packed(grid, binary, entry, exit_pos, '')
+
+        for name, path in (("HEX", hex_path), ("PACKED", packed_path)):
+            start = time.perf_counter()
+            load_maze_file(path, 'BITPLANE')
+            load_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            maze = MazeFile(path)
+            open_time = time.perf_counter() - start
+            random_time = read_views(maze, scattered, view_w, view_h)
+
+            maze.blocks.clear()
+            maze.stats = dict.fromkeys(maze.stats, 0)
+            pan_time = read_views(maze, panning, view_w, view_h)
+            hits = maze.stats['hits'] / (
+                maze.stats['hits'] + maze.stats['misses']
+            )
+            maze.close()
+
+            mb = os.path.getsize(path) / 2 ** 20
+            print(f"{name:<7} {mb:>6.1f} {load_time:>7.2f} "
+                  f"{open_time * 1e3:>8.2f} {random_time * 1e3:>9.3f} "
+                  f"{pan_time * 1e3:>7.3f} {hits:>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
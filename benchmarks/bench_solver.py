@@ -0,0 +1,104 @@
+import argparse
+import time
+from collections.abc import Sequence
+
+from benchmarks import make_config
+from src.maze.bitgrid import GridView
+from src.maze.generator import Cell, generate_maze
+from src.maze.maze_solver import get_neighbors, manhattan, solve_maze
+
+
+def list_solve_maze(grid: Sequence[Sequence[Cell]]) -> int:
+    """
+    The list based A* solve_maze used before: the open set is a plain
+    list, scanned with min() and list.remove on every step.
+
+    Returns:
+        Number of steps on the path found.
+    """
+    start = next(c for row in grid for c in row if c.is_start)
+    goal = next(c for row in grid for c in row if c.is_goal)
+
+    g = {start: 0}
+    f = {start: manhattan(start, goal)}
+    parent: dict[Cell, Cell] = {}
+    open_set = [start]
+    closed_set = set()
+
+    while open_set:
+        current = min(open_set, key=lambda c: f[c])
+        if current == goal:
+            break
+
+        open_set.remove(current)
+        closed_set.add(current)
+
+        for neighbor in get_neighbors(current, grid):
+            if neighbor in closed_set:
+                continue
+
+            tentative_g = g[current] + 1
+            if neighbor not in open_set:
+                open_set.append(neighbor)
+            elif tentative_g >= g[neighbor]:
+                continue
+
+            parent[neighbor] = current
+            g[neighbor] = tentative_g
+            f[neighbor] = tentative_g + manhattan(neighbor, goal)
+
+    steps = 0
+    cell = goal
+    while cell in parent:
+        cell = parent[cell]
+        steps += 1
+    return steps
+
+
+def main() -> None:
+    """
+    Solves the same imperfect mazes with the heap based solve_maze and
+    the previous list based solver, checks that both find a path of the
+    same length and prints their times.
+    """
+    parser = argparse.ArgumentParser(
+        description="Heap vs list open set in the Cell A* solver"
+    )
+    parser.add_argument(
+        'sizes', nargs='*', type=int, default=[250, 500, 1000]
+    )
+    parser.add_argument(
+        '--skip-list', action='store_true',
+        help="only time the heap solver"
+    )
+    args = parser.parse_args()
+
+    print(f"{'size':>11} {'heap s':>9} {'list s':>9} {'speedup':>8}")
+    for size in args.sizes:
+        view = generate_maze(make_config(size, BACKEND='BITPLANE'))
+        if not isinstance(view, GridView):
+            raise TypeError("BITPLANE backend did not return a GridView")
+        grid = view.bits.to_cells()
+
+        start = time.perf_counter()
+        length = solve_maze(grid).length
+        heap_time = time.perf_counter() - start
+
+        if args.skip_list:
+            print(f"{size:>5}x{size:<5} {heap_time:>9.2f}")
+            continue
+
+        start = time.perf_counter()
+        list_length = list_solve_maze(grid)
+        list_time = time.perf_counter() - start
+        if list_length != length:
+            raise RuntimeError(f"path lengths differ at {size}x{size}")
+
+        print(
+            f"{size:>5}x{size:<5} {heap_time:>9.2f} {list_time:>9.2f} "
+            f"{list_time / heap_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
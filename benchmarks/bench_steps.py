@@ -0,0 +1,293 @@
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from benchmarks import make_config
+from src.maze.generator import (
+    Cell,
+    MazeGenerator,
+    growing_sigma_tree,
+    wilson_sometimes_hunts,
+)
+from src.maze.generator_utils import mark_start_and_exit
+from src.rendering.render_utils import cell_to_tile_index
+
+if TYPE_CHECKING:
+    from src.maze.generator_utils import RandomSet
+
+Carve = Callable[[list[list[Cell]], random.Random], None]
+
+
+def old_growing_sigma_tree(
+        grid: list[list[Cell]], bias: float, rng: random.Random
+        ) -> None:
+    """
+    growing_sigma_tree before the neighbour finder was bound once per
+    run: the helpers are imported, and the grid size and RNG methods
+    looked up, on every step.
+    """
+    from src.maze.generator_utils import (
+        ActiveList,
+        get_unvisited_neighbors,
+        remove_wall_between,
+    )
+
+    while True:
+        start = grid[rng.randrange(len(grid))][rng.randrange(len(grid[0]))]
+        if not start.pattern:
+            break
+
+    start.visited = True
+    active = ActiveList(start, rng)
+
+    while active:
+        slot = active.newest() if rng.random() < bias else active.choice()
+        cell = active[slot]
+        neighbors = get_unvisited_neighbors(grid, cell)
+
+        if neighbors:
+            next_cell = rng.choice(neighbors)
+            remove_wall_between(cell, next_cell)
+            next_cell.visited = True
+            active.append(next_cell)
+        else:
+            active.remove(slot)
+
+
+def old_wilson_sometimes_hunts(
+        grid: list[list[Cell]], bias: float, imprate: int,
+        rng: random.Random
+        ) -> None:
+    """
+    wilson_sometimes_hunts before its steps shared a _CarveRun: every
+    step gets the grid, sets and RNG as arguments, imports its helpers
+    and looks up neighbours with get_all_neighbors.
+    """
+    from src.maze.generator_utils import RandomSet, get_all_neighbors
+
+    while True:
+        start = grid[rng.randrange(len(grid))][rng.randrange(len(grid[0]))]
+        if not start.pattern:
+            break
+
+    start.visited = True
+
+    unvisited = RandomSet((
+        cell
+        for row in grid
+        for cell in row
+        if not cell.visited and not cell.pattern
+    ), rng)
+    frontier = RandomSet((
+        cell
+        for cell in unvisited.items
+        if any(n.visited for n in get_all_neighbors(grid, cell))
+    ), rng)
+
+    while unvisited:
+        if rng.random() < bias:
+            _old_wilson_step(grid, unvisited, frontier, imprate, rng)
+        else:
+            _old_hunt_step(grid, unvisited, frontier, imprate, rng)
+
+
+def _old_mark_visited(
+        grid: list[list[Cell]], cell: Cell,
+        unvisited: "RandomSet[Cell]", frontier: "RandomSet[Cell]"
+        ) -> None:
+    from src.maze.generator_utils import get_all_neighbors
+
+    cell.visited = True
+    unvisited.discard(cell)
+    frontier.discard(cell)
+
+    for neighbor in get_all_neighbors(grid, cell):
+        if not neighbor.visited:
+            frontier.add(neighbor)
+
+
+def _old_wilson_step(
+        grid: list[list[Cell]], unvisited: "RandomSet[Cell]",
+        frontier: "RandomSet[Cell]", imprate: int, rng: random.Random
+        ) -> None:
+    from src.maze.generator_utils import (
+        get_all_neighbors,
+        remove_wall_between,
+    )
+
+    start = cell = unvisited.choice()
+    last_exit: dict[Cell, Cell] = {}
+
+    while not cell.visited:
+        neighbors = get_all_neighbors(grid, cell)
+        if not neighbors:
+            break
+
+        next_cell = rng.choice(neighbors)
+        last_exit[cell] = next_cell
+        cell = next_cell
+
+    cell = start
+    path = [cell]
+    while cell in last_exit:
+        cell = last_exit[cell]
+        path.append(cell)
+
+    for i in range(len(path) - 1):
+        current = path[i]
+        next_cell = path[i + 1]
+
+        remove_wall_between(current, next_cell)
+        for carved in (current, next_cell):
+            if not carved.visited:
+                _old_mark_visited(grid, carved, unvisited, frontier)
+
+        _old_maybe_add_imperfection(grid, current, next_cell, imprate, rng)
+
+
+def _old_hunt_step(
+        grid: list[list[Cell]], unvisited: "RandomSet[Cell]",
+        frontier: "RandomSet[Cell]", imprate: int, rng: random.Random
+        ) -> None:
+    from src.maze.generator_utils import get_all_neighbors, remove_wall_between
+
+    if not frontier:
+        _old_mark_visited(grid, unvisited.choice(), unvisited, frontier)
+        return
+
+    cell = frontier.choice()
+    visited_neighbors = [
+        n for n in get_all_neighbors(grid, cell) if n.visited
+        ]
+
+    next_cell = rng.choice(visited_neighbors)
+    remove_wall_between(cell, next_cell)
+    _old_mark_visited(grid, cell, unvisited, frontier)
+
+    _old_maybe_add_imperfection(grid, cell, next_cell, imprate, rng)
+
+
+def _old_maybe_add_imperfection(
+        grid: list[list[Cell]], cell: Cell, exclude: Cell, imprate: int,
+        rng: random.Random
+        ) -> None:
+    from src.maze.generator_utils import (
+        get_all_neighbors, remove_wall_between, wall_exists_between
+        )
+
+    if rng.randint(1, 100) > imprate:
+        return
+
+    extra_neighbors = [
+        n for n in get_all_neighbors(grid, cell)
+        if n.visited and n != exclude
+    ]
+
+    if extra_neighbors:
+        extra = rng.choice(extra_neighbors)
+        if wall_exists_between(cell, extra):
+            remove_wall_between(cell, extra)
+
+
+def time_carve(size: int, perfect: bool, carve: Carve) -> tuple[float, bytes]:
+    """
+    Seconds carve takes on a fresh size x size grid without a pattern,
+    so every cell is carved, and the tile index of every cell after it.
+    The grid is built outside the timed part.
+    """
+    config = make_config(size, PERFECT=perfect, PATTERN='')
+    grid = MazeGenerator(config).make_grid()
+    mark_start_and_exit(grid, config['ENTRY'], config['EXIT'])
+
+    start = time.perf_counter()
+    carve(grid, random.Random(config['SEED']))
+    seconds = time.perf_counter() - start
+    return seconds, bytes(
+        cell_to_tile_index(cell) for row in grid for cell in row
+    )
+
+
+def main() -> None:
+    """
+    Times the Cell backend generators on growing square grids, next to
+    the step logic used before their lookups were bound once per run,
+    and prints the cost per carved cell, which is the per-step overhead
+    of the generation core. Both versions draw the same random numbers,
+    so they must carve the same maze; this is checked.
+    """
+    parser = argparse.ArgumentParser(
+        description="Per-step cost of the Cell backend generators"
+    )
+    parser.add_argument(
+        'sizes', nargs='*', type=int, default=[100, 250, 500, 1000]
+    )
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument(
+        '--skip-old', action='store_true',
+        help="only time the current generators"
+    )
+    args = parser.parse_args()
+
+    imprate = make_config(0)['IMPRATE']
+    runs: list[tuple[str, bool, Carve, Carve]] = [
+        (
+            "growing tree", True,
+            lambda grid, rng: growing_sigma_tree(grid, 0.5, None, rng),
+            lambda grid, rng: old_growing_sigma_tree(grid, 0.5, rng),
+        ),
+        (
+            "hunt-and-kill", False,
+            lambda grid, rng: wilson_sometimes_hunts(
+                grid, 0.0, None, imprate, rng
+            ),
+            lambda grid, rng: old_wilson_sometimes_hunts(
+                grid, 0.0, imprate, rng
+            ),
+        ),
+        (
+            "wilson+hunt", False,
+            lambda grid, rng: wilson_sometimes_hunts(
+                grid, 0.5, None, imprate, rng
+            ),
+            lambda grid, rng: old_wilson_sometimes_hunts(
+                grid, 0.5, imprate, rng
+            ),
+        ),
+    ]
+
+    print(
+        f"{'generator':<14} {'size':>11} {'seconds':>9} {'us/cell':>8} "
+        f"{'old us':>8} {'speedup':>8}"
+    )
+    for name, perfect, carve, old_carve in runs:
+        for size in args.sizes:
+            cells = size * size
+            best = old_best = float('inf')
+            for _ in range(args.repeat):
+                seconds, maze = time_carve(size, perfect, carve)
+                best = min(best, seconds)
+                if args.skip_old:
+                    continue
+                seconds, old_maze = time_carve(size, perfect, old_carve)
+                old_best = min(old_best, seconds)
+                if old_maze != maze:
+                    raise RuntimeError(
+                        f"{name} mazes differ at {size}x{size}"
+                    )
+
+            line = (
+                f"{name:<14} {size:>5}x{size:<5} {best:>9.2f} "
+                f"{best / cells * 1e6:>8.2f}"
+            )
+            if not args.skip_old:
+                line += (
+                    f" {old_best / cells * 1e6:>8.2f}"
+                    f" {old_best / best:>7.2f}x"
+                )
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import os
+import time
+
+from benchmarks import make_config
+from src.maze.generator import generate_maze
+
+
+def main() -> None:
+    """
+    Times tiled generation of one maze with a growing number of worker
+    processes and prints the speedup over a single worker. The maze is
+    the same for every worker count.
+    """
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(
+        description="Scaling of tiled maze generation across cores"
+    )
+    parser.add_argument('--size', type=int, default=2000)
+    parser.add_argument('--tile-size', type=int, default=250)
+    parser.add_argument(
+        '--workers', nargs='*', type=int,
+        default=sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+    )
+    parser.add_argument('--imperfect', action='store_true')
+    args = parser.parse_args()
+
+    print(f"{args.size}x{args.size} cells, tiles of {args.tile_size}, "
+          f"{cpus} CPUs")
+    print(f"{'workers':>7} {'seconds':>9} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        config = make_config(
+            args.size, PERFECT=not args.imperfect, BACKEND='BITPLANE',
+            TILE_SIZE=args.tile_size, WORKERS=workers
+        )
+        start = time.perf_counter()
+        generate_maze(config)
+        elapsed = time.perf_counter() - start
+
+        if baseline is None:
+            baseline = elapsed
+        print(f"{workers:>7} {elapsed:>9.2f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
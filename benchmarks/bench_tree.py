@@ -0,0 +1,65 @@
+import argparse
+import random
+import time
+
+from benchmarks import make_config
+from src.maze.generator import generate_maze
+from src.maze.maze_solver import SolverWorkspace, TreeIndex
+
+
+def main() -> None:
+    """
+    Answers the same random path queries on a perfect maze with A* and
+    with a TreeIndex, checks both give paths of the same length and
+    prints the total times. The TreeIndex time includes building it.
+    """
+    parser = argparse.ArgumentParser(
+        description="A* vs tree index path queries on a perfect maze"
+    )
+    parser.add_argument('--size', type=int, default=500)
+    parser.add_argument('--queries', type=int, default=1000)
+    parser.add_argument(
+        '--astar-queries', type=int, default=20,
+        help="queries timed with A*, the time is scaled up"
+    )
+    args = parser.parse_args()
+
+    grid = generate_maze(make_config(
+        args.size, PERFECT=True, ALGORITHM='KRUSKAL'
+    ))
+    rng = random.Random(0)
+    pairs = [
+        tuple(
+            grid[rng.randrange(args.size)][rng.randrange(args.size)]
+            for _ in range(2)
+        )
+        for _ in range(args.queries)
+    ]
+
+    start = time.perf_counter()
+    tree = TreeIndex.build(grid)
+    build_time = time.perf_counter() - start
+    if tree is None:
+        raise RuntimeError("maze is not perfect")
+
+    start = time.perf_counter()
+    lengths = [len(tree.path(a, b)) - 1 for a, b in pairs]
+    query_time = time.perf_counter() - start
+
+    workspace = SolverWorkspace(args.size, args.size)
+    checked = pairs[:args.astar_queries]
+    start = time.perf_counter()
+    for (a, b), length in zip(checked, lengths):
+        if workspace.solve(grid, a, b).length != length:
+            raise RuntimeError("path lengths differ")
+    astar_time = (time.perf_counter() - start) * len(pairs) / len(checked)
+
+    print(f"{args.size}x{args.size} perfect maze, {len(pairs)} queries")
+    print(f"A*          {astar_time:>9.2f}s (from {len(checked)} queries)")
+    print(f"tree build  {build_time:>9.2f}s")
+    print(f"tree paths  {query_time:>9.2f}s")
+    print(f"speedup     {astar_time / (build_time + query_time):>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import argparse
+import time
+
+from benchmarks import make_config
+from src.maze.generator import generate_maze
+
+
+def main() -> None:
+    """
+    Times wilson_sometimes_hunts on growing square grids and prints
+    the cost per cell. With linear scaling the last column stays flat
+    as the grid grows.
+    """
+    parser = argparse.ArgumentParser(
+        description="Scaling of imperfect maze generation"
+    )
+    parser.add_argument(
+        'sizes', nargs='*', type=int, default=[100, 250, 500, 1000]
+    )
+    parser.add_argument(
+        '--backend', choices=('CELL', 'BITPLANE'), default='BITPLANE'
+    )
+    parser.add_argument('--bias', type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(f"{'size':>11} {'cells':>10} {'seconds':>9} {'us/cell':>8}")
+    for size in args.sizes:
+        start = time.perf_counter()
+        generate_maze(make_config(size, BACKEND=args.backend, BIAS=args.bias))
+        elapsed = time.perf_counter() - start
+
+        cells = size * size
+        print(
+            f"{size:>5}x{size:<5} {cells:>10} {elapsed:>9.2f} "
+            f"{elapsed / cells * 1e6:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
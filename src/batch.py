@@ -0,0 +1,149 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from src.maze.cache import MazeCache, cache_from_config
+from src.maze.pattern import warn_if_pattern_skipped
+from src.config_parser import parse_config
+
+# Maze cache of this process per (CACHE_DIR, CACHE_MB), kept across the
+# mazes of a batch (see worker_cache)
+_caches: dict[tuple[str, int], MazeCache] = {}
+
+
+def seed_output_file(output_file: str, seed: int) -> str:
+    """
+    Output path for one maze of a batch: the seed is appended to
+    the configured file name, e.g. maze.txt -> maze_17.txt.
+    """
+    stem, ext = os.path.splitext(output_file)
+    return f"{stem}_{seed}{ext}"
+
+
+def worker_cache(config: dict[str, Any]) -> MazeCache | None:
+    """
+    The MazeCache of this process for the config's CACHE_DIR, created
+    on first use, or None when CACHE_DIR is not set. Every process of
+    the pool keeps its own, so the directory is scanned once per
+    process and later mazes can hit its memory LRU.
+    """
+    if 'CACHE_DIR' not in config:
+        return None
+    key = (config['CACHE_DIR'], config.get('CACHE_MB', 256))
+    cache = _caches.get(key)
+    if cache is None:
+        cache = cache_from_config(config)
+        if cache is None:
+            return None
+        _caches[key] = cache
+    return cache
+
+
+def generate_one(config: dict[str, Any], seed: int) -> str:
+    """
+    Generates, solves and writes one maze with the given seed.
+    Same steps as a single a_maze_ing.py run, minus the rendering,
+    so the file matches a run with SEED set to `seed`.
+
+    args:
+        config: Parsed configuration.txt stored in a dict.
+        seed: Value used for SEED.
+
+    returns:
+        The path of the written output file.
+    """
+    from src.maze.generator import generate_maze
+    from src.maze.maze_solver import solve_maze
+    from src.maze.print_output import print_output_main, stream_output_main
+
+    config = dict(config)
+    config['SEED'] = seed
+    config['OUTPUT_FILE'] = seed_output_file(config['OUTPUT_FILE'], seed)
+
+    cache = worker_cache(config)
+    if config.get('ALGORITHM') == 'ELLER':
+        stream_output_main(config)
+    elif cache is not None:
+        grid, result = cache.generate_and_solve(config)
+        print_output_main(grid, config, result)
+    else:
+        grid = generate_maze(config)
+        print_output_main(grid, config, solve_maze(grid))
+
+    return str(config['OUTPUT_FILE'])
+
+
+def run_batch(
+        config: dict[str, Any], count: int, seed_start: int, workers: int
+        ) -> list[str]:
+    """
+    Writes `count` mazes for seeds seed_start .. seed_start + count - 1,
+    spread over a pool of `workers` processes. With one worker the
+    mazes are made in this process.
+
+    args:
+        config: Parsed configuration.txt stored in a dict.
+        count: Number of mazes.
+        seed_start: Seed of the first maze.
+        workers: Number of worker processes.
+
+    returns:
+        The written output paths, in seed order.
+    """
+    seeds = range(seed_start, seed_start + count)
+    configs = [config] * count
+
+    if workers == 1:
+        return list(map(generate_one, configs, seeds))
+
+    # Small chunks keep all workers busy, big ones cut the pickling
+    chunksize = max(1, count // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(generate_one, configs, seeds,
+                             chunksize=chunksize))
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Command line entry point of the batch mode. Parses the arguments
+    and config, runs the batch and reports the throughput.
+    """
+    parser = argparse.ArgumentParser(
+        prog="a_maze_ing.py batch",
+        description="Generate one maze per seed from a single config"
+    )
+    parser.add_argument('config')
+    parser.add_argument('--count', type=int, default=1)
+    parser.add_argument('--seed-start', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    if args.count < 1 or args.workers < 1:
+        parser.error("--count and --workers must be positive integers")
+
+    try:
+        config = parse_config(args.config)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    warn_if_pattern_skipped(config)
+
+    start = time.perf_counter()
+    try:
+        paths = run_batch(config, args.count, args.seed_start, args.workers)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{len(paths)} mazes written to {paths[0]} .. {paths[-1]} "
+        f"in {elapsed:.2f}s ({len(paths) / elapsed:.1f} mazes/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,8 @@ def parse_config(filename: str) -> dict[str, Any]:
     Parse maze config file.
     Returns dict with keys:
     WIDTH, HEIGHT, ENTRY, EXIT, OUTPUT_FILE, PERFECT
-    Optional: SEED, BIAS, PATTERN, RENDER
+    Optional: SEED, BIAS, PATTERN, RENDER, IMPRATE, BACKEND, ALGORITHM,
+    TILE_SIZE, WORKERS, CACHE_DIR, CACHE_MB, OUTPUT_FORMAT
     Raises ValueError if invalid format or missing required keys
     """
     config: dict[str, Any] = {}
@@ -116,6 +117,55 @@ def parse_config(filename: str) -> dict[str, Any]:
                 raise ValueError("IMPRATE must be between 0 and 100")
             config['IMPRATE'] = imprate
 
+        if 'BACKEND' in config:
+            backend = str(config['BACKEND']).upper()
+
+            if backend not in ('CELL', 'BITPLANE'):
+                raise ValueError("BACKEND must be either CELL or BITPLANE")
+
+            config['BACKEND'] = backend
+
+        if 'OUTPUT_FORMAT' in config:
+            output_format = str(config['OUTPUT_FORMAT']).upper()
+
+            if output_format not in ('HEX', 'PACKED'):
+                raise ValueError("OUTPUT_FORMAT must be either HEX or PACKED")
+
+            config['OUTPUT_FORMAT'] = output_format
+
+        if 'ALGORITHM' in config:
+            algorithm = str(config['ALGORITHM']).upper()
+
+            if algorithm not in ('ELLER', 'KRUSKAL'):
+                raise ValueError("ALGORITHM must be either ELLER or KRUSKAL")
+
+            if not config['PERFECT']:
+                raise ValueError(f"ALGORITHM={algorithm} needs PERFECT=True")
+
+            config['ALGORITHM'] = algorithm
+
+        if 'TILE_SIZE' in config:
+            tile_size = int(config['TILE_SIZE'])
+            if tile_size < 2:
+                raise ValueError("TILE_SIZE must be at least 2")
+
+            if 'ALGORITHM' in config:
+                raise ValueError("TILE_SIZE cannot be used with ALGORITHM")
+
+            config['TILE_SIZE'] = tile_size
+
+        if 'WORKERS' in config:
+            workers = int(config['WORKERS'])
+            if workers < 1:
+                raise ValueError("WORKERS must be a positive integer")
+            config['WORKERS'] = workers
+
+        if 'CACHE_MB' in config:
+            cache_mb = int(config['CACHE_MB'])
+            if cache_mb < 1:
+                raise ValueError("CACHE_MB must be a positive integer")
+            config['CACHE_MB'] = cache_mb
+
     except (ValueError, IndexError) as e:
         raise ValueError(f"Invalid value in config: {e}")
 
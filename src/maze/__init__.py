@@ -1,3 +1,7 @@
-from .generator import MazeGenerator, Cell, generate_maze
+from .generator import MazeGenerator, Cell, derive_rng, generate_maze
+from .bitgrid import BitGrid, GridView
 
-__all__ = ["MazeGenerator", "Cell", "generate_maze"]
+__all__ = [
+    "MazeGenerator", "Cell", "derive_rng", "generate_maze",
+    "BitGrid", "GridView",
+]
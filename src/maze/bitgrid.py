@@ -0,0 +1,923 @@
+from array import array
+from collections.abc import Iterable, Iterator, MutableMapping, Sequence
+from typing import TextIO, overload
+import random
+
+from .generator import Cell
+from .generator_utils import (
+    ActiveList,
+    close_open_windows,
+    find_open_windows,
+    kruskal_edges,
+    kruskal_tree,
+    row_mask,
+)
+
+
+DIRECTIONS = 'NESW'
+
+# Tile bit for each wall, same encoding as cell_to_tile_index
+WALL_BITS = {'N': 1, 'E': 2, 'S': 4, 'W': 8}
+
+# Plane bytes to b'0'/b'1' flags for generator_utils.row_mask,
+# flagging the cells where the plane is 0 (no wall, no pattern)
+OPEN_FLAGS = bytes.maketrans(b'\x00\x01', b'10')
+
+# Tile index (0-15) to its hex digit in the output file, for
+# bytes.translate
+HEX_DIGITS = bytes.maketrans(bytes(range(16)), b'0123456789abcdef')
+
+# Cells encoded per block of rows written by print_maze_hex
+HEX_BLOCK_CELLS = 1 << 20
+
+
+class BitGrid:
+    """
+    Maze grid stored as flat byte planes instead of Cell objects.
+
+    Cell (x, y) lives at index y * width + x in every plane. Each interior
+    wall is stored exactly once: `east` holds the wall between a cell and
+    its right neighbour, `south` the wall between a cell and the one below
+    it. The outer border is implicit and always closed.
+
+    Attributes:
+        width: Number of cells horizontally.
+        height: Number of cells vertically.
+        east: Wall plane, 1 if the east wall of a cell is closed.
+        south: Wall plane, 1 if the south wall of a cell is closed.
+        visited: 1 if the cell has been visited during generation.
+        pattern: 1 if the cell is part of a reserved pattern (e.g. "42").
+        in_path: 1 if the cell is part of the solution path.
+        parent: Direction (1-4 for N/E/S/W) towards the previous cell on
+                the solution path, 0 if the cell has no parent.
+        start: Index of the entry cell, -1 if not marked.
+        goal: Index of the exit cell, -1 if not marked.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Initialize a width x height grid with all walls closed.
+
+        Args:
+            width: Number of cells horizontally.
+            height: Number of cells vertically.
+        """
+        size = width * height
+        self.width = width
+        self.height = height
+
+        self.east = bytearray(b'\x01') * size
+        self.south = bytearray(b'\x01') * size
+
+        self.visited = bytearray(size)
+        self.pattern = bytearray(size)
+        self.in_path = bytearray(size)
+        self.parent = bytearray(size)
+
+        self.start = -1
+        self.goal = -1
+
+    def step(self, direction: str) -> int:
+        """
+        Return the index offset of one step in the given direction.
+        """
+        return {
+            'N': -self.width, 'E': 1, 'S': self.width, 'W': -1
+        }[direction]
+
+    def has_wall(self, i: int, direction: str) -> bool:
+        """
+        Check whether cell i has a closed wall on the given side.
+        Walls on the outer border are always closed.
+        """
+        w = self.width
+        if direction == 'N':
+            return i < w or bool(self.south[i - w])
+        if direction == 'S':
+            return i >= w * (self.height - 1) or bool(self.south[i])
+        if direction == 'W':
+            return i % w == 0 or bool(self.east[i - 1])
+        if direction == 'E':
+            return i % w == w - 1 or bool(self.east[i])
+        raise ValueError(f"Unknown direction: {direction}")
+
+    def set_wall(self, i: int, direction: str, closed: bool) -> None:
+        """
+        Open or close the wall on one side of cell i. Since every wall
+        is stored once, the neighbour sees the change as well.
+
+        Raises:
+            ValueError: If trying to open a wall on the outer border.
+        """
+        w = self.width
+        if direction == 'N' and i >= w:
+            self.south[i - w] = closed
+        elif direction == 'S' and i < w * (self.height - 1):
+            self.south[i] = closed
+        elif direction == 'W' and i % w != 0:
+            self.east[i - 1] = closed
+        elif direction == 'E' and i % w != w - 1:
+            self.east[i] = closed
+        elif not closed:
+            raise ValueError("Cannot open a wall on the maze border")
+
+    def direction_between(self, a: int, b: int) -> str:
+        """
+        Return the direction from cell a to the adjacent cell b.
+
+        Raises:
+            ValueError: If a and b are not adjacent.
+        """
+        ay, ax = divmod(a, self.width)
+        by, bx = divmod(b, self.width)
+        dx = bx - ax
+        dy = by - ay
+
+        if dx == 1 and dy == 0:
+            return 'E'
+        if dx == -1 and dy == 0:
+            return 'W'
+        if dx == 0 and dy == 1:
+            return 'S'
+        if dx == 0 and dy == -1:
+            return 'N'
+        raise ValueError("Cells are not adjacent")
+
+    def remove_wall_between(self, a: int, b: int) -> None:
+        """
+        Remove the shared wall between two adjacent cells.
+        """
+        self.set_wall(a, self.direction_between(a, b), False)
+
+    def wall_exists_between(self, a: int, b: int) -> bool:
+        """
+        Return True if adjacent cells a and b are separated by a wall.
+        """
+        return self.has_wall(a, self.direction_between(a, b))
+
+    def all_neighbors(self, i: int) -> list[int]:
+        """
+        Neighbours of cell i in 4 directions (up, down, left, right),
+        except cells that are part of a pattern.
+        """
+        w = self.width
+        pattern = self.pattern
+        neighbors = []
+
+        if i >= w and not pattern[i - w]:
+            neighbors.append(i - w)
+        if i < w * (self.height - 1) and not pattern[i + w]:
+            neighbors.append(i + w)
+        if i % w != 0 and not pattern[i - 1]:
+            neighbors.append(i - 1)
+        if i % w != w - 1 and not pattern[i + 1]:
+            neighbors.append(i + 1)
+
+        return neighbors
+
+    def unvisited_neighbors(self, i: int) -> list[int]:
+        """
+        Neighbours of cell i that are neither visited nor pattern cells.
+        """
+        visited = self.visited
+        return [n for n in self.all_neighbors(i) if not visited[n]]
+
+    def open_neighbors(self, i: int) -> list[int]:
+        """
+        Neighbours of cell i reachable without crossing a wall,
+        in the same order as maze_solver.get_neighbors (N, S, W, E).
+        """
+        w = self.width
+        neighbors = []
+
+        if i >= w and not self.south[i - w]:
+            neighbors.append(i - w)
+        if i < w * (self.height - 1) and not self.south[i]:
+            neighbors.append(i + w)
+        if i % w != 0 and not self.east[i - 1]:
+            neighbors.append(i - 1)
+        if i % w != w - 1 and not self.east[i]:
+            neighbors.append(i + 1)
+
+        return neighbors
+
+    def tile_index(self, i: int) -> int:
+        """
+        Convert the walls of cell i to a tile index (0-15),
+        same encoding as render_utils.cell_to_tile_index.
+        """
+        value = 0
+        for direction in DIRECTIONS:
+            if self.has_wall(i, direction):
+                value |= WALL_BITS[direction]
+        return value
+
+    def mark_start_and_exit(
+            self, start: tuple[int, int], goal: tuple[int, int]
+            ) -> None:
+        """
+        Mark the entry and exit cells from their (x, y) coordinates.
+        """
+        self.start = start[1] * self.width + start[0]
+        self.goal = goal[1] * self.width + goal[0]
+
+    def mark_pattern(self, pattern: list[list[int]]) -> None:
+        """
+        Center a pattern on the grid, same rules as pattern.mark_pattern:
+        cells marked 1 become closed pattern cells, cells marked 2
+        are only marked visited.
+
+        Raises:
+            ValueError: If the pattern overlaps with the entry or exit cell.
+        """
+        from .pattern import place_pattern
+
+        w = self.width
+        start = (
+            (self.start % w, self.start // w) if self.start >= 0 else None
+        )
+        goal = (self.goal % w, self.goal // w) if self.goal >= 0 else None
+
+        for x, y, value in place_pattern(
+                w, self.height, pattern, start, goal):
+            i = y * w + x
+            self.visited[i] = 1
+
+            if value == 1:
+                for direction in DIRECTIONS:
+                    self.set_wall(i, direction, True)
+                self.pattern[i] = 1
+
+    def to_cells(self) -> list[list[Cell]]:
+        """
+        Build a regular grid of Cell objects with the same walls and flags.
+        """
+        w = self.width
+        grid = []
+
+        for y in range(self.height):
+            row = []
+            for x in range(w):
+                i = y * w + x
+                cell = Cell(x, y)
+                for direction in DIRECTIONS:
+                    cell.walls[direction] = self.has_wall(i, direction)
+                cell.visited = bool(self.visited[i])
+                cell.pattern = bool(self.pattern[i])
+                cell.in_path = bool(self.in_path[i])
+                cell.is_start = i == self.start
+                cell.is_goal = i == self.goal
+                row.append(cell)
+            grid.append(row)
+
+        for i, code in enumerate(self.parent):
+            if code:
+                y, x = divmod(self.parent_of(i), w)
+                grid[i // w][i % w].parent = grid[y][x]
+
+        return grid
+
+    def parent_of(self, i: int) -> int:
+        """
+        Return the index of the parent of cell i, or -1 if it has none.
+        """
+        code = self.parent[i]
+        if not code:
+            return -1
+        return i + self.step(DIRECTIONS[code - 1])
+
+    def path_directions(self) -> str:
+        """
+        Directions from entry to exit along the solution path,
+        in the format written by print_output.print_path.
+        """
+        directions: list[str] = []
+        current = self.goal
+        parent = self.parent_of(current) if current >= 0 else -1
+
+        while parent >= 0:
+            directions.append(self.direction_between(parent, current))
+            current = parent
+            parent = self.parent_of(current)
+
+        directions.reverse()
+        return ''.join(directions)
+
+
+##########################################
+# Generation
+##########################################
+
+def _random_start(bits: BitGrid, rng: random.Random) -> int:
+    """
+    Pick a random non-pattern cell, drawing from rng the same way
+    as the Cell based generators do.
+    """
+    while True:
+        y = rng.randrange(bits.height)
+        x = rng.randrange(bits.width)
+        i = y * bits.width + x
+        if not bits.pattern[i]:
+            return i
+
+
+def growing_sigma_tree(
+        bits: BitGrid, bias: float, seed: int | None,
+        rng: random.Random | None = None, start: int | None = None
+        ) -> None:
+    """
+    Growing Tree generation on a BitGrid.
+
+    Same algorithm and random call order as generator.growing_sigma_tree,
+    so a given seed carves the same maze on both backends.
+
+    Args:
+        bits: The BitGrid to carve.
+        bias: Probability (0.0 to 1.0) of selecting the most recent
+              active cell.
+        seed: Optional random seed for reproducibility.
+        rng: Random source to draw from instead of one seeded with seed.
+        start: Cell to grow the tree from, a random one if omitted.
+    """
+    if rng is None:
+        rng = random.Random(seed)
+
+    visited = bits.visited
+    if start is None:
+        start = _random_start(bits, rng)
+    visited[start] = 1
+    active = ActiveList(start, rng)
+
+    while active:
+        slot = active.newest() if rng.random() < bias else active.choice()
+        cell = active[slot]
+        neighbors = bits.unvisited_neighbors(cell)
+
+        if neighbors:
+            next_cell = rng.choice(neighbors)
+            bits.remove_wall_between(cell, next_cell)
+            visited[next_cell] = 1
+            active.append(next_cell)
+        else:
+            active.remove(slot)
+
+
+def kruskal(
+        bits: BitGrid, seed: int | None, rng: random.Random | None = None
+        ) -> None:
+    """
+    Randomized Kruskal on a BitGrid.
+
+    Same walls in the same order as generator.kruskal, so a given
+    seed carves the same maze on both backends. Opening a wall is a
+    single byte write in the east or south plane.
+
+    Args:
+        bits: The BitGrid to carve.
+        seed: Optional random seed for reproducibility.
+        rng: Random source to draw from instead of one seeded with seed.
+    """
+    if rng is None:
+        rng = random.Random(seed)
+
+    w = bits.width
+    size = len(bits.visited)
+    east = bits.east
+    south = bits.south
+    edges = kruskal_edges(w, bits.height, bits.visited)
+
+    for edge in kruskal_tree(edges, w, size, rng):
+        if edge & 1:
+            south[edge >> 1] = 0
+        else:
+            east[edge >> 1] = 0
+
+    bits.visited[:] = b'\x01' * size
+
+
+class IndexSet:
+    """
+    RandomSet for cell indices of one grid, with the positions in an
+    array instead of a dict to keep memory at a few bytes per cell.
+    """
+
+    def __init__(
+            self, size: int, items: Iterable[int], rng: random.Random
+            ) -> None:
+        self.items = array('l', items)
+        self.positions = array('l', [-1]) * size
+        for pos, item in enumerate(self.items):
+            self.positions[item] = pos
+        self.rng = rng
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: int) -> bool:
+        return self.positions[item] >= 0
+
+    def add(self, item: int) -> None:
+        if self.positions[item] < 0:
+            self.positions[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item: int) -> None:
+        pos = self.positions[item]
+        if pos < 0:
+            return
+
+        self.positions[item] = -1
+        last = self.items.pop()
+        if pos < len(self.items):
+            self.items[pos] = last
+            self.positions[last] = pos
+
+    def choice(self) -> int:
+        return self.rng.choice(self.items)
+
+
+def wilson_sometimes_hunts(
+        bits: BitGrid, bias: float, seed: int | None, imprate: int,
+        rng: random.Random | None = None, start: int | None = None
+        ) -> None:
+    """
+    Hybrid Wilson's / Hunt-and-Kill generation on a BitGrid.
+
+    Same algorithm and random call order as
+    generator.wilson_sometimes_hunts.
+
+    Args:
+        bits: The BitGrid to carve.
+        bias: Probability (0.0 to 1.0) of using Wilson's
+              algorithm per iteration.
+        seed: Optional random seed for reproducibility.
+        imprate: Percentage chance (0-100) of removing an extra wall
+                 per step.
+        rng: Random source to draw from instead of one seeded with seed.
+        start: First cell of the maze, a random one if omitted.
+    """
+    if rng is None:
+        rng = random.Random(seed)
+
+    visited = bits.visited
+    pattern = bits.pattern
+    size = len(visited)
+    if start is None:
+        start = _random_start(bits, rng)
+    visited[start] = 1
+
+    unvisited = IndexSet(size, (
+        i for i in range(size)
+        if not visited[i] and not pattern[i]
+    ), rng)
+    frontier = IndexSet(size, (
+        i for i in unvisited.items
+        if any(visited[n] for n in bits.all_neighbors(i))
+    ), rng)
+
+    last_exit = bytearray(size)
+
+    while unvisited:
+        if rng.random() < bias:
+            _wilson_step(bits, unvisited, frontier, last_exit, imprate, rng)
+        else:
+            _hunt_step(bits, unvisited, frontier, imprate, rng)
+
+
+def _mark_visited(
+        bits: BitGrid, cell: int, unvisited: IndexSet, frontier: IndexSet
+        ) -> None:
+    """
+    Mark a cell visited and update the sets, see generator._mark_visited.
+    """
+    visited = bits.visited
+    visited[cell] = 1
+    unvisited.discard(cell)
+    frontier.discard(cell)
+
+    for neighbor in bits.all_neighbors(cell):
+        if not visited[neighbor]:
+            frontier.add(neighbor)
+
+
+def _wilson_step(
+        bits: BitGrid, unvisited: IndexSet, frontier: IndexSet,
+        last_exit: bytearray, imprate: int, rng: random.Random
+        ) -> None:
+    """
+    One loop-erased random walk, see generator._wilson_step.
+
+    The last exits are kept as direction codes (1-4 for N/E/S/W) in
+    `last_exit`, one byte per cell shared by all walks of a run.
+    Entries left over from earlier walks are never followed: every
+    unvisited cell on the traced path was exited during this walk.
+    """
+    visited = bits.visited
+    start = cell = unvisited.choice()
+
+    while not visited[cell]:
+        neighbors = bits.all_neighbors(cell)
+        if not neighbors:
+            break
+
+        next_cell = rng.choice(neighbors)
+        last_exit[cell] = DIRECTIONS.index(
+            bits.direction_between(cell, next_cell)) + 1
+        cell = next_cell
+
+    cell = start
+    path = [cell]
+    while not visited[cell] and last_exit[cell]:
+        cell += bits.step(DIRECTIONS[last_exit[cell] - 1])
+        path.append(cell)
+
+    for i in range(len(path) - 1):
+        current = path[i]
+        next_cell = path[i + 1]
+
+        bits.remove_wall_between(current, next_cell)
+        for carved in (current, next_cell):
+            if not visited[carved]:
+                _mark_visited(bits, carved, unvisited, frontier)
+
+        _maybe_add_imperfection(bits, current, next_cell, imprate, rng)
+
+
+def _hunt_step(
+        bits: BitGrid, unvisited: IndexSet, frontier: IndexSet,
+        imprate: int, rng: random.Random
+        ) -> None:
+    """
+    One Hunt-and-Kill step, see generator._hunt_step.
+    """
+    visited = bits.visited
+
+    if not frontier:
+        _mark_visited(bits, unvisited.choice(), unvisited, frontier)
+        return
+
+    cell = frontier.choice()
+    visited_neighbors = [
+        n for n in bits.all_neighbors(cell) if visited[n]
+        ]
+
+    next_cell = rng.choice(visited_neighbors)
+    bits.remove_wall_between(cell, next_cell)
+    _mark_visited(bits, cell, unvisited, frontier)
+
+    _maybe_add_imperfection(bits, cell, next_cell, imprate, rng)
+
+
+def _maybe_add_imperfection(
+        bits: BitGrid, cell: int, exclude: int, imprate: int,
+        rng: random.Random
+        ) -> None:
+    """
+    Randomly remove an extra wall, see generator._maybe_add_imperfection.
+    """
+    if rng.randint(1, 100) > imprate:
+        return
+
+    extra_neighbors = [
+        n for n in bits.all_neighbors(cell)
+        if bits.visited[n] and n != exclude
+    ]
+
+    if extra_neighbors:
+        extra = rng.choice(extra_neighbors)
+        if bits.wall_exists_between(cell, extra):
+            bits.remove_wall_between(cell, extra)
+
+
+def fix_large_holes(bits: BitGrid, rng: random.Random) -> int:
+    """
+    Close one random internal wall in every fully open 3x3 region,
+    see generator_utils.fix_large_holes.
+
+    The row masks are built straight from the planes with bytes.translate,
+    so finding the open regions never loops over single cells.
+
+    Args:
+        bits: The BitGrid to repair.
+        rng: Random source picking the walls to close.
+
+    Returns:
+        Number of holes fixed.
+    """
+    w = bits.width
+    east = bits.east
+    south = bits.south
+    free_rows = [
+        row_mask(bits.pattern[y * w:(y + 1) * w].translate(OPEN_FLAGS))
+        for y in range(bits.height)
+    ]
+
+    east_open = []
+    south_open = []
+    for y in range(bits.height):
+        row = slice(y * w, (y + 1) * w)
+        free = free_rows[y]
+        free_below = free_rows[y + 1] if y < bits.height - 1 else 0
+
+        east_open.append(
+            row_mask(east[row].translate(OPEN_FLAGS)) & free & (free >> 1)
+        )
+        south_open.append(
+            row_mask(south[row].translate(OPEN_FLAGS)) & free & free_below
+        )
+
+    def close_wall(x: int, y: int, direction: str) -> None:
+        plane = east if direction == 'E' else south
+        plane[y * w + x] = 1
+
+    windows = find_open_windows(east_open, south_open, w)
+    return close_open_windows(windows, close_wall, rng)
+
+
+##########################################
+# Output
+##########################################
+
+def tile_indices(
+        east: bytes | bytearray, south: bytes | bytearray,
+        above: bytes | bytearray, width: int
+        ) -> bytes:
+    """
+    Tile indices of consecutive rows, one byte per cell, in the
+    encoding of BitGrid.tile_index.
+
+    Every plane byte is 0 or 1, so shifting a whole plane as one int
+    by 1 to 3 bits moves each wall into its own bit of its cell's byte,
+    and the four sides combine with a single or.
+
+    Args:
+        east: East walls of the rows, 1 = closed, used as they are.
+        south: South walls of the rows, used as they are.
+        above: South walls of the row above the first, all 1 for the
+               top row.
+        width: Cells per row. The west side of the first cell of
+               every row is closed.
+    """
+    size = len(east)
+    north = bytes(above) + bytes(south[:size - width])
+    west = bytearray(b'\x01') + east[:-1]
+    west[::width] = b'\x01' * (size // width)
+    packed = (
+        int.from_bytes(north, 'little')
+        | int.from_bytes(east, 'little') << 1
+        | int.from_bytes(south, 'little') << 2
+        | int.from_bytes(west, 'little') << 3
+    )
+    return packed.to_bytes(size, 'little')
+
+
+def hex_lines(tiles: bytes, width: int) -> str:
+    """
+    Tile indices from tile_indices as lines of hex digits, one line
+    (with its newline) per row.
+    """
+    text = tiles.translate(HEX_DIGITS).decode('ascii')
+    return ''.join(
+        text[i:i + width] + "\n" for i in range(0, len(text), width)
+    )
+
+
+def tile_blocks(bits: BitGrid) -> Iterator[bytes]:
+    """
+    Tile indices of the grid from top to bottom, one byte per cell, in
+    blocks of whole rows of about HEX_BLOCK_CELLS cells.
+    """
+    w = bits.width
+    h = bits.height
+    border = b'\x01' * w
+    rows = max(1, HEX_BLOCK_CELLS // w)
+
+    for y in range(0, h, rows):
+        end = min(y + rows, h)
+        east = bits.east[y * w:end * w]
+        south = bits.south[y * w:end * w]
+        above = bits.south[(y - 1) * w:y * w] if y else border
+        # Walls on the outer border are closed whatever the planes hold
+        east[w - 1::w] = b'\x01' * (end - y)
+        if end == h:
+            south[-w:] = border
+        yield tile_indices(east, south, above, w)
+
+
+def print_maze_hex(bits: BitGrid, f: TextIO) -> None:
+    """
+    Outputs the tile index of every cell as one hex digit,
+    one line per row.
+
+    The rows are encoded in blocks (see tile_blocks) and written with
+    one write per block.
+
+    Args:
+        bits: The BitGrid to write.
+        f: File descriptor for text output
+    """
+    for tiles in tile_blocks(bits):
+        f.write(hex_lines(tiles, bits.width))
+
+
+##########################################
+# Cell views
+##########################################
+
+class WallView(MutableMapping[str, bool]):
+    """
+    The walls dict of a CellView, reading and writing the BitGrid planes.
+    """
+
+    def __init__(self, bits: BitGrid, i: int) -> None:
+        self._bits = bits
+        self._i = i
+
+    def __getitem__(self, direction: str) -> bool:
+        if direction not in WALL_BITS:
+            raise KeyError(direction)
+        return self._bits.has_wall(self._i, direction)
+
+    def __setitem__(self, direction: str, closed: bool) -> None:
+        if direction not in WALL_BITS:
+            raise KeyError(direction)
+        self._bits.set_wall(self._i, direction, closed)
+
+    def __delitem__(self, direction: str) -> None:
+        raise TypeError("Walls cannot be deleted")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(DIRECTIONS)
+
+    def __len__(self) -> int:
+        return len(DIRECTIONS)
+
+
+class CellView(Cell):
+    """
+    Lightweight Cell facade over one cell of a BitGrid.
+
+    Views are created on access and hold no state of their own, so two
+    views of the same cell compare equal. maze_solver.solve_maze solves
+    BitGrid backed grids directly.
+    """
+
+    def __init__(self, bits: BitGrid, i: int) -> None:
+        self._bits = bits
+        self._i = i
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, CellView)
+            and other._bits is self._bits and other._i == self._i
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self._bits), self._i))
+
+    def __repr__(self) -> str:
+        return f"CellView({self.x}, {self.y})"
+
+    @property
+    def x(self) -> int:
+        return self._i % self._bits.width
+
+    @x.setter
+    def x(self, value: int) -> None:
+        raise AttributeError("CellView coordinates are read-only")
+
+    @property
+    def y(self) -> int:
+        return self._i // self._bits.width
+
+    @y.setter
+    def y(self, value: int) -> None:
+        raise AttributeError("CellView coordinates are read-only")
+
+    @property  # type: ignore[override]
+    def walls(self) -> MutableMapping[str, bool]:
+        return WallView(self._bits, self._i)
+
+    @walls.setter
+    def walls(self, walls: MutableMapping[str, bool]) -> None:
+        for direction in DIRECTIONS:
+            self._bits.set_wall(self._i, direction, walls[direction])
+
+    @property
+    def visited(self) -> bool:
+        return bool(self._bits.visited[self._i])
+
+    @visited.setter
+    def visited(self, value: bool) -> None:
+        self._bits.visited[self._i] = value
+
+    @property
+    def pattern(self) -> bool:
+        return bool(self._bits.pattern[self._i])
+
+    @pattern.setter
+    def pattern(self, value: bool) -> None:
+        self._bits.pattern[self._i] = value
+
+    @property
+    def in_path(self) -> bool:
+        return bool(self._bits.in_path[self._i])
+
+    @in_path.setter
+    def in_path(self, value: bool) -> None:
+        self._bits.in_path[self._i] = value
+
+    @property
+    def parent(self) -> Cell | None:
+        parent = self._bits.parent_of(self._i)
+        return CellView(self._bits, parent) if parent >= 0 else None
+
+    @parent.setter
+    def parent(self, cell: Cell | None) -> None:
+        if cell is None:
+            self._bits.parent[self._i] = 0
+            return
+        parent = cell.y * self._bits.width + cell.x
+        direction = self._bits.direction_between(self._i, parent)
+        self._bits.parent[self._i] = DIRECTIONS.index(direction) + 1
+
+    @property
+    def is_start(self) -> bool:
+        return self._i == self._bits.start
+
+    @is_start.setter
+    def is_start(self, value: bool) -> None:
+        if value:
+            self._bits.start = self._i
+        elif self.is_start:
+            self._bits.start = -1
+
+    @property
+    def is_goal(self) -> bool:
+        return self._i == self._bits.goal
+
+    @is_goal.setter
+    def is_goal(self, value: bool) -> None:
+        if value:
+            self._bits.goal = self._i
+        elif self.is_goal:
+            self._bits.goal = -1
+
+
+class RowView(Sequence[Cell]):
+    """
+    One row of a GridView, creating CellViews on access.
+    """
+
+    def __init__(self, bits: BitGrid, y: int) -> None:
+        self._bits = bits
+        self._y = y
+
+    def __len__(self) -> int:
+        return self._bits.width
+
+    @overload
+    def __getitem__(self, x: int) -> Cell: ...
+
+    @overload
+    def __getitem__(self, x: slice) -> Sequence[Cell]: ...
+
+    def __getitem__(self, x: int | slice) -> Cell | Sequence[Cell]:
+        if isinstance(x, slice):
+            return [self[i] for i in range(*x.indices(len(self)))]
+        if x < 0:
+            x += self._bits.width
+        if not 0 <= x < self._bits.width:
+            raise IndexError("row index out of range")
+        return CellView(self._bits, self._y * self._bits.width + x)
+
+
+class GridView(Sequence[RowView]):
+    """
+    Read/write grid[y][x] access to a BitGrid through CellViews,
+    so code written for list[list[Cell]] works unchanged.
+
+    Attributes:
+        bits: The underlying BitGrid.
+    """
+
+    def __init__(self, bits: BitGrid) -> None:
+        self.bits = bits
+
+    def __len__(self) -> int:
+        return self.bits.height
+
+    @overload
+    def __getitem__(self, y: int) -> RowView: ...
+
+    @overload
+    def __getitem__(self, y: slice) -> Sequence[RowView]: ...
+
+    def __getitem__(self, y: int | slice) -> RowView | Sequence[RowView]:
+        if isinstance(y, slice):
+            return [self[i] for i in range(*y.indices(len(self)))]
+        if y < 0:
+            y += self.bits.height
+        if not 0 <= y < self.bits.height:
+            raise IndexError("grid index out of range")
+        return RowView(self.bits, y)
@@ -0,0 +1,315 @@
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
+import hashlib
+import json
+import os
+import struct
+import zlib
+
+from . import bitgrid
+from .bitgrid import BitGrid, DIRECTIONS
+from .generator import Cell, MazeGenerator
+from .maze_solver import SolveResult, solve_maze
+
+
+# Bump when the serialized layout, the generators or the path picked
+# by solve_maze change, so old cache entries are never read back
+CACHE_VERSION = 3
+
+# magic, width, height, entry index, exit index
+HEADER = struct.Struct('<4sIIqq')
+MAGIC = b'MZC1'
+
+# Order of the planes in the low bits of a packed cell, with the
+# bytes.translate table that takes each one back out
+PACKED_PLANES = ('east', 'south', 'pattern', 'visited')
+UNPACK = [
+    bytes((b >> shift) & 1 for b in range(256))
+    for shift in range(len(PACKED_PLANES))
+]
+
+# Keys that decide the maze and its path, with the defaults
+# MazeGenerator uses when they are missing
+MAZE_KEYS = {
+    'WIDTH': None,
+    'HEIGHT': None,
+    'ENTRY': None,
+    'EXIT': None,
+    'PERFECT': None,
+    'SEED': None,
+    'BIAS': 0.5,
+    'IMPRATE': 65,
+    'PATTERN': '42',
+    'ALGORITHM': None,
+    'TILE_SIZE': 0,
+}
+
+
+def config_key(config: dict[str, Any]) -> str | None:
+    """
+    Content address of the maze a parsed config describes.
+
+    Only the keys that change the maze are hashed, with defaults filled
+    in, so e.g. OUTPUT_FILE, RENDER, BACKEND or WORKERS never split the
+    cache. Keys that have no effect for the config are dropped too:
+    IMPRATE for perfect mazes, BIAS for Kruskal.
+
+    Returns:
+        A hex digest, or None for unseeded configs, which make a new
+        maze every run and cannot be cached.
+    """
+    if config.get('SEED') is None:
+        return None
+
+    normalized = {
+        key: config.get(key, default) for key, default in MAZE_KEYS.items()
+    }
+    if normalized['PERFECT']:
+        del normalized['IMPRATE']
+    if normalized['ALGORITHM'] == 'KRUSKAL':
+        del normalized['BIAS']
+    normalized['VERSION'] = CACHE_VERSION
+
+    text = json.dumps(normalized, sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def dump_maze(bits: BitGrid, directions: str) -> bytes:
+    """
+    Serialize a generated BitGrid and its solution.
+
+    The east, south, pattern and visited planes are packed into the
+    low 4 bits of one byte per cell (each plane is 0/1 per byte, so
+    shifting the whole plane as one int moves every cell into its own
+    bit) and compressed. The solution is kept as its direction string.
+    """
+    size = bits.width * bits.height
+    packed = 0
+    for shift, name in enumerate(PACKED_PLANES):
+        packed |= int.from_bytes(getattr(bits, name), 'little') << shift
+
+    body = packed.to_bytes(size, 'little') + directions.encode()
+    header = HEADER.pack(MAGIC, bits.width, bits.height, bits.start, bits.goal)
+    return header + zlib.compress(body)
+
+
+def load_maze(data: bytes) -> BitGrid:
+    """
+    Rebuild a BitGrid written by dump_maze, with its solution marked
+    in the in_path and parent planes as CellView reads them.
+
+    Raises:
+        ValueError: If data is not a serialized maze.
+    """
+    magic, width, height, start, goal = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a cached maze")
+
+    size = width * height
+    body = zlib.decompress(data[HEADER.size:])
+    packed = body[:size]
+
+    bits = BitGrid(width, height)
+    bits.start = start
+    bits.goal = goal
+    for name, table in zip(PACKED_PLANES, UNPACK):
+        getattr(bits, name)[:] = packed.translate(table)
+
+    path = body[size:].decode()
+    current = start
+    if path:
+        bits.in_path[current] = 1
+    for direction in path:
+        cell = current + bits.step(direction)
+        back = bits.direction_between(cell, current)
+        bits.parent[cell] = DIRECTIONS.index(back) + 1
+        bits.in_path[cell] = 1
+        current = cell
+
+    return bits
+
+
+def cache_from_config(config: dict[str, Any]) -> "MazeCache | None":
+    """
+    MazeCache on disk for the CACHE_DIR and CACHE_MB keys of a parsed
+    config, or None when CACHE_DIR is not set.
+    """
+    if 'CACHE_DIR' not in config:
+        return None
+    return MazeCache(
+        directory=config['CACHE_DIR'],
+        max_bytes=config.get('CACHE_MB', 256) * 1024 * 1024,
+    )
+
+
+class MazeCache:
+    """
+    Cache of generated and solved mazes, keyed by config_key.
+
+    Recent mazes are kept in memory, serialized with dump_maze, in an
+    LRU of at most `capacity` entries. With a `directory`, every entry
+    is also written there as <key>.maze, and the least recently used
+    files are deleted once they take up more than `max_bytes`. The
+    size of the directory is counted once when the cache is created
+    and kept up to date on every write, so the directory is only
+    scanned again when it has to be trimmed (which also picks up the
+    files other processes added).
+
+    Every lookup returns a freshly built grid, so callers may modify
+    it. The counters in `stats` track hits and misses per level,
+    evictions, and unseeded configs that bypassed the cache.
+    """
+
+    def __init__(
+            self, capacity: int = 64, directory: str | None = None,
+            max_bytes: int = 256 * 1024 * 1024
+            ) -> None:
+        self.capacity = capacity
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[str, bytes] = OrderedDict()
+        self.stats = {
+            'hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'disk_evictions': 0,
+            'bypassed': 0,
+        }
+
+        self.disk_bytes = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self.disk_bytes = sum(
+                size for _, size, _ in self._disk_files(directory)
+            )
+
+    def generate_and_solve(
+            self, config: dict[str, Any]
+            ) -> tuple[Sequence[Sequence[Cell]], SolveResult]:
+        """
+        Same result as generate_maze followed by solve_maze, taken from
+        the cache when this config was seen before.
+
+        args:
+            config: Parsed configuration.txt stored in a dict.
+
+        returns:
+            The solved grid for the configured BACKEND, and its path.
+            The expanded count of a path read back from the cache is 0.
+        """
+        key = config_key(config)
+        if key is None:
+            self.stats['bypassed'] += 1
+            grid = MazeGenerator(config).generate()
+            return grid, solve_maze(grid)
+
+        data = self.entries.get(key)
+        if data is not None:
+            self.stats['hits'] += 1
+            self.entries.move_to_end(key)
+        else:
+            data = self._read_disk(key)
+            if data is not None:
+                self.stats['disk_hits'] += 1
+            else:
+                self.stats['misses'] += 1
+                data = self._generate(config)
+                self._write_disk(key, data)
+            self._remember(key, data)
+
+        bits = load_maze(data)
+        if config.get('BACKEND', 'CELL') == 'BITPLANE':
+            grid = bitgrid.GridView(bits)
+        else:
+            grid = bits.to_cells()
+
+        if not bits.in_path[bits.goal]:
+            return grid, SolveResult([], '', 0)
+        start_y, start_x = divmod(bits.start, bits.width)
+        return grid, SolveResult.from_directions(
+            grid, grid[start_y][start_x], bits.path_directions()
+        )
+
+    def _generate(self, config: dict[str, Any]) -> bytes:
+        """
+        Generate and solve on a BitGrid, which carves the same maze and
+        finds the same path as the Cell backend for the same config.
+        """
+        grid = MazeGenerator(dict(config, BACKEND='BITPLANE')).generate()
+        if not isinstance(grid, bitgrid.GridView):
+            raise TypeError("BITPLANE backend did not return a GridView")
+        return dump_maze(grid.bits, solve_maze(grid).directions)
+
+    def _remember(self, key: str, data: bytes) -> None:
+        self.entries[key] = data
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def _read_disk(self, key: str) -> bytes | None:
+        if self.directory is None:
+            return None
+
+        path = os.path.join(self.directory, f"{key}.maze")
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        # The modification time doubles as last use for eviction
+        os.utime(path)
+        return data
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        if self.directory is None:
+            return
+
+        path = os.path.join(self.directory, f"{key}.maze")
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        try:
+            self.disk_bytes -= os.path.getsize(path)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+        self.disk_bytes += len(data)
+
+        if self.disk_bytes > self.max_bytes:
+            self._trim_disk(self.directory)
+
+    @staticmethod
+    def _disk_files(directory: str) -> list[tuple[float, int, str]]:
+        """
+        (modification time, size, path) of every cached file.
+        """
+        files = []
+        for entry in os.scandir(directory):
+            if entry.name.endswith('.maze'):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def _trim_disk(self, directory: str) -> None:
+        """
+        Delete the least recently used files until the directory fits
+        in max_bytes, and recount disk_bytes.
+        """
+        files = sorted(self._disk_files(directory))
+        total = sum(size for _, size, _ in files)
+
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            total -= size
+            self.stats['disk_evictions'] += 1
+
+        self.disk_bytes = total
@@ -0,0 +1,192 @@
+from array import array
+import mmap
+import tempfile
+
+from .packed import PACKED_HEADER, pack_directions
+from .region import MazeFile
+
+
+# Blocks of decoded rows the solver keeps in memory (see MazeFile)
+SOLVER_BLOCKS = 8
+
+# Open side bit of a tile, the step to the neighbour on that side
+# (in rows and columns) and the direction letter of that step
+SIDES = ((1, -1, 0, 'N'), (2, 0, 1, 'E'), (4, 1, 0, 'S'), (8, 0, -1, 'W'))
+OPPOSITE = {'N': 'S', 'E': 'W', 'S': 'N', 'W': 'E'}
+
+
+class _Labels:
+    """
+    2 bits per cell in a memory-mapped scratch file: 0 for cells not
+    reached yet, else 1 + the BFS distance mod 3.
+
+    Neighbouring cells are at most one step apart in distance, so the
+    label alone tells a cell's predecessor among its open neighbours
+    and no parent needs storing.
+    """
+
+    def __init__(self, cells: int, directory: str | None) -> None:
+        self._file = tempfile.TemporaryFile(dir=directory)
+        self._file.truncate((cells + 3) // 4)
+        self._map = mmap.mmap(self._file.fileno(), (cells + 3) // 4)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def get(self, i: int) -> int:
+        return self._map[i >> 2] >> ((i & 3) << 1) & 3
+
+    def set(self, i: int, label: int) -> None:
+        self._map[i >> 2] |= label << ((i & 3) << 1)
+
+
+def _check_border(maze: MazeFile, i: int, tile: int) -> None:
+    """
+    Raises:
+        ValueError: If cell i is open on a side facing the border, as
+                    the loader reports it.
+    """
+    y, x = divmod(i, maze.width)
+    if (not tile & 1 and y == 0 or not tile & 2 and x == maze.width - 1
+            or not tile & 4 and y == maze.height - 1
+            or not tile & 8 and x == 0):
+        raise ValueError(f"Cell ({x},{y}) is open on the maze border")
+
+
+def solve_maze_file(path: str, scratch_dir: str | None = None) -> str:
+    """
+    Shortest path from the entry to the exit of a maze file (hex or
+    packed), for mazes too large to load: see solve_maze for mazes
+    that fit in memory.
+
+    A breadth-first search reads the walls through a MazeFile, which
+    only keeps SOLVER_BLOCKS blocks of decoded rows in memory, and
+    marks reached cells in a scratch file of 2 bits per cell (see
+    _Labels). Only the frontier, the cells of the current BFS level,
+    and the cells found for the next one are kept in memory, as arrays
+    of 8 bytes per cell: memory use grows with the widest level, not
+    with the maze (a perfect maze has narrow levels, an open one may
+    not). Every frontier is sorted and expanded in row order, block by
+    block, so the maze and the scratch file are read front to back once
+    per level. The path is then traced back from the exit through the
+    labels.
+
+    args:
+        path: The maze file.
+        scratch_dir: Directory of the scratch file (default: the
+                     system temporary directory).
+
+    returns:
+        The path as a direction string, as written by print_path, or
+        an empty string if the exit cannot be reached.
+
+    raises:
+        ValueError: If the file is not a maze, or a cell reached is open
+                    on the maze border.
+    """
+    with MazeFile(path, SOLVER_BLOCKS) as maze:
+        w = maze.width
+        start = maze.entry[1] * w + maze.entry[0]
+        goal = maze.exit[1] * w + maze.exit[0]
+        labels = _Labels(w * maze.height, scratch_dir)
+        try:
+            level = _search(maze, labels, start, goal)
+            if level < 0:
+                return ''
+            return _trace_back(maze, labels, start, goal, level)
+        finally:
+            labels.close()
+
+
+def _search(maze: MazeFile, labels: _Labels, start: int, goal: int) -> int:
+    """
+    Label cells level by level until the goal is reached.
+
+    returns:
+        The distance of the goal, or -1 if it cannot be reached.
+    """
+    w = maze.width
+    steps = [(bit, dy * w + dx) for bit, dy, dx, _ in SIDES]
+    bottom = (maze.height - 1) * w
+    labels.set(start, 1)
+    frontier = array('q', [start])
+    level = 0
+
+    while frontier:
+        if labels.get(goal):
+            return level
+        label = (level + 1) % 3 + 1
+        found = array('q')
+        k = 0
+        while k < len(frontier):
+            first, tiles = maze.block_tiles(frontier[k] // w)
+            base = first * w
+            end = base + len(tiles)
+            while k < len(frontier) and frontier[k] < end:
+                i = frontier[k]
+                tile = tiles[i - base]
+                if i < w or i >= bottom or i % w in (0, w - 1):
+                    _check_border(maze, i, tile)
+                for bit, step in steps:
+                    if not tile & bit and not labels.get(i + step):
+                        labels.set(i + step, label)
+                        found.append(i + step)
+                k += 1
+
+        frontier = array('q', sorted(found))
+        level += 1
+
+    return level if labels.get(goal) else -1
+
+
+def _trace_back(
+        maze: MazeFile, labels: _Labels, start: int, goal: int, level: int
+        ) -> str:
+    """
+    Walk from the goal to an open neighbour one step closer to the
+    start until the start is reached, then reverse the steps.
+    """
+    w = maze.width
+    steps = bytearray()
+    i = goal
+    while i != start:
+        level -= 1
+        before = level % 3 + 1
+        y, x = divmod(i, w)
+        tile = maze.tile(x, y)
+        _check_border(maze, i, tile)
+        for bit, dy, dx, direction in SIDES:
+            j = i + dy * w + dx
+            if not tile & bit and labels.get(j) == before:
+                steps.append(ord(OPPOSITE[direction]))
+                i = j
+                break
+        else:
+            raise ValueError("Maze walls disagree between neighbours")
+    steps.reverse()
+    return steps.decode('ascii')
+
+
+def write_path(path: str, directions: str) -> None:
+    """
+    Replace the stored path of a maze file (hex or packed) with the
+    given directions, e.g. to add the path to a streamed maze after
+    solve_maze_file.
+    """
+    with MazeFile(path) as maze:
+        offset = maze.path_offset
+        packed = maze.format == 'PACKED'
+
+    with open(path, 'r+b') as f:
+        if packed:
+            fields = list(PACKED_HEADER.unpack(f.read(PACKED_HEADER.size)))
+            fields[-1] = len(directions)
+            f.seek(0)
+            f.write(PACKED_HEADER.pack(*fields))
+        f.seek(offset)
+        f.truncate()
+        if packed:
+            f.write(pack_directions(directions))
+        else:
+            f.write(directions.encode('ascii'))
@@ -0,0 +1,253 @@
+from collections.abc import Iterator
+import random
+
+from .generator_utils import find_root
+from .pattern import place_pattern
+
+
+# A row of the maze as (east walls, south walls), 1 = closed.
+# Same layout as one row of the BitGrid planes.
+Row = tuple[bytearray, bytearray]
+
+# Chance for a cell to open its south wall, on top of the one
+# passage every set is guaranteed per row
+DROP_CHANCE = 0.5
+
+
+def pattern_rows(
+        width: int, height: int, pattern: list[list[int]] | None,
+        start: tuple[int, int], goal: tuple[int, int]
+        ) -> dict[int, bytes]:
+    """
+    Center a pattern on a width x height maze without building a grid.
+
+    Same placement and checks as pattern.mark_pattern (place_pattern).
+
+    Args:
+        width: Number of cells horizontally.
+        height: Number of cells vertically.
+        pattern: 2D list of integers where 1 marks a pattern wall cell,
+                 2 marks an interior filler cell, and 0 is ignored.
+        start: (x, y) coordinates of the entry cell.
+        goal: (x, y) coordinates of the exit cell.
+
+    Returns:
+        The pattern values (0, 1 or 2) of every row the pattern covers,
+        keyed by row index. Empty if there is no pattern or it does not fit.
+
+    Raises:
+        ValueError: If the pattern overlaps with the entry or exit cell.
+    """
+    if not pattern:
+        return {}
+
+    cells = place_pattern(width, height, pattern, start, goal)
+    if not cells:
+        return {}
+
+    top = (height - len(pattern)) // 2
+    rows = {top + py: bytearray(width) for py in range(len(pattern))}
+    for x, y, value in cells:
+        rows[y][x] = value
+
+    return {y: bytes(row) for y, row in rows.items()}
+
+
+def _join_row(
+        sets: list[int], bias: float, last: bool, rng: random.Random
+        ) -> bytearray:
+    """
+    Randomly open east walls between neighbours of different sets,
+    merging their sets. On the last row every such wall is opened.
+
+    Args:
+        sets: Set id per cell, relabelled in place after the merges.
+        bias: Chance of joining two neighbouring sets.
+        last: Whether this is the last row of the maze.
+        rng: Random source of the generator.
+
+    Returns:
+        The east walls of the row.
+    """
+    width = len(sets)
+    east = bytearray(b'\x01') * width
+    parent: dict[int, int] = {}
+
+    for x in range(width - 1):
+        a = find_root(parent, sets[x])
+        b = find_root(parent, sets[x + 1])
+        if a != b and (last or rng.random() < bias):
+            east[x] = 0
+            parent[b] = a
+
+    sets[:] = [find_root(parent, s) for s in sets]
+    return east
+
+
+def _drop_row(
+        sets: list[int], next_id: int, rng: random.Random
+        ) -> tuple[bytearray, int]:
+    """
+    Open at least one south wall per set, so no set is cut off from
+    the rows below, and give the cells below their set ids.
+
+    Args:
+        sets: Set id per cell, replaced in place by the ids of the
+              next row.
+        next_id: First unused set id.
+        rng: Random source of the generator.
+
+    Returns:
+        The south walls of the row and the next unused set id.
+    """
+    width = len(sets)
+    south = bytearray(b'\x01') * width
+    below = [-1] * width
+    groups: dict[int, list[int]] = {}
+
+    for x, s in enumerate(sets):
+        groups.setdefault(s, []).append(x)
+
+    for s, columns in groups.items():
+        keep = rng.choice(columns)
+        for x in columns:
+            if x == keep or rng.random() < DROP_CHANCE:
+                south[x] = 0
+                below[x] = s
+
+    for x in range(width):
+        if below[x] < 0:
+            below[x] = next_id
+            next_id += 1
+
+    sets[:] = below
+    return south, next_id
+
+
+def _carve_band(
+        sets: list[int], next_id: int, blocked: list[bytes],
+        rng: random.Random
+        ) -> tuple[list[bytearray], list[bytearray], int]:
+    """
+    Carve the rows around the pattern in one go.
+
+    A row by row sweep cannot route around pattern cells: a set walled
+    in from below could never reach the rest of the maze. The band (one
+    free row above the pattern, the pattern rows, one free row below) is
+    small, so it is buffered and all its edges are joined in random
+    order with a union-find, Kruskal style, continuing the sets that
+    enter from above.
+
+    Args:
+        sets: Set ids of the first band row, replaced in place by the
+              set ids of the last band row.
+        next_id: First unused set id.
+        blocked: Pattern values per band row, non-zero cells stay closed.
+        rng: Random source of the generator.
+
+    Returns:
+        East walls per band row, south walls per band row except the
+        last one, and the next unused set id.
+    """
+    width = len(sets)
+    rows = len(blocked)
+    ids = [list(sets)]
+
+    for r in range(1, rows):
+        row = []
+        for x in range(width):
+            row.append(-1 if blocked[r][x] else next_id)
+            next_id += 1
+        ids.append(row)
+
+    edges = []
+    for r in range(rows):
+        for x in range(width):
+            if blocked[r][x]:
+                continue
+            if x < width - 1 and not blocked[r][x + 1]:
+                edges.append((r, x, True))
+            if r < rows - 1 and not blocked[r + 1][x]:
+                edges.append((r, x, False))
+    rng.shuffle(edges)
+
+    east = [bytearray(b'\x01') * width for _ in range(rows)]
+    south = [bytearray(b'\x01') * width for _ in range(rows - 1)]
+    parent: dict[int, int] = {}
+
+    for r, x, horizontal in edges:
+        a = find_root(parent, ids[r][x])
+        if horizontal:
+            b = find_root(parent, ids[r][x + 1])
+        else:
+            b = find_root(parent, ids[r + 1][x])
+
+        if a != b:
+            (east if horizontal else south)[r][x] = 0
+            parent[b] = a
+
+    sets[:] = [find_root(parent, s) for s in ids[-1]]
+    return east, south, next_id
+
+
+def eller_rows(
+        width: int, height: int, bias: float, seed: int | None,
+        blocked: dict[int, bytes] | None = None,
+        rng: random.Random | None = None
+        ) -> Iterator[Row]:
+    """
+    Generate a perfect maze with Eller's algorithm, one row at a time.
+
+    Only the set ids of the current row are kept, so memory stays
+    O(width) no matter the height. Each row is yielded as soon as its
+    east and south walls are final. Within a row, neighbouring cells of
+    different sets are joined with chance `bias`; every set then opens
+    at least one passage down. The last row joins all remaining sets.
+
+    Rows covered by a pattern are carved together with _carve_band.
+
+    Args:
+        width: Number of cells horizontally.
+        height: Number of cells vertically.
+        bias: Chance (0.0 to 1.0) of joining two neighbouring sets,
+              higher values give longer horizontal corridors.
+        seed: Optional random seed for reproducibility.
+        blocked: Pattern values per row, as returned by pattern_rows.
+        rng: Random source to draw from instead of one seeded with seed.
+
+    Yields:
+        (east, south) walls per row, top to bottom, 1 = closed.
+    """
+    if rng is None:
+        rng = random.Random(seed)
+
+    blocked = blocked or {}
+    band = None
+    if blocked:
+        band = (min(blocked) - 1, max(blocked) + 1)
+
+    sets = list(range(width))
+    next_id = width
+    free = bytes(width)
+    y = 0
+
+    while y < height:
+        if band is not None and y == band[0]:
+            band_rows = [blocked.get(r, free) for r in range(y, band[1] + 1)]
+            east_rows, south_rows, next_id = _carve_band(
+                sets, next_id, band_rows, rng
+            )
+            for east, south in zip(east_rows, south_rows):
+                yield east, south
+            y = band[1]
+            east = east_rows[-1]
+        else:
+            east = _join_row(sets, bias, y == height - 1, rng)
+
+        if y == height - 1:
+            yield east, bytearray(b'\x01') * width
+            return
+
+        south, next_id = _drop_row(sets, next_id, rng)
+        yield east, south
+        y += 1
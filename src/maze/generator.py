@@ -1,4 +1,6 @@
+import os
 import random
+from collections.abc import Iterator, Sequence
 from typing import Any
 
 
@@ -11,9 +13,6 @@ class Cell:
         y: Row index of the cell.
         walls: Dict indicating which walls (N/E/S/W) are closed.
         visited: Whether this cell has been visited during maze generation.
-        g: Actual cost from start cell (used in pathfinding).
-        mhd: Manhattan distance heuristic to goal (used in pathfinding).
-        f: Combined score g + mhd, determines next cell in pathfinding.
         parent: Previous cell on the shortest path,
                 used for path reconstruction.
         in_path: Whether this cell is part of the solution path.
@@ -42,10 +41,6 @@ class Cell:
 
         self.visited: bool = False
 
-        self.g: float = float('inf')
-        self.mhd: float = 0.0
-        self.f: float = float('inf')
-
         self.parent: Cell | None = None
         self.in_path: bool = False
 
@@ -56,7 +51,8 @@ class Cell:
 
 
 def growing_sigma_tree(
-        grid: list[list[Cell]], bias: float, seed: int | None
+        grid: list[list[Cell]], bias: float, seed: int | None,
+        rng: random.Random | None = None
         ) -> None:
     """
     Generate a perfect maze using the Growing Tree algorithm.
@@ -69,6 +65,9 @@ def growing_sigma_tree(
     A wall is carved to a random unvisited neighbor, which is then added
     to the active list. If a cell has no unvisited neighbors, it is removed
     from the active list. The algorithm ends when the active list is empty.
+    The active list is an ActiveList, so removing exhausted cells stays
+    constant time even when it holds a large part of the grid. The
+    neighbour finder and the RNG methods are bound once per run.
 
     Args:
         grid: 2D list of Cell objects representing the maze.
@@ -76,39 +75,129 @@ def growing_sigma_tree(
               cell. At 1.0, behaves like recursive backtracking. At 0.0,
               behaves like Prim's algorithm.
         seed: Optional random seed for reproducibility.
+        rng: Random source to draw from instead of one seeded with seed.
     """
     from .generator_utils import (
-        get_unvisited_neighbors,
+        ActiveList,
+        neighbor_finder,
         remove_wall_between,
     )
 
-    if seed is not None:
-        random.seed(seed)
+    if rng is None:
+        rng = random.Random(seed)
 
     while True:
-        start = grid[
-            random.randrange(len(grid))][random.randrange(len(grid[0]))]
+        start = grid[rng.randrange(len(grid))][rng.randrange(len(grid[0]))]
         if not start.pattern:
             break
 
     start.visited = True
-    active = [start]
+    active = ActiveList(start, rng)
+    unvisited_neighbors = neighbor_finder(grid, unvisited_only=True)
+    draw = rng.random
+    choice = rng.choice
+    newest = active.newest
+    pick = active.choice
 
     while active:
-        cell = active[-1] if random.random() < bias else random.choice(active)
-        neighbors = get_unvisited_neighbors(grid, cell)
+        slot = newest() if draw() < bias else pick()
+        cell = active[slot]
+        neighbors = unvisited_neighbors(cell)
 
         if neighbors:
-            next_cell = random.choice(neighbors)
+            next_cell = choice(neighbors)
             remove_wall_between(cell, next_cell)
             next_cell.visited = True
             active.append(next_cell)
         else:
-            active.remove(cell)
+            active.remove(slot)
+
+
+def kruskal(
+        grid: list[list[Cell]], seed: int | None,
+        rng: random.Random | None = None
+        ) -> None:
+    """
+    Generate a perfect maze using randomized Kruskal's algorithm.
+
+    Every wall between two free cells is a candidate. The candidates
+    are shuffled once and a wall is removed whenever the cells on
+    either side are not connected yet, tracked with an array-based
+    union-find. Cells marked visited by mark_pattern are left out.
+    The run time only depends on the number of walls, not on the
+    shape of the maze.
+
+    Args:
+        grid: 2D list of Cell objects representing the maze.
+        seed: Optional random seed for reproducibility.
+        rng: Random source to draw from instead of one seeded with seed.
+    """
+    from .generator_utils import (
+        kruskal_edges,
+        kruskal_tree,
+        remove_wall_between,
+    )
+
+    if rng is None:
+        rng = random.Random(seed)
+
+    height = len(grid)
+    width = len(grid[0])
+    blocked = bytes(cell.visited for row in grid for cell in row)
+    edges = kruskal_edges(width, height, blocked)
+
+    for edge in kruskal_tree(edges, width, width * height, rng):
+        y, x = divmod(edge >> 1, width)
+        if edge & 1:
+            remove_wall_between(grid[y][x], grid[y + 1][x])
+        else:
+            remove_wall_between(grid[y][x], grid[y][x + 1])
+
+    for row in grid:
+        for cell in row:
+            cell.visited = True
+
+
+class _CarveRun:
+    """
+    Everything the Wilson's / Hunt-and-Kill steps look up on every
+    carved edge, bound once per run: the neighbour finder, the wall
+    helpers, the RNG methods and the unvisited / frontier sets.
+    """
+
+    def __init__(
+            self, grid: list[list[Cell]], imprate: int, rng: random.Random
+            ) -> None:
+        from .generator_utils import (
+            RandomSet,
+            neighbor_finder,
+            remove_wall_between,
+            wall_exists_between,
+        )
+
+        self.neighbors = neighbor_finder(grid)
+        self.remove_wall = remove_wall_between
+        self.wall_exists = wall_exists_between
+        self.choice = rng.choice
+        self.randint = rng.randint
+        self.imprate = imprate
+
+        self.unvisited: RandomSet[Cell] = RandomSet((
+            cell
+            for row in grid
+            for cell in row
+            if not cell.visited and not cell.pattern
+        ), rng)
+        self.frontier: RandomSet[Cell] = RandomSet((
+            cell
+            for cell in self.unvisited.items
+            if any(n.visited for n in self.neighbors(cell))
+        ), rng)
 
 
 def wilson_sometimes_hunts(
-        grid: list[list[Cell]], bias: float, seed: int | None, imprate: int
+        grid: list[list[Cell]], bias: float, seed: int | None, imprate: int,
+        rng: random.Random | None = None
         ) -> None:
     """
     Generate a maze using a hybrid Wilson's algorithm and
@@ -118,9 +207,14 @@ def wilson_sometimes_hunts(
     handles the next unvisited cell.
     Wilson's algorithm (random walk with loop erasure) is used
     when the random value falls below the bias threshold,
-    otherwise Hunt-and-Kill scans for an unvisited cell
+    otherwise Hunt-and-Kill picks an unvisited cell
     adjacent to the existing maze.
 
+    The unvisited cells, and the subset of them next to a visited cell
+    (the frontier), are kept in RandomSets that are updated as cells get
+    visited, so no step has to rescan the grid. Neighbours, helpers and
+    RNG methods are bound once in a _CarveRun shared by all steps.
+
     Imperfections can be introduced by randomly removing extra walls during
     path carving, creating loops and making the maze imperfect.
 
@@ -131,159 +225,161 @@ def wilson_sometimes_hunts(
         seed:   Optional random seed for reproducibility.
         imprate:Percentage chance (0-100) of removing an extra wall per step,
                 creating imperfections in the maze.
+        rng:    Random source to draw from instead of one seeded with seed.
     """
-    if seed is not None:
-        random.seed(seed)
+    if rng is None:
+        rng = random.Random(seed)
 
     while True:
-        start = grid[
-            random.randrange(len(grid))][random.randrange(len(grid[0]))]
+        start = grid[rng.randrange(len(grid))][rng.randrange(len(grid[0]))]
         if not start.pattern:
             break
 
     start.visited = True
 
-    while True:
-        unvisited = [
-            cell
-            for row in grid
-            for cell in row
-            if not cell.visited and not cell.pattern
-        ]
+    run = _CarveRun(grid, imprate, rng)
+    unvisited = run.unvisited
+    draw = rng.random
 
-        if not unvisited:
-            break
-
-        if random.random() < bias:
-            _wilson_step(grid, unvisited, imprate)
+    while unvisited:
+        if draw() < bias:
+            _wilson_step(run)
         else:
-            _hunt_step(grid, unvisited, imprate)
+            _hunt_step(run)
 
 
-def _wilson_step(
-        grid: list[list[Cell]], unvisited: list[Cell], imprate: int
-        ) -> None:
+def _mark_visited(run: _CarveRun, cell: Cell) -> None:
+    """
+    Mark a cell as visited and update the unvisited and frontier sets:
+    the cell leaves both, its unvisited neighbours join the frontier.
+
+    Args:
+        run: The state of the current generation run.
+        cell: The cell joining the maze.
+    """
+    frontier = run.frontier
+
+    cell.visited = True
+    run.unvisited.discard(cell)
+    frontier.discard(cell)
+
+    for neighbor in run.neighbors(cell):
+        if not neighbor.visited:
+            frontier.add(neighbor)
+
+
+def _wilson_step(run: _CarveRun) -> None:
     """
     Perform one Wilson's algorithm step: random walk with loop erasure.
 
-    Starts a random walk from an unvisited cell. If the walk revisits a cell
-    already in the current path, the loop is erased. The walk ends when it
-    reaches a visited cell, at which point all cells along the path are carved.
+    Starts a random walk from an unvisited cell and records, for every
+    cell, the neighbour the walk last moved to. The walk ends when it
+    reaches a visited cell. Following the last exits from the start then
+    gives the loop-erased walk, so loops cost nothing to erase. All cells
+    along that path are carved.
 
     Args:
-        grid: 2D list of Cell objects representing the maze.
-        unvisited: List of all currently unvisited, non-pattern cells.
-        imprate: Percentage chance (0-100) of removing an extra wall per step.
+        run: The state of the current generation run.
     """
-    from .generator_utils import (
-        get_all_neighbors,
-        remove_wall_between,
-    )
-
-    cell = random.choice(unvisited)
-    path = [cell]
+    neighbors = run.neighbors
+    choice = run.choice
+    start = cell = run.unvisited.choice()
+    last_exit: dict[Cell, Cell] = {}
 
     while not cell.visited:
-        neighbors = get_all_neighbors(grid, cell)
-        if not neighbors:
+        options = neighbors(cell)
+        if not options:
             break
 
-        next_cell = random.choice(neighbors)
-
-        if next_cell in path:
-            path = path[:path.index(next_cell) + 1]
-        else:
-            path.append(next_cell)
-
+        next_cell = choice(options)
+        last_exit[cell] = next_cell
         cell = next_cell
 
+    cell = start
+    path = [cell]
+    while cell in last_exit:
+        cell = last_exit[cell]
+        path.append(cell)
+
+    remove_wall = run.remove_wall
     for i in range(len(path) - 1):
         current = path[i]
         next_cell = path[i + 1]
 
-        remove_wall_between(current, next_cell)
-        current.visited = True
-        next_cell.visited = True
+        remove_wall(current, next_cell)
+        for carved in (current, next_cell):
+            if not carved.visited:
+                _mark_visited(run, carved)
 
-        _maybe_add_imperfection(grid, current, next_cell, imprate)
+        _maybe_add_imperfection(run, current, next_cell)
 
 
-def _hunt_step(
-        grid: list[list[Cell]], unvisited: list[Cell], imprate: int
-        ) -> None:
+def _hunt_step(run: _CarveRun) -> None:
     """
-    Perform one Hunt-and-Kill step: scan for an
+    Perform one Hunt-and-Kill step: pick an
     unvisited cell with a visited neighbor.
 
-    Shuffles unvisited cells and scans for the first
-    one adjacent to the existing maze.
+    Picks a random cell from the frontier, which is the same as
+    shuffling the unvisited cells and taking the first one adjacent
+    to the existing maze.
     Carves a passage to that neighbor and marks the cell as visited.
-    If no valid cell is found, the first unvisited cell is
+    If the frontier is empty, a random unvisited cell is
     forcibly marked visited to prevent the algorithm from getting stuck.
 
     Args:
-        grid: 2D list of Cell objects representing the maze.
-        unvisited: List of all currently unvisited, non-pattern cells.
-        imprate: Percentage chance (0-100) of removing an extra wall per step.
+        run: The state of the current generation run.
     """
-    from .generator_utils import get_all_neighbors, remove_wall_between
-
-    random.shuffle(unvisited)
-
-    for cell in unvisited:
-        visited_neighbors = [
-            n for n in get_all_neighbors(grid, cell) if n.visited
-            ]
-
-        if not visited_neighbors:
-            continue
+    if not run.frontier:
+        _mark_visited(run, run.unvisited.choice())
+        return
 
-        next_cell = random.choice(visited_neighbors)
-        remove_wall_between(cell, next_cell)
-        cell.visited = True
+    cell = run.frontier.choice()
+    visited_neighbors = [n for n in run.neighbors(cell) if n.visited]
 
-        _maybe_add_imperfection(grid, cell, next_cell, imprate)
-        return
+    next_cell = run.choice(visited_neighbors)
+    run.remove_wall(cell, next_cell)
+    _mark_visited(run, cell)
 
-    unvisited[0].visited = True
+    _maybe_add_imperfection(run, cell, next_cell)
 
 
 def _maybe_add_imperfection(
-        grid: list[list[Cell]], cell: Cell, exclude: Cell, imprate: int
+        run: _CarveRun, cell: Cell, exclude: Cell
         ) -> None:
     """
     Randomly remove an extra wall to introduce an imperfection.
 
     Args:
-        grid: 2D list of Cell objects representing the maze.
+        run: The state of the current generation run.
         cell: The cell to potentially carve an extra passage from.
         exclude: A neighbor to exclude from consideration (already connected).
-        imprate: Percentage chance (0-100) of removing an extra wall.
     """
-    from .generator_utils import (
-        get_all_neighbors, remove_wall_between, wall_exists_between
-        )
-
-    if random.randint(1, 100) > imprate:
+    if run.randint(1, 100) > run.imprate:
         return
 
     extra_neighbors = [
-        n for n in get_all_neighbors(grid, cell)
-        if n.visited and n != exclude
+        n for n in run.neighbors(cell)
+        if n.visited and n is not exclude
     ]
 
     if extra_neighbors:
-        extra = random.choice(extra_neighbors)
-        if wall_exists_between(cell, extra):
-            remove_wall_between(cell, extra)
+        extra = run.choice(extra_neighbors)
+        if run.wall_exists(cell, extra):
+            run.remove_wall(cell, extra)
 
 
 class MazeGenerator:
-    def __init__(self, config: dict[str, Any]) -> None:
+    def __init__(
+            self, config: dict[str, Any], rng: random.Random | None = None
+            ) -> None:
         """
         Initializes grid and required config inputs.
         Uses get() to set values to optional keys.
         Calls make_pattern to mark pattern on 2d grid.
+
+        All random draws come from self.rng: the given rng, or a
+        random.Random seeded with SEED. The global random state is
+        never touched, so generators can run side by side in threads.
         """
         from .pattern import make_pattern
         self.width = config['WIDTH']
@@ -297,11 +393,19 @@ class MazeGenerator:
         self.pattern_value = config.get('PATTERN', '42')
         self.render = config.get('RENDER', '2D')
         self.imprate = config.get('IMPRATE', 65)
-
-        if self.seed is not None:
-            random.seed(self.seed)
-
-        self.grid = self.make_grid()
+        self.backend = config.get('BACKEND', 'CELL')
+        self.algorithm = config.get('ALGORITHM')
+        self.tile_size = config.get('TILE_SIZE', 0)
+        self.workers = config.get('WORKERS', os.cpu_count() or 1)
+
+        self.rng = rng if rng is not None else random.Random(self.seed)
+
+        self.grid = (
+            self.make_grid()
+            if self.backend == 'CELL' and self.algorithm != 'ELLER'
+            and not self.tile_size
+            else []
+        )
         self.pattern = make_pattern(self.pattern_value)
 
     def make_grid(self) -> list[list[Cell]]:
@@ -320,36 +424,164 @@ class MazeGenerator:
 
         return grid
 
-    def generate(self) -> list[list[Cell]]:
+    def generate(self) -> Sequence[Sequence[Cell]]:
         """
-
+        Marks entry, exit and pattern, then carves the maze with
+        Growing Tree (perfect) or Wilson's + Hunt-and-Kill (imperfect),
+        or with Kruskal's algorithm for ALGORITHM=KRUSKAL.
+        With BACKEND=BITPLANE the maze is built on a BitGrid and
+        returned as a GridView of Cell views.
         """
+        if self.algorithm == 'ELLER':
+            return self.generate_eller()
+        if self.tile_size:
+            return self.generate_tiled()
+        if self.backend == 'BITPLANE':
+            return self.generate_bitplane()
+
         from .generator_utils import mark_start_and_exit
         from .pattern import mark_pattern
         from .generator_utils import fix_large_holes
         mark_start_and_exit(self.grid, self.start, self.goal)
 
         if self.pattern:
-            mark_pattern(self.grid, self.pattern)
+            mark_pattern(self.grid, self.pattern, self.start, self.goal)
 
-        if self.perfect:
+        if self.algorithm == 'KRUSKAL':
+            kruskal(self.grid, seed=self.seed, rng=self.rng)
+        elif self.perfect:
             growing_sigma_tree(
                 self.grid,
                 bias=self.bias,
                 seed=self.seed,
+                rng=self.rng,
             )
         else:
             wilson_sometimes_hunts(
                 self.grid,
                 bias=self.bias,
                 seed=self.seed,
-                imprate=self.imprate
+                imprate=self.imprate,
+                rng=self.rng,
+            )
+            fix_large_holes(self.grid, self.rng)
+
+        return self.grid
+
+    def generate_bitplane(self) -> Sequence[Sequence[Cell]]:
+        """
+        Same steps as generate(), on a BitGrid instead of Cell objects.
+        """
+        from . import bitgrid
+
+        bits = bitgrid.BitGrid(self.width, self.height)
+        bits.mark_start_and_exit(self.start, self.goal)
+
+        if self.pattern:
+            bits.mark_pattern(self.pattern)
+
+        if self.algorithm == 'KRUSKAL':
+            bitgrid.kruskal(bits, seed=self.seed, rng=self.rng)
+        elif self.perfect:
+            bitgrid.growing_sigma_tree(
+                bits, bias=self.bias, seed=self.seed, rng=self.rng
+            )
+        else:
+            bitgrid.wilson_sometimes_hunts(
+                bits,
+                bias=self.bias,
+                seed=self.seed,
+                imprate=self.imprate,
+                rng=self.rng,
             )
-            fix_large_holes(self.grid)
+            bitgrid.fix_large_holes(bits, self.rng)
 
+        return bitgrid.GridView(bits)
+
+    def generate_tiled(self) -> Sequence[Sequence[Cell]]:
+        """
+        Same steps as generate_bitplane(), but carves TILE_SIZE x
+        TILE_SIZE tiles in WORKERS processes and stitches them
+        together, see tiled.carve_tiled.
+        """
+        from . import bitgrid
+        from .tiled import carve_tiled
+
+        bits = bitgrid.BitGrid(self.width, self.height)
+        bits.mark_start_and_exit(self.start, self.goal)
+
+        if self.pattern:
+            bits.mark_pattern(self.pattern)
+
+        carve_tiled(
+            bits,
+            tile_size=self.tile_size,
+            workers=self.workers,
+            perfect=self.perfect,
+            bias=self.bias,
+            imprate=self.imprate,
+            rng=self.rng,
+        )
+
+        if self.backend == 'BITPLANE':
+            return bitgrid.GridView(bits)
+
+        self.grid = bits.to_cells()
+        return self.grid
+
+    def stream_rows(self) -> Iterator[tuple[bytearray, bytearray]]:
+        """
+        Generate the maze with Eller's algorithm and yield it row by row
+        as (east walls, south walls), without keeping the grid in memory.
+        """
+        from .eller import eller_rows, pattern_rows
+
+        blocked = pattern_rows(
+            self.width, self.height, self.pattern, self.start, self.goal
+        )
+        return eller_rows(
+            self.width, self.height, self.bias, self.seed, blocked, self.rng
+        )
+
+    def generate_eller(self) -> Sequence[Sequence[Cell]]:
+        """
+        Builds the grid for the configured backend from stream_rows(),
+        for when the whole maze should be kept (solving, rendering).
+        """
+        from . import bitgrid
+
+        bits = bitgrid.BitGrid(self.width, self.height)
+        bits.mark_start_and_exit(self.start, self.goal)
+
+        if self.pattern:
+            bits.mark_pattern(self.pattern)
+
+        for y, (east, south) in enumerate(self.stream_rows()):
+            row = slice(y * self.width, (y + 1) * self.width)
+            bits.east[row] = east
+            bits.south[row] = south
+
+        # Every cell is carved or part of the pattern, as after the
+        # other generators
+        bits.visited[:] = b'\x01' * len(bits.visited)
+
+        if self.backend == 'BITPLANE':
+            return bitgrid.GridView(bits)
+
+        self.grid = bits.to_cells()
         return self.grid
 
 
-def generate_maze(config: dict[str, Any]) -> list[list[Cell]]:
-    generator = MazeGenerator(config)
+def derive_rng(root_seed: int, index: int) -> random.Random:
+    """
+    Independent, reproducible random source number `index` of a run
+    seeded with `root_seed`, e.g. one per worker or per maze of a batch.
+    """
+    return random.Random(f"{root_seed}:{index}")
+
+
+def generate_maze(
+        config: dict[str, Any], rng: random.Random | None = None
+        ) -> Sequence[Sequence[Cell]]:
+    generator = MazeGenerator(config, rng)
     return generator.generate()
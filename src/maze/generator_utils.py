@@ -1,8 +1,14 @@
 from .generator import Cell
-from typing import Any
+from array import array
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from typing import Any, Generic, TypeVar
 import random
 
 
+T = TypeVar('T')
+H = TypeVar('H', bound=Hashable)
+
+
 OPPOSITE = {
     'N': 'S',
     'S': 'N',
@@ -10,6 +16,189 @@ OPPOSITE = {
     'W': 'E'
 }
 
+# direction from a cell to the neighbour at (dx, dy)
+STEP_DIRECTIONS = {(1, 0): 'E', (-1, 0): 'W', (0, 1): 'S', (0, -1): 'N'}
+
+
+class ActiveList(Generic[T]):
+    """
+    Active cells of the Growing Tree, kept in insertion order
+    with O(1) amortized removal of any entry.
+
+    Removed entries are only flagged dead and skipped over. Random picks
+    draw a slot until they hit a live one, and the list is compacted once
+    dead slots outnumber live ones, so a pick needs fewer than two draws
+    on average. The last slot is always live, so it holds the most
+    recently added cell.
+    """
+
+    def __init__(self, first: T, rng: random.Random) -> None:
+        self.items: list[T] = [first]
+        self.alive = bytearray(b'\x01')
+        self.live = 1
+        self.rng = rng
+
+    def __bool__(self) -> bool:
+        return self.live > 0
+
+    def __getitem__(self, slot: int) -> T:
+        return self.items[slot]
+
+    def append(self, item: T) -> None:
+        self.items.append(item)
+        self.alive.append(1)
+        self.live += 1
+
+    def newest(self) -> int:
+        """
+        Slot of the most recently added live cell.
+        """
+        return len(self.items) - 1
+
+    def choice(self) -> int:
+        """
+        Slot of a uniformly random live cell.
+        """
+        alive = self.alive
+        size = len(alive)
+        while True:
+            slot = self.rng.randrange(size)
+            if alive[slot]:
+                return slot
+
+    def remove(self, slot: int) -> None:
+        """
+        Remove the cell in the given slot. Slots returned earlier
+        are invalid afterwards.
+        """
+        items = self.items
+        alive = self.alive
+        alive[slot] = 0
+        self.live -= 1
+
+        while alive and not alive[-1]:
+            alive.pop()
+            items.pop()
+
+        if self.live * 2 < len(alive):
+            self.items = [
+                item for item, keep in zip(items, alive) if keep
+            ]
+            self.alive = bytearray(b'\x01') * self.live
+
+
+class RandomSet(Generic[H]):
+    """
+    Set with O(1) add, discard and uniform random choice.
+
+    Items are kept in a list with their positions in a dict. Discarding
+    an item moves the last item of the list into its position.
+    """
+
+    def __init__(self, items: Iterable[H], rng: random.Random) -> None:
+        self.items: list[H] = list(items)
+        self.positions: dict[H, int] = {
+            item: i for i, item in enumerate(self.items)
+        }
+        self.rng = rng
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.positions
+
+    def add(self, item: H) -> None:
+        if item not in self.positions:
+            self.positions[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item: H) -> None:
+        pos = self.positions.pop(item, None)
+        if pos is None:
+            return
+
+        last = self.items.pop()
+        if pos < len(self.items):
+            self.items[pos] = last
+            self.positions[last] = pos
+
+    def choice(self) -> H:
+        return self.rng.choice(self.items)
+
+
+def kruskal_edges(
+        width: int, height: int, blocked: bytes | bytearray
+        ) -> list[int]:
+    """
+    Every internal wall between two free cells, in row-major order.
+    A wall is encoded as 2 * i for the east wall of cell i and
+    2 * i + 1 for its south wall.
+
+    Args:
+        width: Number of cells horizontally.
+        height: Number of cells vertically.
+        blocked: One byte per cell, non-zero for cells to leave out
+                 (the cells marked visited by mark_pattern).
+    """
+    edges = []
+
+    for y in range(height):
+        row = y * width
+        last_row = y == height - 1
+        for i in range(row, row + width):
+            if blocked[i]:
+                continue
+            if i < row + width - 1 and not blocked[i + 1]:
+                edges.append(2 * i)
+            if not last_row and not blocked[i + width]:
+                edges.append(2 * i + 1)
+
+    return edges
+
+
+def kruskal_tree(
+        edges: list[int], width: int, size: int, rng: random.Random
+        ) -> Iterator[int]:
+    """
+    Randomized Kruskal: shuffle the walls once, then yield every wall
+    that joins two parts not connected yet, in the order found.
+
+    The union-find lives in two flat arrays (parent and part size) with
+    path halving and union by size, so the whole run is O(E α(N)).
+
+    Args:
+        edges: Walls as returned by kruskal_edges, shuffled in place.
+        width: Number of cells horizontally.
+        size: Number of cells in the grid.
+        rng: Random source of the generator.
+
+    Yields:
+        The walls to open, encoded like the edges.
+    """
+    rng.shuffle(edges)
+    parent = array('l', range(size))
+    part_size = array('l', [1]) * size
+
+    for edge in edges:
+        a = edge >> 1
+        b = a + width if edge & 1 else a + 1
+
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+
+        if a == b:
+            continue
+        if part_size[a] < part_size[b]:
+            a, b = b, a
+        parent[b] = a
+        part_size[a] += part_size[b]
+        yield edge
+
 
 def mark_start_and_exit(
         grid: list[list[Cell]], start: tuple[int, int], goal: tuple[int, int]
@@ -29,13 +218,27 @@ def mark_start_and_exit(
     grid[gy][gx].is_goal = True
 
 
+def direction_between(a: Cell, b: Cell) -> str:
+    """
+    Direction (N/E/S/W) of the wall of a that faces b.
+
+    Args:
+        a: The source cell.
+        b: The destination cell, must be directly adjacent to a.
+
+    Raises:
+        ValueError: If a and b are not adjacent (not exactly one step apart).
+    """
+    direction = STEP_DIRECTIONS.get((b.x - a.x, b.y - a.y))
+    if direction is None:
+        raise ValueError("Cells are not adjacent")
+    return direction
+
+
 def remove_wall_between(a: Cell, b: Cell) -> None:
     """
     Remove the shared wall between two adjacent cells.
 
-    Determines the direction from a to b, then opens the wall
-    on both sides using the opposite direction mapping.
-
     Args:
         a: The source cell.
         b: The destination cell, must be directly adjacent to a.
@@ -43,24 +246,30 @@ def remove_wall_between(a: Cell, b: Cell) -> None:
     Raises:
         ValueError: If a and b are not adjacent (not exactly one step apart).
     """
-    dx = b.x - a.x
-    dy = b.y - a.y
+    set_wall_between(a, b, False)
 
-    # determine direction from a to b
-    if dx == 1 and dy == 0:
-        direction = 'E'
-    elif dx == -1 and dy == 0:
-        direction = 'W'
-    elif dx == 0 and dy == 1:
-        direction = 'S'
-    elif dx == 0 and dy == -1:
-        direction = 'N'
-    else:
-        raise ValueError("Cells are not adjacent")
 
-    # remove walls on both sides using OPPOSITE
-    a.walls[direction] = False
-    b.walls[OPPOSITE[direction]] = False
+def set_wall_between(a: Cell, b: Cell, closed: bool) -> None:
+    """
+    Open or close the shared wall between two adjacent cells.
+
+    Determines the direction from a to b, then writes the wall on both
+    sides using the opposite direction mapping, so the grid stays
+    consistent whichever cell is read. Used to carve mazes (see
+    remove_wall_between) and to edit finished ones, e.g. through
+    incremental.IncrementalSolver.set_wall.
+
+    Args:
+        a: The first cell.
+        b: The second cell, must be directly adjacent to a.
+        closed: True to close the wall, False to open it.
+
+    Raises:
+        ValueError: If a and b are not adjacent (not exactly one step apart).
+    """
+    direction = direction_between(a, b)
+    a.walls[direction] = closed
+    b.walls[OPPOSITE[direction]] = closed
 
 
 def get_unvisited_neighbors(
@@ -154,6 +363,71 @@ def get_all_neighbors(grid: list[list[Cell]], cell: Cell) -> list[Cell]:
     return neighbors
 
 
+def neighbor_finder(
+        grid: list[list[Cell]], unvisited_only: bool = False
+        ) -> Callable[[Cell], list[Cell]]:
+    """
+    get_all_neighbors (or get_unvisited_neighbors with unvisited_only)
+    bound to one grid, for the generator hot loops: the grid and its
+    size are looked up once per run instead of on every call. Same
+    neighbours in the same order.
+
+    args:
+        grid: 2D list of Cell objects representing the maze.
+        unvisited_only: Skip visited neighbours as well.
+    """
+    last_y = len(grid) - 1
+    last_x = len(grid[0]) - 1
+
+    def all_neighbors(cell: Cell) -> list[Cell]:
+        x = cell.x
+        y = cell.y
+        row = grid[y]
+        found = []
+        if y > 0:
+            neighbor = grid[y - 1][x]
+            if not neighbor.pattern:
+                found.append(neighbor)
+        if y < last_y:
+            neighbor = grid[y + 1][x]
+            if not neighbor.pattern:
+                found.append(neighbor)
+        if x > 0:
+            neighbor = row[x - 1]
+            if not neighbor.pattern:
+                found.append(neighbor)
+        if x < last_x:
+            neighbor = row[x + 1]
+            if not neighbor.pattern:
+                found.append(neighbor)
+        return found
+
+    def unvisited_neighbors(cell: Cell) -> list[Cell]:
+        x = cell.x
+        y = cell.y
+        row = grid[y]
+        found = []
+        if y > 0:
+            neighbor = grid[y - 1][x]
+            if not (neighbor.visited or neighbor.pattern):
+                found.append(neighbor)
+        if y < last_y:
+            neighbor = grid[y + 1][x]
+            if not (neighbor.visited or neighbor.pattern):
+                found.append(neighbor)
+        if x > 0:
+            neighbor = row[x - 1]
+            if not (neighbor.visited or neighbor.pattern):
+                found.append(neighbor)
+        if x < last_x:
+            neighbor = row[x + 1]
+            if not (neighbor.visited or neighbor.pattern):
+                found.append(neighbor)
+        return found
+
+    return unvisited_neighbors if unvisited_only else all_neighbors
+
+
 def wall_exists_between(a: Cell, b: Cell) -> Any:
     """
     Checks between cell a and b for wall.
@@ -175,85 +449,188 @@ def wall_exists_between(a: Cell, b: Cell) -> Any:
     return False
 
 
-def fix_large_holes(grid: list[list[Cell]]) -> None:
+def find_root(parent: dict[int, int], a: int) -> int:
     """
-    Detects fully open 3x3 regions in the maze and closes one random internal
-    wall within them. Repeats until no such regions remain.
+    Union-find lookup with path halving. Ids missing from
+    `parent` are their own root.
+    """
+    while a in parent:
+        grand = parent.get(parent[a], parent[a])
+        parent[a] = grand
+        a = grand
+    return a
 
-    A 3x3 region is considered fully open if every adjacent cell pair within it
-    shares an open passage (no walls between them) and no cell
-    carries a pattern. Closing a random internal wall breaks the
-    open region while preserving overall maze connectivity.
+
+# The 12 internal edges of a 3x3 window as (dx, dy, direction),
+# per cell the east edge first, then the south edge
+WINDOW_EDGES = [
+    (dx, dy, direction)
+    for dy in range(3)
+    for dx in range(3)
+    for direction, inside in (('E', dx < 2), ('S', dy < 2))
+    if inside
+]
+
+
+def row_mask(open_flags: bytes | bytearray) -> int:
+    """
+    Turn a row of b'0'/b'1' flags into an int with bit x set
+    when flag x is b'1'.
+    """
+    return int(open_flags[::-1], 2) if open_flags else 0
+
+
+def find_open_windows(
+        east_open: list[int], south_open: list[int], width: int
+        ) -> list[int]:
+    """
+    Find every fully open 3x3 window in one pass over the rows.
+
+    Works on rows packed into ints, so each row is handled by a few
+    big-int operations instead of a loop over its cells.
 
     Args:
-        grid: 2D list of Cell objects representing the maze.
+        east_open: Per row, bit x set if (x, y) and (x + 1, y) are
+                   connected and neither is a pattern cell.
+        south_open: Per row, bit x set if (x, y) and (x, y + 1) are
+                    connected and neither is a pattern cell.
+        width: Number of cells per row.
+
+    Returns:
+        Per window top row, bit x set if the window with its
+        top-left cell at (x, y) is fully open.
     """
-    height = len(grid)
-    width = len(grid[0])
-    changed = True
+    pairs = [m & (m >> 1) for m in east_open]
+    triples = [m & (m >> 1) & (m >> 2) for m in south_open]
+    limit = (1 << max(width - 2, 0)) - 1
+
+    return [
+        pairs[y] & pairs[y + 1] & pairs[y + 2]
+        & triples[y] & triples[y + 1] & limit
+        for y in range(len(east_open) - 2)
+    ]
 
-    while changed:
-        changed = False
 
-        for start_y in range(height - 2):
-            for start_x in range(width - 2):
+def close_open_windows(
+        windows: list[int], close_wall: Callable[[int, int, str], None],
+        rng: random.Random
+        ) -> int:
+    """
+    Close one random internal wall in every open window, in row-major
+    order.
+
+    Closing a wall can only break windows, never open new ones, so after
+    each close only the (at most 6) windows containing that wall are
+    dropped from `windows` instead of rescanning the grid.
 
-                fully_open = True
+    Args:
+        windows: Open windows as returned by find_open_windows,
+                 updated in place.
+        close_wall: Called with (x, y, 'E' or 'S') to close the wall
+                    on that side of cell (x, y).
+        rng: Random source picking the wall to close.
+
+    Returns:
+        Number of walls closed.
+    """
+    fixed = 0
 
-                for dy in range(3):
-                    for dx in range(3):
-                        cell = grid[start_y + dy][start_x + dx]
+    for start_y in range(len(windows)):
+        while windows[start_y]:
+            row = windows[start_y]
+            start_x = (row & -row).bit_length() - 1
 
-                        if cell.pattern:
-                            fully_open = False
-                            break
+            dx, dy, direction = rng.choice(WINDOW_EDGES)
+            x = start_x + dx
+            y = start_y + dy
+            close_wall(x, y, direction)
+            fixed += 1
 
-                        if dx < 2:
-                            right = grid[start_y + dy][start_x + dx + 1]
-                            if cell.walls['E'] or right.walls['W']:
-                                fully_open = False
-                                break
+            if direction == 'E':
+                rows = range(y - 2, y + 1)
+                cols = 0b11 << (x - 1) if x > 0 else 0b1
+            else:
+                rows = range(y - 1, y + 1)
+                cols = 0b111 << (x - 2) if x > 1 else (1 << (x + 1)) - 1
 
-                        if dy < 2:
-                            bottom = grid[start_y + dy + 1][start_x + dx]
-                            if cell.walls['S'] or bottom.walls['N']:
-                                fully_open = False
-                                break
+            for broken_y in rows:
+                if 0 <= broken_y < len(windows):
+                    windows[broken_y] &= ~cols
 
-                    if not fully_open:
-                        break
+    return fixed
 
-                if not fully_open:
-                    continue
 
-                edges = []
+def fix_large_holes(
+        grid: Sequence[Sequence[Cell]], rng: random.Random | None = None
+        ) -> int:
+    """
+    Detects fully open 3x3 regions in the maze and closes one random internal
+    wall within them.
 
-                for dy in range(3):
-                    for dx in range(3):
-                        x = start_x + dx
-                        y = start_y + dy
-                        cell = grid[y][x]
+    A 3x3 region is considered fully open if every adjacent cell pair within it
+    shares an open passage (no walls between them) and no cell
+    carries a pattern. Closing a random internal wall breaks the
+    open region while preserving overall maze connectivity.
 
-                        if dx < 2:
-                            right = grid[y][x + 1]
-                            if not cell.walls['E']:
-                                edges.append((cell, right, 'E'))
+    All open regions are found in a single pass (find_open_windows), after
+    which each closed wall only re-checks the regions it touches. Can be run
+    on any grid, including a BitGrid backed GridView.
 
-                        if dy < 2:
-                            bottom = grid[y + 1][x]
-                            if not cell.walls['S']:
-                                edges.append((cell, bottom, 'S'))
+    Args:
+        grid: 2D list of Cell objects representing the maze.
+        rng: Random source picking the walls to close, a fresh
+             unseeded one if omitted.
 
-                if not edges:
-                    continue
+    Returns:
+        Number of holes fixed.
+    """
+    from . import bitgrid
 
-                cell, neighbor, direction = random.choice(edges)
+    if rng is None:
+        rng = random.Random()
 
-                if direction == 'E':
-                    cell.walls['E'] = True
-                    neighbor.walls['W'] = True
-                else:
-                    cell.walls['S'] = True
-                    neighbor.walls['N'] = True
+    if isinstance(grid, bitgrid.GridView):
+        return bitgrid.fix_large_holes(grid.bits, rng)
 
-                changed = True
+    height = len(grid)
+    width = len(grid[0])
+    east_open = []
+    south_open = []
+
+    for y in range(height):
+        row = grid[y]
+        below = grid[y + 1] if y < height - 1 else None
+        east_flags = bytearray(b'0') * width
+        south_flags = bytearray(b'0') * width
+
+        for x in range(width):
+            cell = row[x]
+            if cell.pattern:
+                continue
+
+            if x < width - 1:
+                right = row[x + 1]
+                if not (right.pattern or cell.walls['E'] or right.walls['W']):
+                    east_flags[x] = ord('1')
+
+            if below is not None:
+                bottom = below[x]
+                if not (
+                    bottom.pattern or cell.walls['S'] or bottom.walls['N']
+                        ):
+                    south_flags[x] = ord('1')
+
+        east_open.append(row_mask(east_flags))
+        south_open.append(row_mask(south_flags))
+
+    def close_wall(x: int, y: int, direction: str) -> None:
+        cell = grid[y][x]
+        if direction == 'E':
+            cell.walls['E'] = True
+            grid[y][x + 1].walls['W'] = True
+        else:
+            cell.walls['S'] = True
+            grid[y + 1][x].walls['N'] = True
+
+    windows = find_open_windows(east_open, south_open, width)
+    return close_open_windows(windows, close_wall, rng)
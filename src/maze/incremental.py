@@ -0,0 +1,174 @@
+from array import array
+from collections.abc import Sequence
+import heapq
+
+from .generator import Cell
+from .generator_utils import set_wall_between
+from .maze_solver import SolveResult, find_endpoints, index_neighbors
+
+
+class IncrementalSolver:
+    """
+    Shortest path between two cells of a maze, kept up to date while
+    walls are opened and closed.
+
+    Lifelong Planning A* (Koenig and Likhachev): every cell keeps its
+    distance from start (g) next to a one step lookahead (rhs, one more
+    than its best open neighbour). A wall edit only changes the rhs of
+    the two cells next to it, and the next solve repairs the distances
+    that follow from those, in A* order (Manhattan distance to goal),
+    stopping as soon as the goal is settled. Edits away from the path
+    cost next to nothing, edits on it cost about the area whose
+    distances they change instead of a whole new search.
+
+    The first solve does the work of one A* over the maze. Walls must
+    change through set_wall, or be reported with wall_changed.
+
+    Attributes:
+        start: Index (y * width + x) of the start cell.
+        goal: Index of the goal cell.
+        g: Distance from start per cell, INF if not known.
+        rhs: One step lookahead of g per cell.
+    """
+
+    # Distance of cells that cannot be reached
+    INF = 2 ** 31 - 1
+
+    def __init__(
+            self, grid: Sequence[Sequence[Cell]],
+            start: Cell | None = None, goal: Cell | None = None
+            ) -> None:
+        """
+        Args:
+            grid: The maze, CELL or BITPLANE backed.
+            start: Entry cell, the marked one if not given.
+            goal: Exit cell, the marked one if not given.
+
+        Raises:
+            ValueError: If the grid has no start or goal.
+        """
+        if start is None or goal is None:
+            marked_start, marked_goal = find_endpoints(grid)
+            start = start if start is not None else marked_start
+            goal = goal if goal is not None else marked_goal
+        if start is None or goal is None:
+            raise ValueError("Grid has no start or goal")
+
+        w = len(grid[0])
+        size = w * len(grid)
+        self.grid = grid
+        self.width = w
+        self.neighbors = index_neighbors(grid)
+        self.start = start.y * w + start.x
+        self.goal = goal.y * w + goal.x
+        self.g = array('l', [self.INF]) * size
+        self.rhs = array('l', [self.INF]) * size
+        self.rhs[self.start] = 0
+        self.open_heap: list[tuple[int, int, int]] = []
+        self._push(self.start)
+
+    def _key(self, i: int) -> tuple[int, int]:
+        w = self.width
+        best = min(self.g[i], self.rhs[i])
+        h = abs(i % w - self.goal % w) + abs(i // w - self.goal // w)
+        return best + h, best
+
+    def _push(self, i: int) -> None:
+        k1, k2 = self._key(i)
+        heapq.heappush(self.open_heap, (k1, k2, i))
+
+    def _update(self, i: int) -> None:
+        """
+        Recompute the rhs of cell i and queue it when it no longer
+        matches g. Entries are never removed from the heap, outdated
+        ones are skipped or requeued when popped.
+        """
+        if i != self.start:
+            g = self.g
+            best = self.INF
+            for n in self.neighbors(i):
+                if g[n] < best:
+                    best = g[n]
+            self.rhs[i] = best + 1 if best < self.INF else self.INF
+        if self.g[i] != self.rhs[i]:
+            self._push(i)
+
+    def wall_changed(self, a: Cell, b: Cell) -> None:
+        """
+        Tell the solver the wall between adjacent cells a and b was
+        opened or closed.
+        """
+        w = self.width
+        self._update(a.y * w + a.x)
+        self._update(b.y * w + b.x)
+
+    def set_wall(self, a: Cell, b: Cell, closed: bool) -> None:
+        """
+        Open or close the wall between adjacent cells a and b, on both
+        sides (see generator_utils.set_wall_between).
+
+        Raises:
+            ValueError: If a and b are not adjacent.
+        """
+        set_wall_between(a, b, closed)
+        self.wall_changed(a, b)
+
+    def solve(self) -> SolveResult:
+        """
+        Bring the distances up to date and return the path.
+
+        Returns:
+            A shortest path from start to goal, as a SolveResult whose
+            expanded counts the cells settled by this call only. Where
+            several shortest paths exist it may differ from the one
+            solve_maze finds.
+        """
+        g = self.g
+        rhs = self.rhs
+        goal = self.goal
+        neighbors = self.neighbors
+        open_heap = self.open_heap
+        update = self._update
+        expanded = 0
+
+        while open_heap:
+            k1, k2, i = open_heap[0]
+            if (k1, k2) >= self._key(goal) and rhs[goal] == g[goal]:
+                break
+
+            heapq.heappop(open_heap)
+            if g[i] == rhs[i]:
+                continue
+            key = self._key(i)
+            if (k1, k2) < key:
+                heapq.heappush(open_heap, (key[0], key[1], i))
+                continue
+
+            expanded += 1
+            if g[i] > rhs[i]:
+                g[i] = rhs[i]
+            else:
+                g[i] = self.INF
+                update(i)
+            for n in neighbors(i):
+                update(n)
+
+        return self._path(expanded)
+
+    def _path(self, expanded: int) -> SolveResult:
+        """
+        Walk down the distances from goal to start.
+        """
+        g = self.g
+        neighbors = self.neighbors
+        current = self.goal
+        if g[current] >= self.INF:
+            return SolveResult([], '', expanded)
+
+        indices = [current]
+        while current != self.start:
+            lower = g[current] - 1
+            current = next(n for n in neighbors(current) if g[n] == lower)
+            indices.append(current)
+        indices.reverse()
+        return SolveResult.from_indices(self.grid, indices, expanded)
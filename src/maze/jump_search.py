@@ -0,0 +1,259 @@
+from array import array
+from collections.abc import Sequence
+import heapq
+
+from .generator import Cell
+from .maze_solver import SolveResult, index_neighbors
+
+
+# Sides as 0-3 in DIRECTIONS order (N, E, S, W), with the bit of each
+# side in a cell's open sides mask
+OPEN_BITS = (1, 2, 4, 8)
+STRAIGHT_NS = OPEN_BITS[0] | OPEN_BITS[2]
+STRAIGHT_EW = OPEN_BITS[1] | OPEN_BITS[3]
+
+# What a jump moving towards side d does on reaching a cell with open
+# sides mask, at index mask * 4 + d: the side it turns to in a corner,
+# STOP where the search has a choice, DEAD in a dead end
+STOP = -1
+DEAD = -2
+
+
+def _turn_table() -> list[int]:
+    table = []
+    for mask in range(16):
+        for d in range(4):
+            back = OPEN_BITS[(d + 2) % 4]
+            others = [
+                side for side in range(4)
+                if mask & OPEN_BITS[side] and OPEN_BITS[side] != back
+            ]
+            if mask == back:
+                table.append(DEAD)
+            elif len(others) == 1 and mask & back and others[0] != d:
+                table.append(others[0])
+            else:
+                table.append(STOP)
+    return table
+
+
+TURNS = _turn_table()
+
+
+class JumpSearch:
+    """
+    A* that leaps along corridors instead of stepping through them.
+
+    A cell whose only open sides are opposite each other can only be
+    passed straight through, so for every cell and side the number of
+    steps to the end of the straight run is counted once in O(n). The
+    search jumps to the end of a run in one step, and when the run ends
+    in a corner it turns and jumps on, until it reaches a cell where it
+    has a choice (a junction or an open area). Runs that end in a dead
+    end are dropped, unless the goal is on them. Only the cells where
+    jumps end are ever put on the heap.
+
+    A jump costs the steps it covers, never less than the Manhattan
+    distance between its ends, so the Manhattan heuristic stays
+    consistent and the path is as short as the one solve_maze finds.
+    Where several shortest paths exist the two may pick different ones.
+
+    Attributes:
+        opened: Open sides mask per cell (OPEN_BITS).
+        runs: Steps to the end of the straight run per side, in
+              N, E, S, W order, each indexed y * width + x.
+    """
+
+    def __init__(self, grid: Sequence[Sequence[Cell]]) -> None:
+        w = len(grid[0])
+        size = w * len(grid)
+        self.grid = grid
+        self.width = w
+        self.offsets = (-w, 1, w, -1)
+
+        neighbors = index_neighbors(grid)
+        # Vertical last, they win when the grid is 1 cell wide
+        bits = {-1: OPEN_BITS[3], 1: OPEN_BITS[1],
+                -w: OPEN_BITS[0], w: OPEN_BITS[2]}
+        opened = bytearray(size)
+        for i in range(size):
+            mask = 0
+            for n in neighbors(i):
+                mask |= bits[n - i]
+            opened[i] = mask
+        self.opened = opened
+
+        run_n = array('l', [0]) * size
+        run_e = array('l', [0]) * size
+        run_s = array('l', [0]) * size
+        run_w = array('l', [0]) * size
+
+        # A run goes on through the next cell while that cell is a
+        # straight corridor in the same direction. North and west
+        # runs build on the cell before, south and east on the cell
+        # after
+        for i in range(size):
+            mask = opened[i]
+            if mask & OPEN_BITS[0]:
+                run_n[i] = (run_n[i - w] + 1
+                            if opened[i - w] == STRAIGHT_NS else 1)
+            if mask & OPEN_BITS[3]:
+                run_w[i] = (run_w[i - 1] + 1
+                            if opened[i - 1] == STRAIGHT_EW else 1)
+        for i in range(size - 1, -1, -1):
+            mask = opened[i]
+            if mask & OPEN_BITS[2]:
+                run_s[i] = (run_s[i + w] + 1
+                            if opened[i + w] == STRAIGHT_NS else 1)
+            if mask & OPEN_BITS[1]:
+                run_e[i] = (run_e[i + 1] + 1
+                            if opened[i + 1] == STRAIGHT_EW else 1)
+        self.runs = (run_n, run_e, run_s, run_w)
+
+        # Search state, reused by every solve like SolverWorkspace:
+        # entries are only valid when state holds the current stamp
+        self.g = array('l', [0]) * size
+        self.came = array('l', [0]) * size
+        self.came_side = bytearray(size)
+        # 2 * run: in the open set, 2 * run + 1: closed
+        self.state = array('L', [0]) * size
+        self.run = 0
+
+    def _jump(
+            self, i: int, d: int, target: int,
+            cells: list[int] | None = None
+            ) -> tuple[int, int]:
+        """
+        Jump from cell i out of side d, along straight runs and around
+        corners, stopping early on target.
+
+        Args:
+            i: Cell to jump from.
+            d: Side to leave it by, must be open.
+            target: Goal cell index.
+            cells: If given, the cells passed are appended to it.
+
+        Returns:
+            The cell the jump ends on, -1 for a dead end, and the steps
+            it took.
+        """
+        w = self.width
+        runs = self.runs
+        offsets = self.offsets
+        opened = self.opened
+        target_row, target_col = divmod(target, w)
+        total = 0
+        current = i
+
+        while True:
+            steps = runs[d][current]
+            step = offsets[d]
+            if (current // w == target_row if d & 1
+                    else current % w == target_col):
+                to_goal = (target - current) // step
+                if 0 < to_goal <= steps:
+                    steps = to_goal
+
+            if cells is not None:
+                cells.extend(range(
+                    current + step, current + (steps + 1) * step, step
+                ))
+            current += steps * step
+            total += steps
+            if current == target or current == i:
+                return current, total
+
+            turn = TURNS[opened[current] * 4 + d]
+            if turn == STOP:
+                return current, total
+            if turn == DEAD:
+                return -1, total
+            d = turn
+
+    def solve(self, start: Cell, goal: Cell) -> SolveResult:
+        """
+        Shortest path from start to goal, jumping along corridors.
+
+        Start and goal may lie anywhere, in the middle of a corridor
+        too: jumps start from the start cell and stop on the goal.
+
+        Returns:
+            The path as a SolveResult, expanded counts the cells taken
+            off the open set (jump ends).
+        """
+        w = self.width
+        g = self.g
+        came = self.came
+        came_side = self.came_side
+        state = self.state
+        runs = self.runs
+        jump = self._jump
+        self.run += 1
+        opened_stamp = 2 * self.run
+        closed = opened_stamp + 1
+
+        goal_x, goal_y = goal.x, goal.y
+        first = start.y * w + start.x
+        target = goal_y * w + goal_x
+        g[first] = 0
+        state[first] = opened_stamp
+        inserted = 1
+        expanded = 0
+        open_heap = [(abs(start.x - goal_x) + abs(start.y - goal_y), 0, first)]
+
+        while open_heap:
+            _, _, current = heapq.heappop(open_heap)
+            if state[current] == closed:
+                continue
+
+            state[current] = closed
+            expanded += 1
+            if current == target:
+                return SolveResult.from_indices(
+                    self.grid, self._cells(first, target), expanded
+                )
+
+            # Sides in get_neighbors order (N, S, W, E)
+            for d in (0, 2, 3, 1):
+                if not runs[d][current]:
+                    continue
+
+                neighbor, steps = jump(current, d, target)
+                if neighbor < 0:
+                    continue
+                seen = state[neighbor]
+                if seen == closed:
+                    continue
+
+                tentative_g = g[current] + steps
+                if seen == opened_stamp and tentative_g >= g[neighbor]:
+                    continue
+
+                state[neighbor] = opened_stamp
+                g[neighbor] = tentative_g
+                came[neighbor] = current
+                came_side[neighbor] = d
+                ny, nx = divmod(neighbor, w)
+                heapq.heappush(open_heap, (
+                    tentative_g + abs(nx - goal_x) + abs(ny - goal_y),
+                    inserted, neighbor
+                ))
+                inserted += 1
+
+        return SolveResult([], '', expanded)
+
+    def _cells(self, first: int, target: int) -> list[int]:
+        """
+        Cell indices from first to target, repeating the jumps between
+        consecutive jump ends to fill in the cells passed.
+        """
+        jumps = []
+        current = target
+        while current != first:
+            jumps.append((self.came[current], self.came_side[current]))
+            current = self.came[current]
+
+        indices = [first]
+        for i, d in reversed(jumps):
+            self._jump(i, d, target, indices)
+        return indices
@@ -0,0 +1,333 @@
+from array import array
+from collections.abc import Sequence
+import heapq
+
+from .generator import Cell
+from .maze_solver import SolveResult, find_endpoints, index_neighbors
+
+
+class JunctionGraph:
+    """
+    The maze with its corridors contracted, for fast repeated solving.
+
+    Most cells of a maze have exactly two open sides and can only be
+    passed straight through. The other cells (junctions, dead ends) and
+    the entry and exit are the nodes of a weighted graph, and every
+    corridor between two nodes is one edge whose weight is its length
+    in steps. The cells of each corridor are stored in order, so a path
+    found on the graph expands back to cells.
+
+    Built once in O(n) from the same open neighbours as
+    maze_solver.get_neighbors (via index_neighbors). Queries run A* on
+    the graph, which has far fewer nodes than the maze has cells, and
+    may start or end inside a corridor.
+
+    Attributes:
+        node_cells: Cell index (y * width + x) of every node.
+        links: Per node, (other node, weight, edge) for every edge.
+        ends: The (first, last) node of every edge.
+        runs: The corridor cells of every edge, from first to last.
+    """
+
+    def __init__(self, grid: Sequence[Sequence[Cell]]) -> None:
+        w = len(grid[0])
+        size = w * len(grid)
+        self.grid = grid
+        self.width = w
+        self.neighbors = index_neighbors(grid)
+        # Per cell: its node, or the edge it lies on and its offset
+        # in that edge's run
+        self.node = array('l', [-1]) * size
+        self.edge = array('l', [-1]) * size
+        self.offset = array('l', [0]) * size
+        self.node_cells: list[int] = []
+        self.links: list[list[tuple[int, int, int]]] = []
+        self.ends: list[tuple[int, int]] = []
+        self.runs: list[array] = []
+
+        neighbors = self.neighbors
+        for i in range(size):
+            if len(neighbors(i)) != 2:
+                self._add_node(i)
+        for endpoint in find_endpoints(grid):
+            if endpoint is not None:
+                self._add_node(endpoint.y * w + endpoint.x)
+
+        for u in range(len(self.node_cells)):
+            self._walk_from(u)
+
+        # Rings of corridor cells without any node on them
+        for i in range(size):
+            if self.node[i] < 0 and self.edge[i] < 0:
+                self._walk_from(self._add_node(i))
+
+        self.toward = self._prune_dead_ends()
+
+        # Search state per node, reused by every solve like
+        # maze_solver.SolverWorkspace: entries are only valid when
+        # state holds the stamp of the current solve
+        nodes = len(self.node_cells)
+        self.node_x = array('l', (i % w for i in self.node_cells))
+        self.node_y = array('l', (i // w for i in self.node_cells))
+        self.g = array('l', [0]) * nodes
+        self.came_node = array('l', [0]) * nodes
+        self.came_edge = array('l', [0]) * nodes
+        # 2 * run: reached, 2 * run + 1: closed
+        self.state = array('L', [0]) * nodes
+        self.run = 0
+
+    def _prune_dead_ends(self) -> array:
+        """
+        Peel off the branches that hang off the rest of the graph by a
+        single node, the way dead-end filling does, leaving the loops.
+
+        Returns:
+            Per node, the next node towards the loops for pruned nodes,
+            -1 for the others. A search only needs to go down a pruned
+            branch when the goal is in it.
+        """
+        links = self.links
+        toward = array('l', [-1]) * len(links)
+        degree = array('l', (len(node_links) for node_links in links))
+        leaves = [u for u in range(len(links)) if degree[u] == 1]
+
+        while leaves:
+            u = leaves.pop()
+            if degree[u] != 1:
+                continue
+
+            degree[u] = 0
+            for v, _, _ in links[u]:
+                if degree[v]:
+                    toward[u] = v
+                    degree[v] -= 1
+                    if degree[v] == 1:
+                        leaves.append(v)
+                    break
+
+        return toward
+
+    def _add_node(self, i: int) -> int:
+        if self.node[i] < 0:
+            self.node[i] = len(self.node_cells)
+            self.node_cells.append(i)
+            self.links.append([])
+        return self.node[i]
+
+    def _walk_from(self, u: int) -> None:
+        """
+        Follow every corridor leaving node u to the node at its other
+        end, and add the edges not found from that end yet.
+        """
+        node = self.node
+        edge = self.edge
+        neighbors = self.neighbors
+        start = self.node_cells[u]
+
+        for first in neighbors(start):
+            if node[first] >= 0:
+                # Adjacent nodes, added once from the lower one
+                if u < node[first]:
+                    self._add_edge(u, node[first], array('l'))
+                continue
+            if edge[first] >= 0:
+                continue
+
+            run = array('l')
+            prev = start
+            cell = first
+            while node[cell] < 0:
+                run.append(cell)
+                a, b = neighbors(cell)
+                prev, cell = cell, b if a == prev else a
+            self._add_edge(u, node[cell], run)
+
+    def _add_edge(self, u: int, v: int, run: array) -> None:
+        e = len(self.ends)
+        for k, cell in enumerate(run):
+            self.edge[cell] = e
+            self.offset[cell] = k
+
+        weight = len(run) + 1
+        self.ends.append((u, v))
+        self.runs.append(run)
+        self.links[u].append((v, weight, e))
+        self.links[v].append((u, weight, e))
+
+    def _attach(self, i: int) -> list[tuple[int, int, int]]:
+        """
+        The nodes cell i can reach directly, as (node, steps, side)
+        with side 0 for the first end of its edge, 1 for the last.
+        """
+        if self.node[i] >= 0:
+            return [(self.node[i], 0, 0)]
+
+        e = self.edge[i]
+        k = self.offset[i]
+        first, last = self.ends[e]
+        return [(first, k + 1, 0), (last, len(self.runs[e]) - k, 1)]
+
+    def _corridor(self, i: int, side: int) -> list[int]:
+        """
+        Cells from corridor cell i to the node at the given end of its
+        edge, both included.
+        """
+        e = self.edge[i]
+        k = self.offset[i]
+        run = self.runs[e]
+        cells = list(run[k::-1]) if side == 0 else list(run[k:])
+        cells.append(self.node_cells[self.ends[e][side]])
+        return cells
+
+    def solve(self, start: Cell, goal: Cell) -> SolveResult:
+        """
+        Shortest path from start to goal, found with A* on the graph.
+
+        Edge weights are never below the Manhattan distance between
+        their ends, so the Manhattan heuristic stays admissible and the
+        path is as short as the one solve_maze finds. Where several
+        shortest paths exist the two may pick different ones.
+
+        Branches removed by _prune_dead_ends are only entered on the
+        way to the goal.
+
+        Returns:
+            The path as a SolveResult, expanded counts graph nodes.
+        """
+        w = self.width
+        s = start.y * w + start.x
+        t = goal.y * w + goal.x
+        goal_x, goal_y = goal.x, goal.y
+        node_x = self.node_x
+        node_y = self.node_y
+        links = self.links
+        toward = self.toward
+        g = self.g
+        came_node = self.came_node
+        came_edge = self.came_edge
+        state = self.state
+        self.run += 1
+        reached = 2 * self.run
+        closed = reached + 1
+
+        # Best complete path so far: its length, and the node it
+        # leaves the graph at (-1: straight along a shared corridor)
+        best = float('inf')
+        best_node = -1
+        if s == t:
+            best = 0
+        elif self.node[s] < 0 and self.edge[s] == self.edge[t]:
+            best = abs(self.offset[s] - self.offset[t])
+
+        # Nodes next to the goal, with the steps left and the side of
+        # the goal's corridor they are on
+        targets: dict[int, tuple[int, int]] = {}
+        for n, steps, side in self._attach(t):
+            if steps < targets.get(n, (steps + 1, 0))[0]:
+                targets[n] = (steps, side)
+
+        # Pruned nodes between the goal and the loops
+        goal_branch = set()
+        for n in targets:
+            while n >= 0 and n not in goal_branch:
+                goal_branch.add(n)
+                n = toward[n]
+
+        open_heap: list[tuple[int, int, int]] = []
+        for n, steps, side in self._attach(s):
+            if state[n] != reached or steps < g[n]:
+                state[n] = reached
+                g[n] = steps
+                # Sources remember the side of the corridor they came
+                # from, as a negative edge
+                came_node[n] = -1
+                came_edge[n] = -1 - side
+                heapq.heappush(open_heap, (
+                    steps + abs(node_x[n] - goal_x)
+                    + abs(node_y[n] - goal_y),
+                    len(open_heap), n
+                ))
+
+        expanded = 0
+        inserted = len(open_heap)
+        while open_heap:
+            f, _, u = heapq.heappop(open_heap)
+            if f >= best:
+                break
+            if state[u] == closed:
+                continue
+
+            state[u] = closed
+            expanded += 1
+            if u in targets:
+                steps = g[u] + targets[u][0]
+                if steps < best:
+                    best = steps
+                    best_node = u
+
+            up = toward[u]
+            for v, weight, e in links[u]:
+                if toward[v] >= 0 and v != up and v not in goal_branch:
+                    continue
+
+                tentative_g = g[u] + weight
+                seen = state[v]
+                if seen == closed or (
+                        seen == reached and tentative_g >= g[v]):
+                    continue
+
+                state[v] = reached
+                g[v] = tentative_g
+                came_node[v] = u
+                came_edge[v] = e
+                heapq.heappush(open_heap, (
+                    tentative_g + abs(node_x[v] - goal_x)
+                    + abs(node_y[v] - goal_y),
+                    inserted, v
+                ))
+                inserted += 1
+
+        if best == float('inf'):
+            return SolveResult([], '', expanded)
+        return SolveResult.from_indices(
+            self.grid, self._expand(s, t, best_node, targets), expanded
+        )
+
+    def _expand(
+            self, s: int, t: int, last: int,
+            targets: dict[int, tuple[int, int]]
+            ) -> list[int]:
+        """
+        Cell indices of the path from s to t that leaves the graph at
+        node last (-1 when s and t share a corridor).
+        """
+        if last < 0:
+            if s == t:
+                return [s]
+            run = self.runs[self.edge[s]]
+            a = self.offset[s]
+            b = self.offset[t]
+            if a <= b:
+                return list(run[a:b + 1])
+            return list(run[b:a + 1])[::-1]
+
+        hops = []
+        n = last
+        while self.came_node[n] >= 0:
+            prev = self.came_node[n]
+            hops.append((prev, self.came_edge[n], n))
+            n = prev
+        hops.reverse()
+
+        side = -1 - self.came_edge[n]
+        cells = self._corridor(s, side) if self.node[s] < 0 else [s]
+        for u, e, v in hops:
+            run = self.runs[e]
+            cells.extend(run if self.ends[e][0] == u else reversed(run))
+            cells.append(self.node_cells[v])
+
+        if self.node[t] < 0:
+            back = self._corridor(t, targets[last][1])
+            back.reverse()
+            cells.extend(back[1:])
+        return cells
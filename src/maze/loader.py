@@ -0,0 +1,280 @@
+from collections.abc import Sequence
+from typing import Any, BinaryIO
+
+from . import bitgrid
+from .bitgrid import WALL_BITS, BitGrid
+from .generator import Cell
+from .maze_solver import SolveResult
+from .packed import (
+    EAST_WALL, FULLY_CLOSED, PACKED_MAGIC, SOUTH_WALL, PackedMaze
+)
+
+
+# Hex digit (either case) to its tile index, anything else to INVALID
+INVALID = 255
+HEX_VALUES = bytes(
+    int(chr(b), 16) if chr(b) in '0123456789abcdefABCDEF' else INVALID
+    for b in range(256)
+)
+
+# Tile index to its north and west walls as 0/1 plane bytes
+NORTH_WALL = bytes(b & 1 for b in range(256))
+WEST_WALL = bytes(b >> 3 & 1 for b in range(256))
+
+# Bytes of hex rows read from the file at a time
+READ_BLOCK = 1 << 22
+
+
+class _PlaneBuilder:
+    """
+    Collects the tile indices of a grid block by block into the east
+    and south planes of a BitGrid, checking every block against the
+    rows before it.
+    """
+
+    def __init__(self, width: int) -> None:
+        self.width = width
+        self.height = 0
+        self.east = bytearray()
+        self.south = bytearray()
+        self.pattern = bytearray()
+
+    def add(self, tiles: bytes) -> None:
+        """
+        Add whole rows of tile indices.
+
+        Raises:
+            ValueError: If two neighbours disagree about the wall
+                        between them, or a cell is open to the outside.
+        """
+        w = self.width
+        east = tiles.translate(EAST_WALL)
+        south = tiles.translate(SOUTH_WALL)
+        above = self.south[-w:] if self.height else b'\x01' * w
+
+        # The west and north sides must be the east and south walls of
+        # the neighbours, or closed on the border, exactly as
+        # bitgrid.tile_indices builds them
+        west = bytearray(b'\x01') + east[:-1]
+        west[::w] = b'\x01' * (len(tiles) // w)
+        north = bytes(above) + south[:-w]
+        self._check(tiles.translate(WEST_WALL), bytes(west), 'W')
+        self._check(tiles.translate(NORTH_WALL), north, 'N')
+        self._check(east[w - 1::w], b'\x01' * (len(tiles) // w), 'E', w)
+
+        self.east += east
+        self.south += south
+        self.pattern += tiles.translate(FULLY_CLOSED)
+        self.height += len(tiles) // w
+
+    def _check(
+            self, found: bytes, expected: bytes, side: str, stride: int = 1
+            ) -> None:
+        if found == expected:
+            return
+
+        i = next(k for k, (a, b) in enumerate(zip(found, expected)) if a != b)
+        y, x = divmod(i * stride + stride - 1, self.width)
+        y += self.height
+        if side == 'E' or (side == 'W' and x == 0) or (
+                side == 'N' and y == 0):
+            raise ValueError(f"Cell ({x},{y}) is open on the maze border")
+        raise ValueError(
+            f"Cell ({x},{y}) and its {side} neighbour disagree on the wall "
+            f"between them"
+        )
+
+    def finish(self) -> BitGrid:
+        """
+        The collected grid as a BitGrid, every cell visited and cells
+        with all four walls closed marked as pattern cells.
+
+        Raises:
+            ValueError: If the grid is empty or open at the bottom.
+        """
+        w = self.width
+        if not self.height:
+            raise ValueError("Maze file has no grid")
+        if self.south[-w:] != b'\x01' * w:
+            x = self.south[-w:].index(0)
+            raise ValueError(
+                f"Cell ({x},{self.height - 1}) is open on the maze border"
+            )
+
+        bits = BitGrid(w, self.height)
+        bits.east = self.east
+        bits.south = self.south
+        bits.pattern = self.pattern
+        bits.visited[:] = b'\x01' * len(self.east)
+        return bits
+
+
+def _parse_point(line: bytes, bits: BitGrid, name: str) -> tuple[int, int]:
+    try:
+        x, y = (int(part) for part in line.split(b','))
+    except ValueError:
+        raise ValueError(f"Invalid {name} line: {line!r}")
+    if not (0 <= x < bits.width and 0 <= y < bits.height):
+        raise ValueError(f"{name} ({x},{y}) is outside the maze")
+    return x, y
+
+
+def _check_path(bits: BitGrid, directions: str) -> None:
+    """
+    Raises:
+        ValueError: If the path crosses a wall or does not end on the
+                    goal.
+    """
+    current = bits.start
+    for step, direction in enumerate(directions):
+        if direction not in WALL_BITS:
+            raise ValueError(f"Invalid direction {direction!r} in the path")
+        if bits.has_wall(current, direction):
+            raise ValueError(f"Path step {step} ({direction}) is blocked")
+        current += bits.step(direction)
+    if directions and current != bits.goal:
+        raise ValueError("Path does not end on the exit")
+
+
+def read_maze_hex(f: BinaryIO) -> tuple[BitGrid, str]:
+    """
+    Parse a maze in the format print_output_main writes: one line of
+    hex digits per row, a blank line, the entry and exit as x,y and
+    the path as a direction string (possibly empty).
+
+    The grid is read in blocks of about READ_BLOCK bytes of whole
+    lines. Each block is decoded with one bytes.translate through
+    HEX_VALUES, split into wall planes by more tables, and checked
+    against the rows before it, so no Python code runs per cell.
+
+    args:
+        f: File opened for binary reading.
+
+    returns:
+        The maze as a BitGrid with its entry and exit, and the path.
+
+    raises:
+        ValueError: If the file is malformed, neighbouring cells
+                    disagree on a wall, or the path is not valid.
+    """
+    # The first row gives the width every other row must have
+    first = f.readline()
+    w = len(first.rstrip(b'\r\n'))
+    if not w:
+        raise ValueError("Maze file has no grid")
+    builder = _PlaneBuilder(w)
+    lines = [first] + f.readlines(READ_BLOCK)
+    row = 0
+
+    while True:
+        done = False
+        rows = []
+        for line in lines:
+            digits = line.rstrip(b'\r\n')
+            if not digits:
+                done = True
+                break
+            if len(digits) != w:
+                raise ValueError(
+                    f"Row {row} has {len(digits)} cells, expected {w}"
+                )
+            rows.append(digits)
+            row += 1
+
+        tiles = b''.join(rows).translate(HEX_VALUES)
+        if INVALID in tiles:
+            k = tiles.index(INVALID)
+            raise ValueError(
+                f"Invalid hex digit in row {row - len(rows) + k // w}"
+            )
+        if tiles:
+            builder.add(tiles)
+        if done:
+            break
+
+        lines = f.readlines(READ_BLOCK)
+        if not lines:
+            raise ValueError("Maze file ends before the entry line")
+
+    rest = lines[len(rows) + 1:] + f.readlines()
+    rest = [line.rstrip(b'\r\n') for line in rest]
+    if len(rest) < 2:
+        raise ValueError("Maze file has no entry and exit lines")
+    bits = builder.finish()
+    entry = _parse_point(rest[0], bits, "Entry")
+    exit_pos = _parse_point(rest[1], bits, "Exit")
+    bits.mark_start_and_exit(entry, exit_pos)
+
+    directions = rest[2].decode('ascii', 'replace') if len(rest) > 2 else ''
+    _check_path(bits, directions)
+    return bits, directions
+
+
+def read_maze_packed(path: str) -> tuple[BitGrid, str]:
+    """
+    Same as read_maze_hex for a file in the packed binary format,
+    checked the same way.
+    """
+    with PackedMaze(path) as maze:
+        builder = _PlaneBuilder(maze.width)
+        rows = max(1, bitgrid.HEX_BLOCK_CELLS // maze.width)
+        for y in range(0, maze.height, rows):
+            builder.add(maze.row_tiles(y, min(y + rows, maze.height)))
+        bits = builder.finish()
+        bits.mark_start_and_exit(maze.entry, maze.exit)
+        directions = maze.directions()
+
+    _check_path(bits, directions)
+    return bits, directions
+
+
+def load_maze_file(
+        path: str, backend: str = 'CELL'
+        ) -> tuple[Sequence[Sequence[Cell]], SolveResult, dict[str, Any]]:
+    """
+    Load a maze written by print_output_main, in either OUTPUT_FORMAT,
+    to solve (solve_maze) or render it without generating it again.
+
+    args:
+        path: The output file.
+        backend: CELL for Cell objects, BITPLANE for a GridView.
+
+    returns:
+        The grid with its entry and exit marked, the stored path (empty
+        when the file has none, e.g. streamed mazes) and the config
+        entries the file records: WIDTH, HEIGHT, ENTRY, EXIT,
+        OUTPUT_FILE and OUTPUT_FORMAT.
+
+    raises:
+        ValueError: If the file is not a valid maze (see read_maze_hex).
+    """
+    with open(path, 'rb') as f:
+        packed = f.read(len(PACKED_MAGIC)) == PACKED_MAGIC
+        f.seek(0)
+        if not packed:
+            bits, directions = read_maze_hex(f)
+    if packed:
+        bits, directions = read_maze_packed(path)
+
+    grid: Sequence[Sequence[Cell]]
+    if backend == 'BITPLANE':
+        grid = bitgrid.GridView(bits)
+    else:
+        grid = bits.to_cells()
+
+    start_y, start_x = divmod(bits.start, bits.width)
+    goal_y, goal_x = divmod(bits.goal, bits.width)
+    recorded = {
+        'WIDTH': bits.width,
+        'HEIGHT': bits.height,
+        'ENTRY': (start_x, start_y),
+        'EXIT': (goal_x, goal_y),
+        'OUTPUT_FILE': path,
+        'OUTPUT_FORMAT': 'PACKED' if packed else 'HEX',
+    }
+    if not directions:
+        return grid, SolveResult([], '', 0), recorded
+    result = SolveResult.from_directions(
+        grid, grid[start_y][start_x], directions
+    )
+    return grid, result, recorded
@@ -1,5 +1,12 @@
 from .generator import Cell
+from . import bitgrid
+from .bitgrid import DIRECTIONS
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from itertools import chain
 from typing import Any
+import heapq
+import random
 
 
 """
@@ -51,7 +58,7 @@ def manhattan(a: Cell, b: Cell) -> Any:
     return abs(a.x - b.x) + abs(a.y - b.y)
 
 
-def get_neighbors(cell: Cell, maze: list[list[Cell]]) -> list[Cell]:
+def get_neighbors(cell: Cell, maze: Sequence[Sequence[Cell]]) -> list[Cell]:
     """
     Finds all neighbouring Cells to 'cell' inside grid
     (or maze) and returns them in a list.
@@ -71,31 +78,84 @@ def get_neighbors(cell: Cell, maze: list[list[Cell]]) -> list[Cell]:
     return neighbors
 
 
-def reconstruct_path(goal: Cell | None) -> None:
+def index_neighbors(
+        grid: Sequence[Sequence[Cell]]
+        ) -> Callable[[int], list[int]]:
     """
-    Goes over the path, starting at goal.
-    Finding parent until they reach start.
-    Start has no parent so current will be set
-    to None.
+    Same as get_neighbors on cell indices (y * width + x): returns a
+    function giving the open neighbours of a cell index, in the same
+    N, S, W, E order. BitGrid backed grids use their planes directly.
     """
-    current = goal
-    while current:
-        current.in_path = True
-        current = current.parent
+    if isinstance(grid, bitgrid.GridView):
+        return grid.bits.open_neighbors
 
+    w = len(grid[0])
+    walls = [cell.walls for row in grid for cell in row]
 
-def solve_maze(grid: list[list[Cell]]) -> None:
+    def open_neighbors(i: int) -> list[int]:
+        cell_walls = walls[i]
+        neighbors = []
+
+        if not cell_walls['N']:
+            neighbors.append(i - w)
+        if not cell_walls['S']:
+            neighbors.append(i + w)
+        if not cell_walls['W']:
+            neighbors.append(i - 1)
+        if not cell_walls['E']:
+            neighbors.append(i + 1)
+
+        return neighbors
+
+    return open_neighbors
+
+
+def _open_neighbors(
+        grid: Sequence[Sequence[Cell]]
+        ) -> Callable[[int], list[int]]:
     """
-    Uses A* pathfinding to solve the maze.
+    Same as index_neighbors, without building a table of every cell
+    first, for searches that may only touch a few of them.
+    """
+    if isinstance(grid, bitgrid.GridView):
+        return grid.bits.open_neighbors
 
-    Finds the shortest possible path from the start to
-    the goal cell by using Manhattan distance heuristic.
+    w = len(grid[0])
 
-    Modifies the cells by setting their parent and path.
+    def open_neighbors(i: int) -> list[int]:
+        cell_walls = grid[i // w][i % w].walls
+        neighbors = []
 
-    Args:
-        grid: A 2D list of Cell objects representing the maze structure.
+        if not cell_walls['N']:
+            neighbors.append(i - w)
+        if not cell_walls['S']:
+            neighbors.append(i + w)
+        if not cell_walls['W']:
+            neighbors.append(i - 1)
+        if not cell_walls['E']:
+            neighbors.append(i + 1)
+
+        return neighbors
+
+    return open_neighbors
+
+
+def find_endpoints(
+        grid: Sequence[Sequence[Cell]]
+        ) -> tuple[Cell | None, Cell | None]:
     """
+    Finds the start and goal cells of grid, None where missing.
+    """
+    if isinstance(grid, bitgrid.GridView):
+        bits = grid.bits
+        w = bits.width
+        return (
+            grid[bits.start // w][bits.start % w]
+            if bits.start >= 0 else None,
+            grid[bits.goal // w][bits.goal % w]
+            if bits.goal >= 0 else None,
+        )
+
     start: Cell | None = None
     goal: Cell | None = None
 
@@ -106,50 +166,693 @@ def solve_maze(grid: list[list[Cell]]) -> None:
             if cell.is_goal:
                 goal = cell
 
-    if start is None or goal is None:
-        return
+    return start, goal
 
-    # Reset any previous path
-    for row in grid:
-        for cell in row:
-            cell.in_path = False
-            cell.g = float('inf')
-            cell.f = float('inf')
-            cell.parent = None
 
-    open_set = []
-    closed_set = set()
+# Offset of the neighbour in each direction, in the order get_neighbors
+# visits them, and the direction that leads back from that neighbour
+STEPS = (('N', 0, -1, 'S'), ('S', 0, 1, 'N'),
+         ('W', -1, 0, 'E'), ('E', 1, 0, 'W'))
 
-    if start is None:
-        return None
-    start.g = 0
-    start.mhd = manhattan(start, goal)
-    start.f = start.g + start.mhd
 
-    open_set.append(start)
+# Mean open sides per cell below which solve_maze searches from both
+# ends: A* goes straight for the goal through a maze with many loops,
+# while in a near perfect maze it ends up covering most of the cells
+BIDIRECTIONAL_MAX_DEGREE = 2.5
+DEGREE_SAMPLES = 512
+
+
+def mean_degree(
+        grid: Sequence[Sequence[Cell]], samples: int = DEGREE_SAMPLES
+        ) -> float:
+    """
+    Mean number of open sides per cell, estimated from a fixed set of
+    cells picked with a seeded RNG (every cell for small grids), so the
+    same maze gives the same estimate on both backends.
+
+    A perfect maze is close to 2, every extra passage adds to it.
+    """
+    height = len(grid)
+    w = len(grid[0])
+    size = w * height
+    if size <= samples:
+        indices: Iterable[int] = range(size)
+    else:
+        rng = random.Random(size)
+        indices = [rng.randrange(size) for _ in range(samples)]
+
+    open_sides = 0
+    count = 0
+    for i in indices:
+        walls = grid[i // w][i % w].walls
+        open_sides += 4 - sum(walls.values())
+        count += 1
+    return open_sides / count
+
+
+class SolveResult:
+    """
+    Shortest path found by solve_maze.
+
+    Attributes:
+        path: Cells from entry to exit, empty if the exit
+              cannot be reached.
+        directions: One of N/E/S/W per step along the path,
+                    as written to the output file.
+        length: Number of steps on the path.
+        expanded: Number of cells the search took off its open set,
+                  or walked along the tree for TreeIndex queries.
+    """
 
-    while open_set:
-        # look for the cell with the lowest f
-        current = min(open_set, key=lambda c: c.f)
+    def __init__(
+            self, path: list[Cell], directions: str, expanded: int
+            ) -> None:
+        self.path = path
+        self.directions = directions
+        self.length = len(directions)
+        self.expanded = expanded
+
+    @classmethod
+    def from_directions(
+            cls, grid: Sequence[Sequence[Cell]], start: Cell,
+            directions: str, expanded: int = 0
+            ) -> "SolveResult":
+        """
+        Rebuild the path cells by walking directions from start.
+        """
+        offsets = {name: (dx, dy) for name, dx, dy, _ in STEPS}
+        x, y = start.x, start.y
+        path = [start]
+
+        for direction in directions:
+            dx, dy = offsets[direction]
+            x += dx
+            y += dy
+            path.append(grid[y][x])
+
+        return cls(path, directions, expanded)
+
+    @classmethod
+    def from_indices(
+            cls, grid: Sequence[Sequence[Cell]], indices: list[int],
+            expanded: int = 0
+            ) -> "SolveResult":
+        """
+        Build the result for a path given as cell indices
+        (y * width + x).
+        """
+        w = len(grid[0])
+        # Vertical steps last, they win when the grid is 1 cell wide
+        steps = {-1: 'W', 1: 'E', -w: 'N', w: 'S'}
+        directions = ''.join(
+            steps[b - a] for a, b in zip(indices, indices[1:])
+        )
+        path = [grid[i // w][i % w] for i in indices]
+        return cls(path, directions, expanded)
+
+
+class TreeIndex:
+    """
+    Path queries on a perfect maze, where the open cells form a tree
+    and the path between any two cells is unique.
 
-        if current == goal:
-            reconstruct_path(goal)
-            return
+    Built once in O(n) by a BFS that stores the parent and depth of
+    every cell, plus one jump pointer per cell (Myers' skew-binary
+    scheme), which reaches any ancestor in O(log n) steps with O(1)
+    memory per cell, unlike a binary lifting table. Cells cut off from
+    the rest (pattern cells) become trees of their own.
 
-        open_set.remove(current)
-        closed_set.add(current)
+    Cells are given as Cells or CellViews of the indexed grid.
+    """
 
-        for neighbor in get_neighbors(current, grid):
-            if neighbor in closed_set:
+    def __init__(
+            self, grid: Sequence[Sequence[Cell]], parent: array,
+            depth: array, jump: array
+            ) -> None:
+        self.grid = grid
+        self.width = len(grid[0])
+        self.parent = parent
+        self.depth = depth
+        self.jump = jump
+
+    @classmethod
+    def build(
+            cls, grid: Sequence[Sequence[Cell]], root: Cell | None = None
+            ) -> "TreeIndex | None":
+        """
+        Index grid, rooted at root (or the first cell).
+
+        Returns:
+            The index, or None if the open cells contain a loop, i.e.
+            the maze is not perfect. The BFS stops at the first loop,
+            so imperfect mazes are rejected after a few cells.
+        """
+        w = len(grid[0])
+        size = w * len(grid)
+        neighbors = index_neighbors(grid)
+        parent = array('l', [-1]) * size
+        depth = array('l', [-1]) * size
+        jump = array('l', [0]) * size
+
+        first = root.y * w + root.x if root is not None else 0
+        for top in chain((first,), range(size)):
+            if depth[top] >= 0:
                 continue
 
-            tentative_g = current.g + 1
-            if neighbor not in open_set:
-                open_set.append(neighbor)
-            elif tentative_g >= neighbor.g:
+            depth[top] = 0
+            jump[top] = top
+            queue = [top]
+            for cell in queue:
+                up = parent[cell]
+                d = depth[cell] + 1
+                # Children jump over two equal jumps above, or to here
+                j = jump[cell]
+                jj = jump[j]
+                far = cell
+                if depth[cell] - depth[j] == depth[j] - depth[jj]:
+                    far = jj
+
+                for n in neighbors(cell):
+                    if n == up:
+                        continue
+                    if depth[n] >= 0:
+                        return None
+                    parent[n] = cell
+                    depth[n] = d
+                    jump[n] = far
+                    queue.append(n)
+
+        return cls(grid, parent, depth, jump)
+
+    def _ancestor(self, i: int, depth: int) -> int:
+        """
+        Ancestor of cell i at the given depth.
+        """
+        cell_depth = self.depth
+        jump = self.jump
+        parent = self.parent
+
+        while cell_depth[i] > depth:
+            if cell_depth[jump[i]] >= depth:
+                i = jump[i]
+            else:
+                i = parent[i]
+        return i
+
+    def _meet(self, a: int, b: int) -> int:
+        """
+        Lowest common ancestor of cells a and b, -1 if they are in
+        different trees.
+        """
+        depth = self.depth
+        jump = self.jump
+        parent = self.parent
+
+        if depth[a] > depth[b]:
+            a = self._ancestor(a, depth[b])
+        else:
+            b = self._ancestor(b, depth[a])
+
+        # Both are at the same depth from here on, and so are their
+        # jump targets
+        while a != b:
+            if not depth[a]:
+                return -1
+            if jump[a] != jump[b]:
+                a = jump[a]
+                b = jump[b]
+            else:
+                a = parent[a]
+                b = parent[b]
+        return a
+
+    def distance(self, a: Cell, b: Cell) -> int | None:
+        """
+        Number of steps between cells a and b, None if b cannot be
+        reached from a. O(log n).
+        """
+        w = self.width
+        i = a.y * w + a.x
+        j = b.y * w + b.x
+        meet = self._meet(i, j)
+        if meet < 0:
+            return None
+        depth = self.depth
+        return int(depth[i] + depth[j] - 2 * depth[meet])
+
+    def path(self, a: Cell, b: Cell) -> list[Cell]:
+        """
+        Cells on the path from a to b, both included, or an empty list
+        if b cannot be reached from a. O(log n + path length).
+        """
+        return [
+            self.grid[i // self.width][i % self.width]
+            for i in self._path_indices(a, b)
+        ]
+
+    def _path_indices(self, a: Cell, b: Cell) -> list[int]:
+        w = self.width
+        parent = self.parent
+        i = a.y * w + a.x
+        j = b.y * w + b.x
+        meet = self._meet(i, j)
+        if meet < 0:
+            return []
+
+        up = [i]
+        while i != meet:
+            i = parent[i]
+            up.append(i)
+
+        down = []
+        while j != meet:
+            down.append(j)
+            j = parent[j]
+
+        down.reverse()
+        return up + down
+
+    def solve(self, start: Cell, goal: Cell) -> SolveResult:
+        """
+        The path from start to goal as a SolveResult, the same path
+        solve_maze finds since it is the only one.
+        """
+        indices = self._path_indices(start, goal)
+        return SolveResult.from_indices(self.grid, indices, len(indices))
+
+
+class DistanceField:
+    """
+    Number of steps from every cell to the nearest of a set of source
+    cells, for hints, heatmaps or solving from many starts at once.
+
+    Computed by one BFS from all sources together, so in O(n) whatever
+    the number of sources, and stored as one 32-bit entry per cell in
+    row-major order (-1 where no source can be reached). The path from
+    any cell to its nearest source follows the field downhill.
+
+    Attributes:
+        distances: The field, indexed by y * width + x.
+    """
+
+    def __init__(
+            self, grid: Sequence[Sequence[Cell]], sources: Iterable[Cell]
+            ) -> None:
+        w = len(grid[0])
+        self.grid = grid
+        self.width = w
+        self.distances = array('i', [-1]) * (w * len(grid))
+
+        distances = self.distances
+        neighbors = index_neighbors(grid)
+        queue = []
+        for source in sources:
+            i = source.y * w + source.x
+            if distances[i] < 0:
+                distances[i] = 0
+                queue.append(i)
+
+        for cell in queue:
+            d = distances[cell] + 1
+            for n in neighbors(cell):
+                if distances[n] < 0:
+                    distances[n] = d
+                    queue.append(n)
+
+        self.neighbors = neighbors
+
+    def distance(self, cell: Cell) -> int | None:
+        """
+        Steps from cell to the nearest source, None if unreachable.
+        """
+        d = self.distances[cell.y * self.width + cell.x]
+        return d if d >= 0 else None
+
+    def path(self, cell: Cell) -> list[Cell]:
+        """
+        Cells from cell to the nearest source, both included, or an
+        empty list if no source can be reached. Ties go to the first
+        neighbour in N, S, W, E order.
+        """
+        w = self.width
+        grid = self.grid
+        return [grid[i // w][i % w] for i in self._descend(cell)]
+
+    def solve(self, cell: Cell) -> SolveResult:
+        """
+        The path from cell to the nearest source as a SolveResult.
+        """
+        indices = self._descend(cell)
+        return SolveResult.from_indices(self.grid, indices, len(indices))
+
+    def _descend(self, cell: Cell) -> list[int]:
+        distances = self.distances
+        neighbors = self.neighbors
+        i = cell.y * self.width + cell.x
+        if distances[i] < 0:
+            return []
+
+        indices = [i]
+        while distances[i]:
+            lower = distances[i] - 1
+            i = next(n for n in neighbors(i) if distances[n] == lower)
+            indices.append(i)
+        return indices
+
+
+class SolverWorkspace:
+    """
+    Scratch space of solve_maze for grids of one size, kept apart from
+    the cells so the grid is only read.
+
+    Distances, tie-break order and search state live in flat arrays
+    indexed by y * width + x, and the way back to the parent of every
+    reached cell is a 2-bit direction code. Instead of clearing the
+    arrays, every solve gets a new stamp and entries stamped by an
+    earlier solve count as unreached, so reusing the workspace for
+    repeated solves costs nothing per cell.
+
+    The workspace also keeps the TreeIndex of the last grid it solved,
+    so repeated solves of a perfect maze become tree queries.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        size = width * height
+        self.width = width
+        self.height = height
+        self.g = array('l', [0]) * size
+        self.order = array('l', [0]) * size
+        self.parent = bytearray(size)
+        # 2 * run: in the open set, 2 * run + 1: closed
+        self.state = array('L', [0]) * size
+        self.run = 0
+        self.tree: TreeIndex | None = None
+        self.tree_grid: Sequence[Sequence[Cell]] | None = None
+        # g, parent and state of the backward half of
+        # solve_bidirectional, allocated on first use
+        self.backward: tuple[array, bytearray, array] | None = None
+
+    def fits(self, grid: Sequence[Sequence[Cell]]) -> bool:
+        """
+        Whether the workspace has the size of grid.
+        """
+        return len(grid) == self.height and len(grid[0]) == self.width
+
+    def tree_for(self, grid: Sequence[Sequence[Cell]]) -> TreeIndex | None:
+        """
+        TreeIndex of grid, built when grid is first seen. None if grid
+        is not a perfect maze, which is remembered as well.
+
+        Wall changes made after the index was built are not noticed,
+        call forget_tree first.
+        """
+        if self.tree_grid is not grid:
+            self.tree = TreeIndex.build(grid)
+            self.tree_grid = grid
+        return self.tree
+
+    def forget_tree(self) -> None:
+        """
+        Drop the TreeIndex, so the next solve checks the grid again.
+        """
+        self.tree = None
+        self.tree_grid = None
+
+    def solve(
+            self, grid: Sequence[Sequence[Cell]], start: Cell, goal: Cell
+            ) -> SolveResult:
+        """
+        A* from start to goal with a Manhattan heuristic.
+
+        The open set is a heap keyed on (f, first insertion order),
+        which picks the same cell as taking the first lowest f from an
+        insertion ordered list. Entries left behind by a better g are
+        skipped when popped (lazy deletion).
+
+        Args:
+            grid: The maze, the size of the workspace.
+            start: Entry cell.
+            goal: Exit cell.
+
+        Returns:
+            The path found, see SolveResult.
+        """
+        w = self.width
+        g = self.g
+        order = self.order
+        parent = self.parent
+        state = self.state
+        self.run += 1
+        opened = 2 * self.run
+        closed = opened + 1
+
+        goal_x, goal_y = goal.x, goal.y
+        first = start.y * w + start.x
+        target = goal_y * w + goal_x
+        g[first] = 0
+        order[first] = 0
+        state[first] = opened
+        inserted = 1
+        expanded = 0
+        neighbors = _open_neighbors(grid)
+        # Parent code by step offset. N and S go last: with a width of
+        # 1 their offsets are the same as W and E, which never occur
+        codes = {
+            dy * w + dx: DIRECTIONS.index(back)
+            for _, dx, dy, back in sorted(STEPS, key=lambda s: s[2] != 0)
+        }
+        open_heap = [(abs(start.x - goal_x) + abs(start.y - goal_y), 0, first)]
+
+        while open_heap:
+            _, _, current = heapq.heappop(open_heap)
+            if state[current] == closed:
                 continue
 
-            neighbor.parent = current
-            neighbor.g = tentative_g
-            neighbor.mhd = manhattan(neighbor, goal)
-            neighbor.f = neighbor.g + neighbor.mhd
+            state[current] = closed
+            expanded += 1
+            if current == target:
+                return self._result(grid, start, goal, expanded)
+
+            tentative_g = g[current] + 1
+
+            for neighbor in neighbors(current):
+                seen = state[neighbor]
+                if seen == closed:
+                    continue
+
+                if seen != opened:
+                    state[neighbor] = opened
+                    order[neighbor] = inserted
+                    inserted += 1
+                elif tentative_g >= g[neighbor]:
+                    continue
+
+                parent[neighbor] = codes[neighbor - current]
+                g[neighbor] = tentative_g
+                ny, nx = divmod(neighbor, w)
+                heapq.heappush(open_heap, (
+                    tentative_g + abs(nx - goal_x) + abs(ny - goal_y),
+                    order[neighbor], neighbor
+                ))
+
+        return SolveResult([], '', expanded)
+
+    def solve_bidirectional(
+            self, grid: Sequence[Sequence[Cell]], start: Cell, goal: Cell
+            ) -> SolveResult:
+        """
+        Breadth-first search from start and goal at the same time.
+
+        Every round expands one whole level of the smaller of the two
+        frontiers, so both searches only cover about the cells within
+        half the path length of their end. The first level in which
+        the searches meet holds a shortest path, but not necessarily
+        through the first meeting found, so the level is finished and
+        the meeting with the lowest total distance is kept.
+
+        Neighbours come from index_neighbors, so both backends find
+        the same path. The forward search uses the same arrays as
+        solve, the backward one its own, allocated on first use.
+
+        Args:
+            grid: The maze, the size of the workspace.
+            start: Entry cell.
+            goal: Exit cell.
+
+        Returns:
+            The path found, see SolveResult.
+        """
+        w = self.width
+        neighbors = index_neighbors(grid)
+        if self.backward is None:
+            size = w * self.height
+            self.backward = (
+                array('l', [0]) * size, bytearray(size),
+                array('L', [0]) * size
+            )
+        back_g, back_parent, back_state = self.backward
+        self.run += 1
+        reached = 2 * self.run
+
+        first = start.y * w + start.x
+        target = goal.y * w + goal.x
+        if first == target:
+            return SolveResult.from_indices(grid, [first], 0)
+
+        # Direction code (DIRECTIONS) of the step from a cell to a
+        # neighbour at each offset, vertical last for 1 cell wide grids
+        codes = {-1: 3, 1: 1, -w: 0, w: 2}
+        forward = (self.g, self.parent, self.state, [first])
+        backward = (back_g, back_parent, back_state, [target])
+        for g, _, state, frontier in (forward, backward):
+            g[frontier[0]] = 0
+            state[frontier[0]] = reached
+
+        expanded = 0
+        best = -1
+        meeting = -1
+        while forward[3] and backward[3]:
+            side, other = forward, backward
+            if len(backward[3]) < len(forward[3]):
+                side, other = backward, forward
+            g, parent, state, frontier = side
+            other_g, _, other_state, _ = other
+            level: list[int] = []
+
+            for current in frontier:
+                expanded += 1
+                distance = g[current] + 1
+                for neighbor in neighbors(current):
+                    if state[neighbor] == reached:
+                        continue
+
+                    state[neighbor] = reached
+                    g[neighbor] = distance
+                    parent[neighbor] = codes[current - neighbor]
+                    level.append(neighbor)
+                    if other_state[neighbor] == reached:
+                        total = distance + other_g[neighbor]
+                        if best < 0 or total < best:
+                            best = total
+                            meeting = neighbor
+
+            if meeting >= 0:
+                return SolveResult.from_indices(
+                    grid, self._meet_path(meeting, first, target),
+                    expanded
+                )
+            frontier[:] = level
+
+        return SolveResult([], '', expanded)
+
+    def _meet_path(
+            self, meeting: int, first: int, target: int
+            ) -> list[int]:
+        """
+        Cell indices of the path through meeting: back to first along
+        the forward parents, then on to target along the backward ones.
+        """
+        w = self.width
+        offsets = (-w, 1, w, -1)
+        indices = [meeting]
+        current = meeting
+        while current != first:
+            current += offsets[self.parent[current]]
+            indices.append(current)
+        indices.reverse()
+
+        if self.backward is not None:
+            back_parent = self.backward[1]
+            current = meeting
+            while current != target:
+                current += offsets[back_parent[current]]
+                indices.append(current)
+        return indices
+
+    def _result(
+            self, grid: Sequence[Sequence[Cell]], start: Cell, goal: Cell,
+            expanded: int
+            ) -> SolveResult:
+        """
+        Follow the parent codes back from goal to start.
+        """
+        w = self.width
+        parent = self.parent
+        # Per parent code: the step taken into the cell, and the offset
+        # back to its parent
+        moves = {
+            back: (direction, -(dy * w + dx))
+            for direction, dx, dy, back in STEPS
+        }
+        codes = [moves[back] for back in DIRECTIONS]
+        first = start.y * w + start.x
+        current = goal.y * w + goal.x
+        path = [goal]
+        directions: list[str] = []
+
+        while current != first:
+            direction, offset = codes[parent[current]]
+            directions.append(direction)
+            current += offset
+            path.append(grid[current // w][current % w])
+
+        path.reverse()
+        directions.reverse()
+        return SolveResult(path, ''.join(directions), expanded)
+
+
+def solve_maze(
+        grid: Sequence[Sequence[Cell]],
+        workspace: SolverWorkspace | None = None,
+        bidirectional: bool | None = None
+        ) -> SolveResult:
+    """
+    Uses A* pathfinding to solve the maze.
+
+    Finds the shortest possible path from the start to
+    the goal cell by using Manhattan distance heuristic.
+    The open set is a binary heap, so every step costs O(log n).
+
+    The cells are not modified, the search state is kept in a
+    SolverWorkspace. Pass the same workspace to solve the same grid
+    (or grids of its size) again without allocating a new one.
+    BitGrid backed grids are searched through their wall planes.
+
+    With a workspace, perfect mazes are indexed once as a tree (see
+    TreeIndex) and every later solve of the same grid is a tree query.
+    A single solve without a workspace runs A*, which stops at the
+    goal while the index covers every cell, so callers that solve
+    each maze once (the CLI, batch mode, the renderers) pass none.
+
+    Mazes with few loops are solved with a bidirectional breadth-first
+    search instead (see SolverWorkspace.solve_bidirectional): there A*
+    expands most of the maze before it reaches the goal, while the two
+    searches meet after covering far fewer cells. The choice is made
+    from mean_degree, or forced with bidirectional.
+
+    Args:
+        grid: A 2D list of Cell objects representing the maze structure.
+        workspace: Optional workspace to reuse.
+        bidirectional: Search from both ends (True), run A* (False),
+                       or choose from the number of loops (None).
+
+    Returns:
+        The path from start to goal, see SolveResult.
+    """
+    if workspace is not None and not workspace.fits(grid):
+        workspace = None
+    tree = workspace.tree_for(grid) if workspace is not None else None
+    if bidirectional is None:
+        bidirectional = mean_degree(grid) < BIDIRECTIONAL_MAX_DEGREE
+
+    start, goal = find_endpoints(grid)
+    if start is None or goal is None:
+        return SolveResult([], '', 0)
+
+    if tree is not None:
+        return tree.solve(start, goal)
+    if workspace is None:
+        workspace = SolverWorkspace(len(grid[0]), len(grid))
+    if bidirectional:
+        return workspace.solve_bidirectional(grid, start, goal)
+    return workspace.solve(grid, start, goal)
@@ -0,0 +1,257 @@
+from collections.abc import Iterable, Sequence
+from types import TracebackType
+from typing import BinaryIO
+import mmap
+import struct
+
+from .bitgrid import DIRECTIONS, WALL_BITS, BitGrid, tile_indices
+from .generator import Cell
+from .print_output import tile_blocks
+
+
+# magic, width, height, entry x, entry y, exit x, exit y, path steps
+PACKED_HEADER = struct.Struct('<4sIIIIIIQ')
+PACKED_MAGIC = b'MZP1'
+
+# Direction letters to their 2-bit codes (DIRECTIONS order) and back
+DIRECTION_CODES = bytes.maketrans(DIRECTIONS.encode(), bytes(range(4)))
+CODE_DIRECTIONS = bytes.maketrans(bytes(range(4)), DIRECTIONS.encode())
+
+# bytes.translate tables taking one nibble, or one 2-bit code, out of
+# every byte
+LOW_NIBBLE = bytes(b & 15 for b in range(256))
+HIGH_NIBBLE = bytes(b >> 4 for b in range(256))
+CODES = [bytes((b >> shift) & 3 for b in range(256)) for shift in (0, 2, 4, 6)]
+
+# Tile index to its east and south walls as 0/1 plane bytes, and to
+# 1 for cells with every wall closed
+EAST_WALL = bytes(b >> 1 & 1 for b in range(256))
+SOUTH_WALL = bytes(b >> 2 & 1 for b in range(256))
+FULLY_CLOSED = bytes(int(b == 15) for b in range(256))
+
+
+def row_stride(width: int) -> int:
+    """
+    Bytes per packed row: two cells per byte, rows of odd width end in
+    a half used byte so every row starts on a byte boundary.
+    """
+    return (width + 1) // 2
+
+
+def pack_tiles(tiles: bytes, width: int) -> bytes:
+    """
+    Pack tile indices (one byte per cell, whole rows) two cells per
+    byte: the cell with the even x in the low nibble, the next one in
+    the high nibble.
+    """
+    if width % 2:
+        tiles = b''.join(
+            tiles[i:i + width] + b'\x00'
+            for i in range(0, len(tiles), width)
+        )
+    low = tiles[0::2]
+    high = tiles[1::2]
+    packed = (
+        int.from_bytes(low, 'little') | int.from_bytes(high, 'little') << 4
+    )
+    return packed.to_bytes(len(low), 'little')
+
+
+def unpack_tiles(packed: bytes, width: int) -> bytes:
+    """
+    Tile indices of whole rows packed by pack_tiles, one byte per cell.
+    """
+    tiles = bytearray(2 * len(packed))
+    tiles[0::2] = packed.translate(LOW_NIBBLE)
+    tiles[1::2] = packed.translate(HIGH_NIBBLE)
+    if width % 2:
+        return b''.join(
+            tiles[i:i + width] for i in range(0, len(tiles), width + 1)
+        )
+    return bytes(tiles)
+
+
+def pack_directions(directions: str) -> bytes:
+    """
+    Pack a direction string 4 steps per byte, 2 bits per step with the
+    first step in the lowest bits.
+    """
+    codes = directions.encode().translate(DIRECTION_CODES)
+    codes += b'\x00' * (-len(codes) % 4)
+    packed = 0
+    for k in range(4):
+        packed |= int.from_bytes(codes[k::4], 'little') << 2 * k
+    return packed.to_bytes(len(codes) // 4, 'little')
+
+
+def unpack_directions(packed: bytes, steps: int) -> str:
+    """
+    The first `steps` directions packed by pack_directions.
+    """
+    codes = bytearray(4 * len(packed))
+    for k, table in enumerate(CODES):
+        codes[k::4] = packed.translate(table)
+    return codes[:steps].translate(CODE_DIRECTIONS).decode('ascii')
+
+
+def write_packed(
+        grid: Sequence[Sequence[Cell]], f: BinaryIO,
+        entry: tuple[int, int], exit_pos: tuple[int, int],
+        directions: str
+        ) -> None:
+    """
+    Write a maze in the packed binary format.
+
+    The file is a PACKED_HEADER, then the tile indices of every row
+    (pack_tiles, row_stride(width) bytes per row), then the path
+    (pack_directions).
+
+    args:
+        grid: The maze, on either backend.
+        f: File opened for binary writing.
+        entry: (x, y) of the entry.
+        exit_pos: (x, y) of the exit.
+        directions: The path, as written by print_path.
+    """
+    w = len(grid[0])
+    f.write(PACKED_HEADER.pack(
+        PACKED_MAGIC, w, len(grid), *entry, *exit_pos, len(directions)
+    ))
+    for tiles in tile_blocks(grid):
+        f.write(pack_tiles(tiles, w))
+    f.write(pack_directions(directions))
+
+
+def write_packed_rows(
+        rows: Iterable[tuple[bytearray, bytearray]], f: BinaryIO,
+        width: int, height: int,
+        entry: tuple[int, int], exit_pos: tuple[int, int]
+        ) -> None:
+    """
+    Write a maze given row by row (see print_output.print_rows_hex) in
+    the packed binary format, without a path.
+    """
+    f.write(PACKED_HEADER.pack(
+        PACKED_MAGIC, width, height, *entry, *exit_pos, 0
+    ))
+    north: bytearray | None = None
+    for east, south in rows:
+        above = b'\x01' * width if north is None else north
+        f.write(pack_tiles(tile_indices(east, south, above, width), width))
+        north = south
+
+
+class PackedMaze:
+    """
+    Maze file written by write_packed, memory-mapped and decoded on
+    access.
+
+    Opening only reads the header, so a file of any size opens at once,
+    and only the pages of the rows that are read get loaded. Cells are
+    read as tile indices (or walls) by coordinates, never as Cell
+    objects. Use as a context manager, or call close().
+
+    Attributes:
+        width: Cells per row.
+        height: Number of rows.
+        entry: (x, y) of the entry.
+        exit: (x, y) of the exit.
+        path_steps: Number of steps of the stored path.
+        stride: Bytes per packed row.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Raises:
+            ValueError: If the file is not a packed maze or is cut short.
+        """
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            self._file.close()
+            raise ValueError("Not a packed maze")
+
+        if len(self._map) < PACKED_HEADER.size:
+            self.close()
+            raise ValueError("Not a packed maze")
+        (magic, self.width, self.height, entry_x, entry_y,
+         exit_x, exit_y, self.path_steps) = PACKED_HEADER.unpack_from(
+            self._map
+        )
+        self.entry = (entry_x, entry_y)
+        self.exit = (exit_x, exit_y)
+        self.stride = row_stride(self.width)
+        self.cells_offset = PACKED_HEADER.size
+        self.path_offset = self.cells_offset + self.stride * self.height
+
+        if magic != PACKED_MAGIC:
+            self.close()
+            raise ValueError("Not a packed maze")
+        if len(self._map) < self.path_offset + (self.path_steps + 3) // 4:
+            self.close()
+            raise ValueError("Packed maze file is truncated")
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "PackedMaze":
+        return self
+
+    def __exit__(
+            self, exc_type: type[BaseException] | None,
+            exc: BaseException | None, tb: TracebackType | None
+            ) -> None:
+        self.close()
+
+    def tile(self, x: int, y: int) -> int:
+        """
+        Tile index (0-15) of cell (x, y), as in the hex format.
+        """
+        byte = self._map[self.cells_offset + y * self.stride + x // 2]
+        return byte >> 4 if x & 1 else byte & 15
+
+    def has_wall(self, x: int, y: int, direction: str) -> bool:
+        """
+        Whether cell (x, y) has a wall on the given side (N, E, S, W).
+        """
+        return bool(self.tile(x, y) & WALL_BITS[direction])
+
+    def row_tiles(self, first: int, last: int | None = None) -> bytes:
+        """
+        Tile indices of rows first to last (excluded, default: just
+        row first), one byte per cell.
+        """
+        if last is None:
+            last = first + 1
+        start = self.cells_offset + first * self.stride
+        end = self.cells_offset + last * self.stride
+        return unpack_tiles(self._map[start:end], self.width)
+
+    def directions(self) -> str:
+        """
+        The stored path as a direction string, as written by print_path.
+        """
+        size = (self.path_steps + 3) // 4
+        packed = self._map[self.path_offset:self.path_offset + size]
+        return unpack_directions(packed, self.path_steps)
+
+    def to_bitgrid(self) -> BitGrid:
+        """
+        Load the whole maze into a BitGrid, with its entry and exit.
+
+        Cells with all four walls closed are marked as pattern cells,
+        and every cell as visited, as in a generated maze.
+        """
+        bits = BitGrid(self.width, self.height)
+        tiles = self.row_tiles(0, self.height)
+        bits.east[:] = tiles.translate(EAST_WALL)
+        bits.south[:] = tiles.translate(SOUTH_WALL)
+        bits.pattern[:] = tiles.translate(FULLY_CLOSED)
+        bits.visited[:] = b'\x01' * len(tiles)
+        bits.mark_start_and_exit(self.entry, self.exit)
+        return bits
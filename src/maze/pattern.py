@@ -1,8 +1,8 @@
 from src.patterns.digit_patterns import DIGITS
 from src.patterns.char_patterns import CHARS
 from .generator import Cell
+from typing import Any
 import sys
-import time
 
 
 def make_pattern(pattern_value: str) -> list[list[int]] | None:
@@ -50,35 +50,47 @@ def make_pattern(pattern_value: str) -> list[list[int]] | None:
     return pattern
 
 
-def mark_pattern(grid: list[list[Cell]], pattern: list[list[int]]) -> None:
+def pattern_fits(
+        width: int, height: int, pattern: list[list[int]]
+        ) -> bool:
     """
-    Mark cells in the grid as part of a visual pattern (e.g. "42").
+    Whether a pattern leaves room around it on a width x height maze.
+    Patterns that do not fit are left out of the maze.
+    """
+    return height - 1 > len(pattern) and width - 1 > len(pattern[0])
 
-    Centers the pattern on the grid and marks matching cells accordingly.
-    Cells marked with 1 in the pattern are fully walled and excluded from
-    maze generation. Cells marked with 2 are only marked as visited,
-    acting as interior filler cells inside the pattern.
+
+def place_pattern(
+        width: int, height: int, pattern: list[list[int]],
+        start: tuple[int, int] | None, goal: tuple[int, int] | None
+        ) -> list[tuple[int, int, int]]:
+    """
+    Center a pattern on a width x height maze. Shared by every backend
+    (mark_pattern, BitGrid.mark_pattern, eller.pattern_rows).
 
     Args:
-        grid: 2D list of Cell objects representing the maze.
+        width: Number of cells horizontally.
+        height: Number of cells vertically.
         pattern: 2D list of integers where 1 marks a pattern wall cell,
                  2 marks an interior filler cell, and 0 is ignored.
+        start: (x, y) coordinates of the entry cell, if marked.
+        goal: (x, y) coordinates of the exit cell, if marked.
+
+    Returns:
+        (x, y, value) of every cell the pattern marks, value being 1
+        or 2. Empty if the pattern does not fit (see pattern_fits).
 
     Raises:
         ValueError: If the pattern overlaps with the entry or exit cell.
     """
-    h = len(grid)
-    w = len(grid[0])
+    if not pattern_fits(width, height, pattern):
+        return []
+
     ph = len(pattern)
     pw = len(pattern[0])
-
-    if (h-1) <= ph or (w-1) <= pw:
-        print("Warning: Maze too small for '42' pattern", file=sys.stderr)
-        time.sleep(3)
-        return
-
-    start_x = (w - pw) // 2
-    start_y = (h - ph) // 2
+    start_x = (width - pw) // 2
+    start_y = (height - ph) // 2
+    cells = []
 
     for py in range(ph):
         for px in range(pw):
@@ -86,21 +98,67 @@ def mark_pattern(grid: list[list[Cell]], pattern: list[list[int]]) -> None:
             if value not in (1, 2):
                 continue
 
-            grid_x = start_x + px
-            grid_y = start_y + py
-            cell = grid[grid_y][grid_x]
-
-            if cell.is_start:
+            position = (start_x + px, start_y + py)
+            if position == start:
                 raise ValueError(
-                    f"Pattern overlaps with entry at ({grid_x}, {grid_y})"
+                    f"Pattern overlaps with entry at {position}"
                 )
-            if cell.is_goal:
+            if position == goal:
                 raise ValueError(
-                    f"Pattern overlaps with exit at ({grid_x}, {grid_y})"
+                    f"Pattern overlaps with exit at {position}"
                 )
+            cells.append((*position, value))
+
+    return cells
+
+
+def warn_if_pattern_skipped(config: dict[str, Any]) -> bool:
+    """
+    Print a warning when the configured pattern does not fit the maze
+    and will be left out. Called once by the command line entry
+    points, so generating (or regenerating) stays silent.
+
+    Returns:
+        Whether the warning was printed.
+    """
+    value = config.get('PATTERN', '42')
+    pattern = make_pattern(value)
+    if pattern is None or pattern_fits(
+            config['WIDTH'], config['HEIGHT'], pattern):
+        return False
+    print(f"Warning: Maze too small for '{value}' pattern", file=sys.stderr)
+    return True
+
+
+def mark_pattern(
+        grid: list[list[Cell]], pattern: list[list[int]],
+        start: tuple[int, int] | None = None,
+        goal: tuple[int, int] | None = None
+        ) -> None:
+    """
+    Mark cells in the grid as part of a visual pattern (e.g. "42").
+
+    Centers the pattern on the grid (see place_pattern) and marks
+    matching cells accordingly. Cells marked with 1 in the pattern are
+    fully walled and excluded from maze generation. Cells marked with
+    2 are only marked as visited, acting as interior filler cells
+    inside the pattern. Nothing is marked if the pattern does not fit.
 
-            cell.visited = True
+    Args:
+        grid: 2D list of Cell objects representing the maze.
+        pattern: 2D list of integers where 1 marks a pattern wall cell,
+                 2 marks an interior filler cell, and 0 is ignored.
+        start: (x, y) coordinates of the entry cell.
+        goal: (x, y) coordinates of the exit cell.
 
-            if value == 1:
-                cell.walls = {'N': True, 'E': True, 'S': True, 'W': True}
-                cell.pattern = True
+    Raises:
+        ValueError: If the pattern overlaps with the entry or exit cell.
+    """
+    for x, y, value in place_pattern(
+            len(grid[0]), len(grid), pattern, start, goal):
+        cell = grid[y][x]
+        cell.visited = True
+
+        if value == 1:
+            cell.walls = {'N': True, 'E': True, 'S': True, 'W': True}
+            cell.pattern = True
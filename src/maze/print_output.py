@@ -1,41 +1,93 @@
-from src.rendering.render_utils import cell_to_tile_index
 from .generator import Cell
+from . import bitgrid
+from .bitgrid import HEX_BLOCK_CELLS, hex_lines, tile_indices
+from .maze_solver import SolveResult
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import product
+from operator import attrgetter, itemgetter
 from typing import TextIO, Any
 
 
-def mark_goal(grid: list[list[Cell]]) -> Cell:
-    """
-    finds the 'goal' cell in grid using their is_goal attribute.
+# Tile index per (N, E, S, W) walls of a cell, the same as
+# render_utils.cell_to_tile_index
+TILE_INDEX = {
+    walls: sum(closed << bit for bit, closed in enumerate(walls))
+    for walls in product((False, True), repeat=4)
+}
 
-    args:
-        grid: A 2D list of Cell objects representing the maze structure.
 
-    return:
-        goal: the only Cell marked with is_goal.
+def tile_blocks(grid: Sequence[Sequence[Cell]]) -> Iterator[bytes]:
     """
-    for row in grid:
-        for cell in row:
-            if cell.is_goal:
-                return cell
-
-    raise ValueError("No goals cell found in grid")
+    Tile indices of the grid from top to bottom, one byte per cell, in
+    blocks of whole rows of about HEX_BLOCK_CELLS cells.
 
-
-def print_maze_hex(grid: list[list[Cell]], f: TextIO) -> None:
+    Cell rows are encoded with C level maps through TILE_INDEX, every
+    cell from its own walls. BitGrid backed grids are encoded from
+    their planes by bitgrid.tile_blocks.
+    """
+    if isinstance(grid, bitgrid.GridView):
+        yield from bitgrid.tile_blocks(grid.bits)
+        return
+
+    walls_of = attrgetter('walls')
+    sides = itemgetter('N', 'E', 'S', 'W')
+    index = TILE_INDEX.__getitem__
+    rows = max(1, HEX_BLOCK_CELLS // len(grid[0]))
+    block = bytearray()
+
+    for y, row in enumerate(grid, 1):
+        block += bytes(map(index, map(sides, map(walls_of, row))))
+        if y % rows == 0:
+            yield bytes(block)
+            block = bytearray()
+    if block:
+        yield bytes(block)
+
+
+def print_maze_hex(grid: Sequence[Sequence[Cell]], f: TextIO) -> None:
     """
     Outputs the per cell in hexadecimal value.
 
+    The tile indices come in blocks of rows from tile_blocks, and each
+    block is turned into hex digits with one table lookup and written
+    at once.
+
     args:
         grid: A 2D list of Cell objects representing the maze structure.
         f: File descriptor for text output
     """
-    h = len(grid)
     w = len(grid[0])
-    for y in range(h):
-        for x in range(w):
-            cell = grid[y][x]
-            f.write(f"{cell_to_tile_index(cell):x}")
-        f.write("\n")
+    for tiles in tile_blocks(grid):
+        f.write(hex_lines(tiles, w))
+
+
+def print_rows_hex(
+        rows: Iterable[tuple[bytearray, bytearray]], f: TextIO
+        ) -> None:
+    """
+    Outputs a maze given row by row, in the same format as
+    print_maze_hex. Only the previous row is kept, for the north walls.
+
+    args:
+        rows: (east walls, south walls) per row, 1 = closed,
+              as yielded by MazeGenerator.stream_rows.
+        f: File descriptor for text output
+    """
+    north: bytearray | None = None
+    lines = []
+    cells = 0
+
+    for east, south in rows:
+        w = len(east)
+        above = b'\x01' * w if north is None else north
+        lines.append(hex_lines(tile_indices(east, south, above, w), w))
+        cells += w
+        if cells >= HEX_BLOCK_CELLS:
+            f.write(''.join(lines))
+            lines = []
+            cells = 0
+        north = south
+    f.write(''.join(lines))
 
 
 def print_doors(config: dict[str, Any], f: TextIO) -> None:
@@ -51,45 +103,72 @@ def print_doors(config: dict[str, Any], f: TextIO) -> None:
     f.write(f"\n{entry_x},{entry_y}\n{exit_x},{exit_y}")
 
 
-def print_path(grid: list[list[Cell]], f: TextIO) -> None:
+def print_path(result: SolveResult, f: TextIO) -> None:
     """
-    Tracks from goal (current) to start what direction
-    the path has made.
+    Outputs the directions the path takes from start to goal.
 
     args:
-        grid: A 2D list of Cell objects representing the maze structure.
+        result: The SolveResult returned by solve_maze.
         f: File descriptor for text output
     """
-    current = mark_goal(grid)
-    directions: list[str] = []
+    f.write(f"\n{result.directions}")
 
-    while current.parent:
-        parent = current.parent
 
-        if current.x == parent.x + 1:
-            directions.append('E')
-        if current.x == parent.x - 1:
-            directions.append('W')
-        if current.y == parent.y + 1:
-            directions.append('S')
-        if current.y == parent.y - 1:
-            directions.append('N')
-
-        current = parent
-    directions.reverse()
-    f.write(f"\n{''.join(directions)}")
-
-
-def print_output_main(grid: list[list[Cell]], config: dict[str, Any]) -> None:
+def print_output_main(
+        grid: Sequence[Sequence[Cell]], config: dict[str, Any],
+        result: SolveResult
+        ) -> None:
     """
     Opens or creates output_maze.txt,
     calls the print path function.
+    With OUTPUT_FORMAT=PACKED the maze is written in the packed
+    binary format instead (see packed.write_packed).
 
     args:
         grid: A 2D list of Cell objects representing the maze structure.
         config: Parsed configuration.txt stored in a dict.
+        result: The SolveResult returned by solve_maze.
     """
+    if config.get('OUTPUT_FORMAT') == 'PACKED':
+        from .packed import write_packed
+
+        with open(config['OUTPUT_FILE'], "wb") as binary:
+            write_packed(
+                grid, binary, config['ENTRY'], config['EXIT'],
+                result.directions
+            )
+        return
+
     with open(config['OUTPUT_FILE'], "w") as f:
         print_maze_hex(grid, f)
         print_doors(config, f)
-        print_path(grid, f)
+        print_path(result, f)
+
+
+def stream_output_main(config: dict[str, Any]) -> None:
+    """
+    Generates the maze with Eller's algorithm and writes each row to
+    the output file as soon as it is carved, so memory use does not
+    depend on the maze height. The maze is never held in full, so it is
+    not solved and the path line is left empty (no path for
+    OUTPUT_FORMAT=PACKED).
+
+    args:
+        config: Parsed configuration.txt stored in a dict.
+    """
+    from .generator import MazeGenerator
+
+    rows = MazeGenerator(config).stream_rows()
+    if config.get('OUTPUT_FORMAT') == 'PACKED':
+        from .packed import write_packed_rows
+
+        with open(config['OUTPUT_FILE'], "wb") as binary:
+            write_packed_rows(
+                rows, binary, config['WIDTH'], config['HEIGHT'],
+                config['ENTRY'], config['EXIT']
+            )
+        return
+    with open(config['OUTPUT_FILE'], "w") as f:
+        print_rows_hex(rows, f)
+        print_doors(config, f)
+        f.write("\n")
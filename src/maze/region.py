@@ -0,0 +1,236 @@
+from collections import OrderedDict
+from types import TracebackType
+import mmap
+
+from .bitgrid import BitGrid
+from .loader import HEX_VALUES, INVALID
+from .packed import (
+    EAST_WALL, FULLY_CLOSED, PACKED_MAGIC, SOUTH_WALL, PackedMaze
+)
+
+
+# Decoded cells per cached block of rows (one byte per cell)
+BLOCK_CELLS = 1 << 20
+
+
+class MazeFile:
+    """
+    Maze file written by print_output_main (hex or packed), opened for
+    reading rectangular regions without loading the whole maze.
+
+    Both formats store every row at a fixed offset (a hex row is width
+    digits and a line break), so the file is memory-mapped and only
+    the rows a region covers are read. Rows are decoded into tile
+    indices in blocks of `block_rows` rows, and the last `capacity`
+    blocks are kept in an LRU, so panning a viewport over the maze
+    decodes every row about once. The counters in `stats` track block
+    hits, misses and evictions.
+
+    Nothing is checked beyond the layout: use loader.load_maze_file to
+    validate a whole maze. Use as a context manager, or call close().
+
+    Attributes:
+        width: Cells per row.
+        height: Number of rows.
+        entry: (x, y) of the entry.
+        exit: (x, y) of the exit.
+        format: HEX or PACKED, as OUTPUT_FORMAT.
+        path_offset: Offset of the stored path in the file.
+        block_rows: Rows per cached block.
+    """
+
+    def __init__(
+            self, path: str, capacity: int = 64,
+            block_rows: int | None = None
+            ) -> None:
+        """
+        Raises:
+            ValueError: If the file is not a maze in either format.
+        """
+        with open(path, 'rb') as f:
+            packed = f.read(len(PACKED_MAGIC)) == PACKED_MAGIC
+
+        self.capacity = capacity
+        self.blocks: OrderedDict[int, bytes] = OrderedDict()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+        }
+
+        # Only the member of the file's format is set: _packed for
+        # PACKED, _hex (and the _file it maps) for HEX
+        self.format = 'PACKED' if packed else 'HEX'
+        if packed:
+            self._packed = PackedMaze(path)
+            self.width: int = self._packed.width
+            self.height: int = self._packed.height
+            self.entry: tuple[int, int] = self._packed.entry
+            self.exit: tuple[int, int] = self._packed.exit
+            self.path_offset = self._packed.path_offset
+        else:
+            self._open_hex(path)
+        self.block_rows = block_rows or max(1, BLOCK_CELLS // self.width)
+
+    def _open_hex(self, path: str) -> None:
+        """
+        Map a hex file and find its row stride and the lines after the
+        grid, reading only the first line and the end of the file.
+        """
+        self._file = open(path, 'rb')
+        try:
+            self._hex = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            self._file.close()
+            raise ValueError("Maze file is empty")
+
+        data = self._hex
+        end = data.find(b'\n')
+        self._newline = 2 if end > 0 and data[end - 1] == ord('\r') else 1
+        self._stride = end + 1
+        self.width = end + 1 - self._newline
+
+        # The file ends in a blank line, the entry, the exit and the
+        # path line, which holds no line break
+        path_start = data.rfind(b'\n') + 1
+        exit_start = data.rfind(b'\n', 0, max(path_start - 1, 0)) + 1
+        entry_start = data.rfind(b'\n', 0, max(exit_start - 1, 0)) + 1
+        grid_end = entry_start - self._newline
+        if (end < 1 or grid_end < self._stride
+                or grid_end % self._stride):
+            self.close()
+            raise ValueError("Not a maze in the hex format")
+
+        self.height = grid_end // self._stride
+        self.path_offset = path_start
+        try:
+            self.entry = _point(data[entry_start:exit_start])
+            self.exit = _point(data[exit_start:path_start])
+        except ValueError:
+            self.close()
+            raise ValueError("Invalid entry or exit line")
+
+    def close(self) -> None:
+        self.blocks.clear()
+        if self.format == 'PACKED':
+            self._packed.close()
+        else:
+            self._hex.close()
+            self._file.close()
+
+    def __enter__(self) -> "MazeFile":
+        return self
+
+    def __exit__(
+            self, exc_type: type[BaseException] | None,
+            exc: BaseException | None, tb: TracebackType | None
+            ) -> None:
+        self.close()
+
+    def _decode(self, first: int, last: int) -> bytes:
+        """
+        Tile indices of rows first to last (excluded), from the file.
+
+        Raises:
+            ValueError: If a hex row is malformed.
+        """
+        if self.format == 'PACKED':
+            return self._packed.row_tiles(first, last)
+
+        data = self._hex[first * self._stride:last * self._stride]
+        tiles = data.translate(HEX_VALUES, b'\r\n')
+        if len(tiles) != (last - first) * self.width or INVALID in tiles:
+            raise ValueError(f"Malformed hex rows {first} to {last - 1}")
+        return tiles
+
+    def _block(self, block: int) -> bytes:
+        tiles = self.blocks.get(block)
+        if tiles is not None:
+            self.stats['hits'] += 1
+            self.blocks.move_to_end(block)
+            return tiles
+
+        self.stats['misses'] += 1
+        first = block * self.block_rows
+        tiles = self._decode(first, min(first + self.block_rows, self.height))
+        self.blocks[block] = tiles
+        while len(self.blocks) > self.capacity:
+            self.blocks.popitem(last=False)
+            self.stats['evictions'] += 1
+        return tiles
+
+    def block_tiles(self, y: int) -> tuple[int, bytes]:
+        """
+        First row and tile indices (one byte per cell) of the cached
+        block of rows holding row y.
+        """
+        block = y // self.block_rows
+        return block * self.block_rows, self._block(block)
+
+    def tile(self, x: int, y: int) -> int:
+        """
+        Tile index (0-15) of cell (x, y), as in the hex format.
+        """
+        block, row = divmod(y, self.block_rows)
+        return self._block(block)[row * self.width + x]
+
+    def region_tiles(
+            self, x: int, y: int, width: int, height: int
+            ) -> list[bytes]:
+        """
+        Tile indices of the width x height cells from (x, y), one bytes
+        object per row and one byte per cell, walls as stored (walls
+        leading out of the region may be open).
+
+        Raises:
+            ValueError: If the region is empty or not inside the maze.
+        """
+        if (width < 1 or height < 1 or x < 0 or y < 0
+                or x + width > self.width or y + height > self.height):
+            raise ValueError(
+                f"Region {width}x{height} at ({x},{y}) is not inside the "
+                f"{self.width}x{self.height} maze"
+            )
+
+        rows = []
+        w = self.width
+        for row in range(y, y + height):
+            block, offset = divmod(row, self.block_rows)
+            start = offset * w + x
+            rows.append(self._block(block)[start:start + width])
+        return rows
+
+    def region(self, x: int, y: int, width: int, height: int) -> BitGrid:
+        """
+        The width x height cells from (x, y) as a BitGrid, cell (0, 0)
+        being cell (x, y) of the maze, to solve or render a window of
+        it (e.g. through a GridView). Walls leading out of the region
+        are closed; the entry and exit are not marked.
+
+        Raises:
+            ValueError: If the region is empty or not inside the maze.
+        """
+        tiles = b''.join(self.region_tiles(x, y, width, height))
+        bits = BitGrid(width, height)
+        bits.east[:] = tiles.translate(EAST_WALL)
+        bits.east[width - 1::width] = b'\x01' * height
+        bits.south[:] = tiles.translate(SOUTH_WALL)
+        bits.south[-width:] = b'\x01' * width
+        bits.pattern[:] = tiles.translate(FULLY_CLOSED)
+        bits.visited[:] = b'\x01' * len(tiles)
+        return bits
+
+    def directions(self) -> str:
+        """
+        The stored path as a direction string (empty if none).
+        """
+        if self.format == 'PACKED':
+            return self._packed.directions()
+        return self._hex[self.path_offset:].rstrip(b'\r').decode('ascii')
+
+
+def _point(line: bytes) -> tuple[int, int]:
+    x, y = (int(part) for part in line.split(b','))
+    return x, y
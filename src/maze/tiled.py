@@ -0,0 +1,315 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import random
+
+from . import bitgrid
+from .bitgrid import BitGrid
+from .generator_utils import find_root
+
+
+# (x, y, width, height) of a tile, in cells of the full grid
+Tile = tuple[int, int, int, int]
+
+# Everything a worker needs to carve one tile: its width and height,
+# its visited and pattern planes (None if it holds no pattern cells),
+# PERFECT, BIAS, IMPRATE and the (root seed, tile number) of its rng
+TileJob = tuple[
+    int, int, bytes | None, bytes | None, bool, float, int, tuple[int, int]
+]
+
+# A carved tile: its east and south planes, the component of every
+# border cell (None if the tile is one component) and the number of
+# components
+TileResult = tuple[bytes, bytes, dict[int, int] | None, int]
+
+
+def make_tiles(width: int, height: int, tile_size: int) -> list[Tile]:
+    """
+    Split a width x height grid into tiles of tile_size x tile_size
+    cells, in row-major order. Tiles on the right and bottom edges
+    are cut to fit.
+    """
+    return [
+        (x, y, min(tile_size, width - x), min(tile_size, height - y))
+        for y in range(0, height, tile_size)
+        for x in range(0, width, tile_size)
+    ]
+
+
+def _tile_job(
+        bits: BitGrid, tile: Tile, number: int, root_seed: int,
+        perfect: bool, bias: float, imprate: int
+        ) -> TileJob:
+    """
+    Cut the job for one tile out of the full grid.
+    """
+    x, y, tw, th = tile
+    w = bits.width
+    rows = range(y * w + x, (y + th) * w + x, w)
+    visited = b''.join(bits.visited[i:i + tw] for i in rows)
+    seed = (root_seed, number)
+
+    if 1 not in visited:
+        return tw, th, None, None, perfect, bias, imprate, seed
+
+    pattern = b''.join(bits.pattern[i:i + tw] for i in rows)
+    return tw, th, visited, pattern, perfect, bias, imprate, seed
+
+
+def _piece_roots(bits: BitGrid, rng: random.Random) -> list[int]:
+    """
+    Pick one random cell in every piece of connected free cells.
+    """
+    seen = bytearray(bits.visited)
+    roots = []
+    first = seen.find(0)
+
+    while first >= 0:
+        seen[first] = 1
+        piece = [first]
+        stack = [first]
+        while stack:
+            cell = stack.pop()
+            for n in bits.all_neighbors(cell):
+                if not seen[n]:
+                    seen[n] = 1
+                    piece.append(n)
+                    stack.append(n)
+
+        roots.append(rng.choice(piece))
+        first = seen.find(0, first)
+
+    return roots
+
+
+def _border_components(bits: BitGrid) -> tuple[dict[int, int], int]:
+    """
+    Label the connected components of a carved tile with a flood fill
+    and return the labels of its border cells, with the number of
+    components.
+    """
+    w = bits.width
+    h = bits.height
+    size = w * h
+    labels = array('l', [-1]) * size
+    count = 0
+
+    for first in range(size):
+        if labels[first] >= 0:
+            continue
+
+        labels[first] = count
+        stack = [first]
+        while stack:
+            cell = stack.pop()
+            for n in bits.open_neighbors(cell):
+                if labels[n] < 0:
+                    labels[n] = count
+                    stack.append(n)
+        count += 1
+
+    border = [*range(w), *range(size - w, size),
+              *range(0, size, w), *range(w - 1, size, w)]
+    return {i: labels[i] for i in border}, count
+
+
+def carve_tile(job: TileJob) -> TileResult:
+    """
+    Carve one tile on its own BitGrid. Runs in a worker process.
+
+    A tile without pattern cells is a plain rectangle and becomes a
+    single tree. Pattern cells crossing the tile can cut its free cells
+    into separate pieces, so then every piece grows its own tree from a
+    random root, and the pieces are labelled to be joined through the
+    neighbouring tiles by stitch_tiles.
+
+    Args:
+        job: The tile job, see TileJob.
+
+    Returns:
+        The carved tile, see TileResult.
+    """
+    from .generator import derive_rng
+
+    width, height, visited, pattern, perfect, bias, imprate, seed = job
+    bits = BitGrid(width, height)
+    rng = derive_rng(*seed)
+
+    if visited is not None and pattern is not None:
+        bits.visited[:] = visited
+        bits.pattern[:] = pattern
+
+    roots = _piece_roots(bits, rng) if visited is not None else []
+    start = roots[0] if roots else None
+
+    if bits.visited.find(0) >= 0:
+        if perfect:
+            bitgrid.growing_sigma_tree(bits, bias, None, rng, start)
+            for root in roots[1:]:
+                bitgrid.growing_sigma_tree(bits, bias, None, rng, root)
+        else:
+            # Wilson's walks only end on a visited cell, so every
+            # piece gets its first cell up front
+            for root in roots[1:]:
+                bits.visited[root] = 1
+            bitgrid.wilson_sometimes_hunts(
+                bits, bias, None, imprate, rng, start
+            )
+
+    if visited is None:
+        return bytes(bits.east), bytes(bits.south), None, 1
+
+    border, count = _border_components(bits)
+    return bytes(bits.east), bytes(bits.south), border, count
+
+
+def _paste_tile(bits: BitGrid, tile: Tile, east: bytes, south: bytes) -> None:
+    """
+    Copy the walls of a carved tile into the full grid. The walls on
+    the tile's own border come back closed.
+    """
+    x, y, tw, th = tile
+    w = bits.width
+
+    for r in range(th):
+        i = (y + r) * w + x
+        bits.east[i:i + tw] = east[r * tw:(r + 1) * tw]
+        bits.south[i:i + tw] = south[r * tw:(r + 1) * tw]
+
+
+def stitch_tiles(
+        bits: BitGrid, tiles: list[Tile], tile_size: int,
+        components: list[tuple[int, dict[int, int] | None]],
+        perfect: bool, rng: random.Random
+        ) -> int:
+    """
+    Join the carved tiles into one maze.
+
+    Every pair of free cells facing each other across a tile border is
+    a candidate passage. The candidates are taken in random order and
+    opened only when they join two components not yet connected, like
+    Kruskal's algorithm on the tile pieces, so a forest of perfect tiles
+    becomes one perfect maze with just a few border passages. Imperfect
+    mazes get one more random passage per pair of neighbouring tiles.
+
+    Cells marked visited before carving (the pattern) are never opened.
+
+    Args:
+        bits: The full grid, with the carved tiles pasted in and the
+              visited plane as it was before carving.
+        tiles: The tiles, as made by make_tiles.
+        tile_size: Tile size used for make_tiles.
+        components: Per tile, the id of its first component and the
+                    border labels returned by carve_tile.
+        perfect: Whether the maze must stay perfect.
+        rng: Random source of the generator.
+
+    Returns:
+        Number of passages opened.
+    """
+    w = bits.width
+    blocked = bits.visited
+    columns = -(-w // tile_size)
+
+    def component(t: int, i: int) -> int:
+        first, border = components[t]
+        if border is None:
+            return first
+        x, y, tw, _ = tiles[t]
+        return first + border[(i // w - y) * tw + i % w - x]
+
+    borders = []
+    for t, (x, y, tw, th) in enumerate(tiles):
+        if x + tw < w:
+            cells = range(y * w + x + tw - 1, (y + th) * w, w)
+            borders.append((t, t + 1, [(a, a + 1) for a in cells]))
+        if y + th < bits.height:
+            row = (y + th - 1) * w + x
+            cells = range(row, row + tw)
+            borders.append((t, t + columns, [(a, a + w) for a in cells]))
+
+    candidates: list[tuple[int, int, int, int]] = []
+    for t, other, pairs in borders:
+        pairs[:] = [
+            (a, b) for a, b in pairs if not blocked[a] and not blocked[b]
+        ]
+        candidates.extend(
+            (a, b, component(t, a), component(other, b)) for a, b in pairs
+        )
+    rng.shuffle(candidates)
+
+    parent: dict[int, int] = {}
+    opened = 0
+    for a, b, ca, cb in candidates:
+        ra = find_root(parent, ca)
+        rb = find_root(parent, cb)
+        if ra != rb:
+            bits.remove_wall_between(a, b)
+            parent[rb] = ra
+            opened += 1
+
+    if not perfect:
+        for _, _, pairs in borders:
+            if pairs:
+                a, b = rng.choice(pairs)
+                if bits.wall_exists_between(a, b):
+                    bits.remove_wall_between(a, b)
+                    opened += 1
+
+    return opened
+
+
+def carve_tiled(
+        bits: BitGrid, tile_size: int, workers: int, perfect: bool,
+        bias: float, imprate: int, rng: random.Random
+        ) -> None:
+    """
+    Carve a maze on a BitGrid tile by tile, over a pool of worker
+    processes.
+
+    Each tile is carved on its own (Growing Tree or Wilson's +
+    Hunt-and-Kill, like the single-core generators) with a random source
+    derived from rng and its tile number, so the maze only depends on
+    the seed, not on the number of workers. The tiles are then pasted
+    into the grid and stitched together, and imperfect mazes get the
+    usual fix_large_holes pass.
+
+    Args:
+        bits: The BitGrid to carve, with entry, exit and pattern marked.
+        tile_size: Width and height of a tile, in cells.
+        workers: Number of worker processes, 1 carves in this process.
+        perfect: Whether to carve a perfect maze.
+        bias: Growing Tree or Wilson's bias, per tile.
+        imprate: Imperfection rate (imperfect mazes only).
+        rng: Random source of the generator.
+    """
+    tiles = make_tiles(bits.width, bits.height, tile_size)
+    root_seed = rng.getrandbits(64)
+    jobs = [
+        _tile_job(bits, tile, number, root_seed, perfect, bias, imprate)
+        for number, tile in enumerate(tiles)
+    ]
+
+    components = []
+    first = 0
+
+    def collect(tile: Tile, result: TileResult) -> None:
+        nonlocal first
+        east, south, border, count = result
+        _paste_tile(bits, tile, east, south)
+        components.append((first, border))
+        first += count
+
+    if workers == 1:
+        for tile, job in zip(tiles, jobs):
+            collect(tile, carve_tile(job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for tile, result in zip(tiles, pool.map(carve_tile, jobs)):
+                collect(tile, result)
+
+    stitch_tiles(bits, tiles, tile_size, components, perfect, rng)
+    bits.visited[:] = b'\x01' * len(bits.visited)
+
+    if not perfect:
+        bitgrid.fix_large_holes(bits, rng)
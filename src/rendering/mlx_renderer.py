@@ -4,8 +4,10 @@ except ModuleNotFoundError:
     raise ModuleNotFoundError(
         "MLX is not installed. Make sure to include MLX wheel file."
     )
+from collections.abc import Sequence
 from typing import Any
 from src.maze.generator import Cell
+from src.maze.maze_solver import SolveResult
 from src.rendering.render_utils import cell_to_tile_index
 
 
@@ -24,22 +26,28 @@ class MLXDisplay:
     BUTTON_BAR_HEIGHT = 50
 
     def __init__(
-        self, grid: list[list[Cell]], width: int,
-        height: int, config: dict[str, Any]
+        self, grid: Sequence[Sequence[Cell]], result: SolveResult,
+        width: int, height: int, config: dict[str, Any],
+        write_output: bool = True
             ):
         """
         Initialize the MLX window and load all tile assets.
 
         Args:
             grid: 2D list of Cell objects representing the maze.
+            result: The solution of grid returned by solve_maze.
             width: Number of cells horizontally.
             height: Number of cells vertically.
             config: Parsed configuration stored as a dict.
+            write_output: False to never write OUTPUT_FILE, also when
+                          regenerating (see print_maze_mlx).
         """
         self.grid = grid
+        self.result = result
         self.width = width
         self.height = height
         self.config = config
+        self.write_output = write_output
         self.show_solution = False
         self.running = True
 
@@ -209,39 +217,22 @@ class MLXDisplay:
 
     def render_path(self) -> None:
         """
-        Overlay path, start, and goal markers on the maze.
+        Overlay the solution path on the maze.
 
-        Only draws if show_solution is True. Draws a path marker on
-        every cell flagged as in_path, and start/goal markers on their
-        respective cells.
+        Called by render only when show_solution is True. Draws a path
+        marker on every cell of result.path; the start and goal
+        markers are drawn over them by render_doors.
         """
-        for y in range(self.height):
-            for x in range(self.width):
-                cell = self.grid[y][x]
-
-                px = x * self.TILE_SIZE
-                py = y * self.TILE_SIZE + self.BUTTON_BAR_HEIGHT
-
-                if cell.in_path:
-                    self.mlx.mlx_put_image_to_window(
-                        self.mlx_ptr, self.win_ptr,
-                        self.tiles['path'], px, py
-                    )
-
-                if cell.is_start:
-                    self.mlx.mlx_put_image_to_window(
-                        self.mlx_ptr, self.win_ptr,
-                        self.tiles['start'], px, py
-                    )
+        for cell in self.result.path:
+            px = cell.x * self.TILE_SIZE
+            py = cell.y * self.TILE_SIZE + self.BUTTON_BAR_HEIGHT
 
-                if cell.is_goal:
-                    self.mlx.mlx_put_image_to_window(
-                        self.mlx_ptr, self.win_ptr,
-                        self.tiles['goal'], px, py
-                    )
+            self.mlx.mlx_put_image_to_window(
+                self.mlx_ptr, self.win_ptr,
+                self.tiles['path'], px, py
+            )
 
     def render_doors(self) -> None:
-        pass
         """
         Draw the entry and exit markers onto the maze.
 
@@ -318,7 +309,8 @@ class MLXDisplay:
 
     def regenerate_maze(self, config: dict[str, Any]) -> None:
         """
-        Generate a new maze, solve it, write the output file, and redraw.
+        Generate a new maze, solve it, write the output file (unless
+        write_output is False), and redraw.
 
         Resets show_solution to False and clears the window before rendering.
 
@@ -329,8 +321,9 @@ class MLXDisplay:
         from src.maze.print_output import print_output_main
         from src.maze.maze_solver import solve_maze
         self.grid = generate_maze(config)
-        solve_maze(self.grid)
-        print_output_main(self.grid, config)
+        self.result = solve_maze(self.grid)
+        if self.write_output:
+            print_output_main(self.grid, config, self.result)
         self.show_solution = False
         self.mlx.mlx_clear_window(self.mlx_ptr, self.win_ptr)
         self.mlx.mlx_sync(self.mlx_ptr, self.mlx.SYNC_WIN_FLUSH, self.win_ptr)
@@ -349,7 +342,9 @@ class MLXDisplay:
         self.render()
 
 
-def print_maze_mlx(grid: list[list[Cell]], config: dict[str, Any]) -> None:
+def print_maze_mlx(
+        grid: Sequence[Sequence[Cell]], result: SolveResult,
+        config: dict[str, Any], write_output: bool = True) -> None:
     """
     Write the maze output file and launch the MLX graphical display.
 
@@ -359,11 +354,19 @@ def print_maze_mlx(grid: list[list[Cell]], config: dict[str, Any]) -> None:
 
     Args:
         grid: 2D list of Cell objects representing the maze.
+        result: The solution of grid returned by solve_maze.
         config: Parsed configuration stored as a dict.
+        write_output: False to leave OUTPUT_FILE as it is, e.g. when
+                      the maze was loaded from it, also when the
+                      maze is regenerated from the display.
     """
-    from src.maze.print_output import print_output_main
-    print_output_main(grid, config)
-    display = MLXDisplay(grid, config['WIDTH'], config['HEIGHT'], config)
+    if write_output:
+        from src.maze.print_output import print_output_main
+        print_output_main(grid, config, result)
+    display = MLXDisplay(
+        grid, result, config['WIDTH'], config['HEIGHT'], config,
+        write_output
+    )
     display.render()
 
     def check_running(param: None) -> int:
@@ -1,8 +1,10 @@
 import os
 import time
 import random
+from collections.abc import Sequence
 from typing import Any
 from src.maze.generator import Cell
+from src.maze.maze_solver import SolveResult
 
 
 ##########################################
@@ -12,11 +14,6 @@ from src.maze.generator import Cell
 PATTERN_WALL = "▒▒"
 PATTERN_EMPTY = "░░"
 
-<<<<<<< HEAD
-START_BLOCK = "\033[42m  \033[0m"
-GOAL_BLOCK = "\033[41m  \033[0m"
-=======
->>>>>>> f70abb5 (pattern fixes)
 
 ##########################################
 # Colour System
@@ -64,27 +61,26 @@ class Style:
 class TerminalDisplay:
     def __init__(
         self,
-        grid: list[list[Cell]],
+        grid: Sequence[Sequence[Cell]],
+        result: SolveResult,
         config: dict[str, Any],
         style: Style | None = None,
+        write_output: bool = True,
     ) -> None:
         self.grid = grid
         self.config = config
+        # False when showing a loaded maze, so regenerating does not
+        # overwrite the file it was loaded from
+        self.write_output = write_output
         self.show_solution = False
         self.error_message: str | None = None
 
         self.style = style or Style("black", "blue", "red")
 
-        self.solution_cells = [
-            cell
-            for row in self.grid
-            for cell in row
-            if cell.in_path
-        ]
+        self.solution_cells = result.path
 
-        # Reset visual state for animation/toggling
-        for cell in self.solution_cells:
-            cell.in_path = False
+        # Path cells currently drawn, for animation/toggling
+        self.shown: set[Cell] = set()
 
     ##########################################
     # Rendering Loop
@@ -122,6 +118,7 @@ class TerminalDisplay:
     def draw_maze(self) -> None:
         h = len(self.grid)
         w = len(self.grid[0])
+        shown = self.shown
 
         for y in range(h):
 
@@ -129,7 +126,7 @@ class TerminalDisplay:
             for x in range(w):
                 cell = self.grid[y][x]
                 north_open = (
-                    y > 0 and cell.in_path and self.grid[y - 1][x].in_path
+                    y > 0 and cell in shown and self.grid[y - 1][x] in shown
                 )
 
                 print(self._wall_char(cell), end="")
@@ -145,10 +142,11 @@ class TerminalDisplay:
                 cell = self.grid[y][x]
 
                 west_open = (
-                    x > 0 and cell.in_path and self.grid[y][x - 1].in_path
+                    x > 0 and cell in shown and self.grid[y][x - 1] in shown
                 )
                 east_open = (
-                    x < w - 1 and cell.in_path and self.grid[y][x + 1].in_path
+                    x < w - 1 and cell in shown
+                    and self.grid[y][x + 1] in shown
                 )
 
                 if cell.walls["W"]:
@@ -161,7 +159,7 @@ class TerminalDisplay:
                 elif cell.is_goal:
                     print(self.style.goal, end="")
                 else:
-                    print(self._open_char(cell, cell.in_path), end="")
+                    print(self._open_char(cell, cell in shown), end="")
 
                 if cell.walls["E"]:
                     print(self._wall_char(cell), end="")
@@ -173,7 +171,8 @@ class TerminalDisplay:
             for x in range(w):
                 cell = self.grid[y][x]
                 south_open = (
-                    y < h - 1 and cell.in_path and self.grid[y + 1][x].in_path
+                    y < h - 1 and cell in shown
+                    and self.grid[y + 1][x] in shown
                 )
 
                 print(self._wall_char(cell), end="")
@@ -237,27 +236,24 @@ class TerminalDisplay:
         from src.maze.print_output import print_output_main
 
         self.grid = generate_maze(self.config)
-        solve_maze(self.grid)
+        result = solve_maze(self.grid)
 
         # Store solution once
-        self.solution_cells = [
-            cell for row in self.grid for cell in row if cell.in_path
-        ]
+        self.solution_cells = result.path
 
         # Reset visual state
-        for cell in self.solution_cells:
-            cell.in_path = False
+        self.shown.clear()
 
         self.show_solution = False
-        print_output_main(self.grid, self.config)
+        if self.write_output:
+            print_output_main(self.grid, self.config, result)
 
     ##########################################
     # Solution Logic
     ##########################################
 
     def hide_solution(self) -> None:
-        for cell in self.solution_cells:
-            cell.in_path = False
+        self.shown.clear()
 
         self.show_solution = False
         os.system("clear")
@@ -269,8 +265,7 @@ class TerminalDisplay:
             return
 
         # Ensure hidden first
-        for cell in self.solution_cells:
-            cell.in_path = False
+        self.shown.clear()
 
         self.show_solution = True
 
@@ -278,14 +273,13 @@ class TerminalDisplay:
         random.shuffle(shuffled)
 
         for cell in shuffled:
-            cell.in_path = True
+            self.shown.add(cell)
             os.system("clear")
             self.draw_maze()
             time.sleep(delay)
 
         # Make sure fully visible
-        for cell in self.solution_cells:
-            cell.in_path = True
+        self.shown.update(self.solution_cells)
 
     ##########################################
     # Color Picker
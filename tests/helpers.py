@@ -0,0 +1,111 @@
+from collections import deque
+from collections.abc import Sequence
+from typing import Any
+
+from src.maze.generator import Cell, generate_maze
+from src.maze.maze_solver import SolveResult, get_neighbors, solve_maze
+from src.maze.print_output import print_output_main
+
+Grid = Sequence[Sequence[Cell]]
+
+
+def make_maze(width: int, height: int, seed: int, **entries: Any) -> Grid:
+    """
+    Corner to corner maze without a pattern, imperfect and on the Cell
+    backend unless entries (config keys) say otherwise.
+    """
+    config: dict[str, Any] = {
+        'WIDTH': width,
+        'HEIGHT': height,
+        'ENTRY': (0, 0),
+        'EXIT': (width - 1, height - 1),
+        'PERFECT': False,
+        'SEED': seed,
+        'BIAS': 0.5,
+        'IMPRATE': 65,
+        'PATTERN': '',
+    }
+    config.update(entries)
+    return generate_maze(config)
+
+
+def write_maze(
+        path: str, width: int, height: int, seed: int, output_format: str,
+        **entries: Any
+        ) -> tuple[Grid, SolveResult]:
+    """
+    Generate and solve a maze (see make_maze) and write it to path in
+    the given OUTPUT_FORMAT, as a_maze_ing.py does.
+    """
+    grid = make_maze(width, height, seed, **entries)
+    result = solve_maze(grid)
+    config = {
+        'ENTRY': (0, 0),
+        'EXIT': (width - 1, height - 1),
+        'OUTPUT_FILE': path,
+        'OUTPUT_FORMAT': output_format,
+    }
+    print_output_main(grid, config, result)
+    return grid, result
+
+
+def bfs_distances(grid: Grid, source: Cell) -> dict[tuple[int, int], int]:
+    """
+    Steps from source to every cell it reaches, by a plain breadth-first
+    search over get_neighbors, keyed by (x, y).
+    """
+    distances = {(source.x, source.y): 0}
+    queue = deque([source])
+    while queue:
+        cell = queue.popleft()
+        for neighbor in get_neighbors(cell, grid):
+            if (neighbor.x, neighbor.y) not in distances:
+                distances[neighbor.x, neighbor.y] = (
+                    distances[cell.x, cell.y] + 1
+                )
+                queue.append(neighbor)
+    return distances
+
+
+def assert_path(
+        grid: Grid, path: Sequence[Cell], a: Cell, b: Cell, length: int
+        ) -> None:
+    """
+    Check path walks from a to b in length steps through open walls.
+    """
+    assert len(path) == length + 1
+    assert (path[0].x, path[0].y) == (a.x, a.y)
+    assert (path[-1].x, path[-1].y) == (b.x, b.y)
+    for cell, after in zip(path, path[1:]):
+        assert (after.x, after.y) in [
+            (neighbor.x, neighbor.y)
+            for neighbor in get_neighbors(cell, grid)
+        ]
+
+
+def assert_connected(grid: Grid) -> int:
+    """
+    Check every cell outside the pattern is reached from every other
+    and pattern cells are closed on all four sides.
+
+    returns:
+        The number of open walls.
+    """
+    cells = [cell for row in grid for cell in row if not cell.pattern]
+    for row in grid:
+        for cell in row:
+            if cell.pattern:
+                assert all(cell.walls.values())
+    assert len(bfs_distances(grid, cells[0])) == len(cells)
+    return sum(
+        (not cell.walls['E']) + (not cell.walls['S']) for cell in cells
+    )
+
+
+def assert_spanning_tree(grid: Grid) -> None:
+    """
+    Check the open walls connect the cells outside the pattern without
+    a loop, i.e. the maze is perfect.
+    """
+    cells = sum(not cell.pattern for row in grid for cell in row)
+    assert assert_connected(grid) == cells - 1
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from src.maze.maze_solver import (
+    SolveResult, SolverWorkspace, find_endpoints, solve_maze
+)
+
+from .helpers import assert_path, bfs_distances, make_maze
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('imprate', [10, 65, 100])
+@pytest.mark.parametrize('seed', range(8))
+def test_path_lengths_match_bfs(
+        backend: str, imprate: int, seed: int
+        ) -> None:
+    rng = random.Random(seed)
+    width, height = rng.randint(1, 30), rng.randint(2, 30)
+    grid = make_maze(width, height, seed, IMPRATE=imprate, BACKEND=backend)
+    workspace = SolverWorkspace(width, height)
+
+    for _ in range(10):
+        start = grid[rng.randrange(height)][rng.randrange(width)]
+        goal = grid[rng.randrange(height)][rng.randrange(width)]
+        result = workspace.solve(grid, start, goal)
+        expected = bfs_distances(grid, start).get((goal.x, goal.y))
+        if expected is None:
+            assert result.path == []
+        else:
+            assert result.length == expected
+            assert_path(grid, result.path, start, goal, expected)
+            rebuilt = SolveResult.from_directions(
+                grid, start, result.directions
+            )
+            assert rebuilt.path == result.path
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('seed', range(6))
+def test_solve_maze_finds_a_shortest_path(backend: str, seed: int) -> None:
+    grid = make_maze(31, 23, seed, PATTERN='42', BACKEND=backend)
+    start, goal = find_endpoints(grid)
+    assert start is not None and goal is not None
+    result = solve_maze(grid, bidirectional=False)
+    expected = bfs_distances(grid, start)[goal.x, goal.y]
+    assert result.length == expected
+    assert_path(grid, result.path, start, goal, expected)
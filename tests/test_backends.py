@@ -0,0 +1,54 @@
+import io
+from typing import Any
+
+import pytest
+
+from src.maze.generator import generate_maze
+from src.maze.maze_solver import solve_maze
+from src.maze.print_output import print_maze_hex, print_path
+
+
+def output(config: dict[str, Any]) -> str:
+    """
+    Hex grid and path of the maze, as written to OUTPUT_FILE.
+    """
+    grid = generate_maze(config)
+    f = io.StringIO()
+    print_maze_hex(grid, f)
+    print_path(solve_maze(grid), f)
+    return f.getvalue()
+
+
+ALGORITHMS = [
+    {'PERFECT': True},
+    {'PERFECT': False},
+    {'PERFECT': True, 'ALGORITHM': 'KRUSKAL'},
+    {'PERFECT': True, 'ALGORITHM': 'ELLER'},
+    {'PERFECT': True, 'TILE_SIZE': 12, 'WORKERS': 1},
+]
+
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+@pytest.mark.parametrize('width, height, pattern', [
+    (20, 15, '42'),
+    (31, 23, 'HI'),
+    (5, 4, '42'),
+    (1, 6, '42'),
+])
+@pytest.mark.parametrize('seed', range(3))
+def test_backends_write_the_same_maze(
+        algorithm: dict[str, Any], width: int, height: int, pattern: str,
+        seed: int
+        ) -> None:
+    config = {
+        'WIDTH': width,
+        'HEIGHT': height,
+        'ENTRY': (0, 0),
+        'EXIT': (width - 1, height - 1),
+        'SEED': seed,
+        'BIAS': seed / 4,
+        'IMPRATE': seed * 30,
+        'PATTERN': pattern,
+        **algorithm,
+    }
+    assert output(config) == output(dict(config, BACKEND='BITPLANE'))
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import pytest
+
+from src.batch import main, seed_output_file, worker_cache
+from src.config_parser import parse_config
+from src.maze.generator import generate_maze
+from src.maze.maze_solver import solve_maze
+from src.maze.print_output import print_output_main, stream_output_main
+
+BASE = """WIDTH=17
+HEIGHT=11
+ENTRY=0,0
+EXIT=16,10
+OUTPUT_FILE={output}
+"""
+
+
+def single_run(tmp_path: Path, text: str, seed: int) -> bytes:
+    """
+    The output file a single a_maze_ing.py run writes for this config
+    with SEED set to seed.
+    """
+    config_path = tmp_path / f'single_{seed}.txt'
+    output = tmp_path / f'single_{seed}.out'
+    config_path.write_text(
+        text.format(output=output) + f"SEED={seed}\n"
+    )
+    config = parse_config(str(config_path))
+    if config.get('ALGORITHM') == 'ELLER':
+        stream_output_main(config)
+    else:
+        grid = generate_maze(config)
+        print_output_main(grid, config, solve_maze(grid))
+    return output.read_bytes()
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+@pytest.mark.parametrize('extra', [
+    'PERFECT=True',
+    'PERFECT=False\nIMPRATE=40\nBACKEND=BITPLANE',
+    'PERFECT=True\nALGORITHM=KRUSKAL\nOUTPUT_FORMAT=PACKED',
+    'PERFECT=True\nALGORITHM=ELLER',
+    'PERFECT=False\nCACHE_DIR={cache}',
+])
+def test_batch_matches_single_runs(
+        tmp_path: Path, workers: int, extra: str
+        ) -> None:
+    text = BASE + extra.replace('{cache}', str(tmp_path / 'cache')) + '\n'
+    config_path = tmp_path / 'config.txt'
+    output = tmp_path / 'maze.txt'
+    config_path.write_text(text.format(output=output))
+
+    main([str(config_path), '--count', '3', '--seed-start', '5',
+          '--workers', str(workers)])
+
+    for seed in range(5, 8):
+        written = Path(seed_output_file(str(output), seed)).read_bytes()
+        assert written == single_run(tmp_path, text, seed)
+
+
+def test_seed_output_file() -> None:
+    assert seed_output_file('out/maze.txt', 17) == 'out/maze_17.txt'
+    assert seed_output_file('maze', 3) == 'maze_3'
+
+
+def test_one_cache_per_process(tmp_path: Path) -> None:
+    config_path = tmp_path / 'config.txt'
+    config_path.write_text(
+        BASE.format(output=tmp_path / 'maze.txt')
+        + f"PERFECT=True\nCACHE_DIR={tmp_path / 'cache'}\n"
+    )
+    args = [str(config_path), '--count', '3', '--workers', '1']
+    main(args)
+    main(args)
+
+    config = parse_config(str(config_path))
+    cache = worker_cache(config)
+    assert cache is worker_cache(config)
+    # The second batch is served from the memory of the first
+    assert cache is not None
+    assert cache.stats['misses'] == 3
+    assert cache.stats['hits'] == 3
@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from src.maze.maze_solver import SolverWorkspace, solve_maze
+
+from .helpers import assert_path, bfs_distances, make_maze
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('imprate', [0, 10, 65])
+@pytest.mark.parametrize('seed', range(8))
+def test_path_lengths_match_bfs(
+        backend: str, imprate: int, seed: int
+        ) -> None:
+    rng = random.Random(seed)
+    width, height = rng.randint(1, 30), rng.randint(2, 30)
+    grid = make_maze(
+        width, height, seed, PERFECT=imprate == 0, IMPRATE=imprate,
+        BACKEND=backend
+    )
+    workspace = SolverWorkspace(width, height)
+
+    for _ in range(10):
+        start = grid[rng.randrange(height)][rng.randrange(width)]
+        goal = grid[rng.randrange(height)][rng.randrange(width)]
+        result = workspace.solve_bidirectional(grid, start, goal)
+        expected = bfs_distances(grid, start).get((goal.x, goal.y))
+        if expected is None:
+            assert result.path == []
+        else:
+            assert result.length == expected
+            assert_path(grid, result.path, start, goal, expected)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_solve_maze_gives_the_same_length_either_way(seed: int) -> None:
+    grid = make_maze(25, 20, seed, IMPRATE=10)
+    assert (solve_maze(grid, bidirectional=True).length
+            == solve_maze(grid, bidirectional=False).length)
@@ -0,0 +1,102 @@
+import io
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.maze.cache import MazeCache
+from src.maze.generator import generate_maze
+from src.maze.maze_solver import solve_maze
+from src.maze.print_output import print_maze_hex
+
+
+def make_config(seed: int | None, **entries: Any) -> dict[str, Any]:
+    config: dict[str, Any] = {
+        'WIDTH': 15,
+        'HEIGHT': 12,
+        'ENTRY': (0, 0),
+        'EXIT': (14, 11),
+        'PERFECT': False,
+        'SEED': seed,
+    }
+    config.update(entries)
+    return config
+
+
+def hex_grid(grid: Any) -> str:
+    f = io.StringIO()
+    print_maze_hex(grid, f)
+    return f.getvalue()
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('perfect', [True, False])
+def test_cached_maze_matches_a_fresh_one(backend: str, perfect: bool) -> None:
+    config = make_config(7, PERFECT=perfect, BACKEND=backend)
+    expected = generate_maze(config)
+    directions = solve_maze(expected).directions
+    cache = MazeCache()
+
+    for _ in range(2):
+        grid, result = cache.generate_and_solve(config)
+        assert hex_grid(grid) == hex_grid(expected)
+        assert result.directions == directions
+        # Every lookup builds a new grid, so changes do not stick
+        grid[0][0].walls['E'] = not grid[0][0].walls['E']
+    assert cache.stats['misses'] == 1
+    assert cache.stats['hits'] == 1
+
+
+def test_memory_counters() -> None:
+    cache = MazeCache(capacity=2)
+    for seed in (1, 2, 1, 3, 2):
+        cache.generate_and_solve(make_config(seed))
+    # 1 is a hit and moves to the end, so 3 evicts 2 and 2 evicts 1
+    assert cache.stats['hits'] == 1
+    assert cache.stats['misses'] == 4
+    assert cache.stats['evictions'] == 2
+    assert len(cache.entries) == 2
+
+
+def test_keys_ignore_settings_that_do_not_change_the_maze() -> None:
+    cache = MazeCache()
+    cache.generate_and_solve(make_config(1, BACKEND='CELL'))
+    cache.generate_and_solve(make_config(1, BACKEND='BITPLANE'))
+    cache.generate_and_solve(make_config(1, OUTPUT_FILE='other.txt'))
+    cache.generate_and_solve(make_config(1, PERFECT=True, IMPRATE=10))
+    cache.generate_and_solve(make_config(1, PERFECT=True, IMPRATE=90))
+    assert cache.stats['misses'] == 2
+    assert cache.stats['hits'] == 3
+
+
+def test_unseeded_configs_bypass_the_cache() -> None:
+    cache = MazeCache()
+    cache.generate_and_solve(make_config(None))
+    cache.generate_and_solve(make_config(None))
+    assert cache.stats['bypassed'] == 2
+    assert cache.stats['misses'] == 0
+    assert not cache.entries
+
+
+def disk_size(directory: Path) -> int:
+    return sum(os.path.getsize(path) for path in directory.iterdir())
+
+
+def test_disk_hits_and_evictions(tmp_path: Path) -> None:
+    cache = MazeCache(directory=str(tmp_path))
+    for seed in range(4):
+        cache.generate_and_solve(make_config(seed))
+    assert cache.disk_bytes == disk_size(tmp_path)
+
+    # A new cache on the same directory starts with an empty memory
+    other = MazeCache(directory=str(tmp_path))
+    assert other.disk_bytes == cache.disk_bytes
+    other.generate_and_solve(make_config(0))
+    assert other.stats['disk_hits'] == 1
+    assert other.stats['misses'] == 0
+
+    other.max_bytes = other.disk_bytes // 2
+    other.generate_and_solve(make_config(9))
+    assert other.stats['disk_evictions'] > 0
+    assert other.disk_bytes == disk_size(tmp_path) <= other.max_bytes
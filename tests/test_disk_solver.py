@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+
+from src.maze.disk_solver import solve_maze_file, write_path
+from src.maze.loader import load_maze_file
+from src.maze.print_output import stream_output_main
+
+from .helpers import write_maze
+
+SIZES = [(1, 9), (2, 5), (7, 6), (13, 11), (20, 15)]
+
+
+@pytest.mark.parametrize('output_format', ['HEX', 'PACKED'])
+@pytest.mark.parametrize('width, height', SIZES)
+@pytest.mark.parametrize('perfect', [True, False])
+def test_solves_and_writes_the_path(
+        tmp_path: Path, output_format: str, width: int, height: int,
+        perfect: bool
+        ) -> None:
+    path = str(tmp_path / 'maze.txt')
+    _, result = write_maze(
+        path, width, height, 4, output_format, PERFECT=perfect,
+        PATTERN='42'
+    )
+    write_path(path, '')
+    assert load_maze_file(path)[1].directions == ''
+
+    directions = solve_maze_file(path, str(tmp_path))
+    assert len(directions) == result.length
+    write_path(path, directions)
+    # load_maze_file checks the path follows open walls to the exit
+    assert load_maze_file(path)[1].directions == directions
+
+
+@pytest.mark.parametrize('output_format', ['HEX', 'PACKED'])
+def test_solves_a_streamed_maze(
+        tmp_path: Path, output_format: str
+        ) -> None:
+    path = str(tmp_path / 'maze.txt')
+    stream_output_main({
+        'WIDTH': 45,
+        'HEIGHT': 30,
+        'ENTRY': (0, 0),
+        'EXIT': (44, 29),
+        'PERFECT': True,
+        'SEED': 5,
+        'ALGORITHM': 'ELLER',
+        'OUTPUT_FILE': path,
+        'OUTPUT_FORMAT': output_format,
+    })
+    directions = solve_maze_file(path)
+    write_path(path, directions)
+    _, stored, _ = load_maze_file(path)
+    assert stored.directions == directions
+    assert directions
+
+
+def test_rejects_a_cell_open_on_the_border(tmp_path: Path) -> None:
+    path = str(tmp_path / 'maze.txt')
+    # Both cells are open to the east, out of the one column maze
+    with open(path, 'w') as f:
+        f.write('9\nC\n\n0,0\n0,1\n')
+
+    with pytest.raises(ValueError, match='open on the maze border'):
+        solve_maze_file(path)
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from src.maze.maze_solver import DistanceField
+
+from .helpers import assert_path, bfs_distances, make_maze
+
+SIZES = [(20, 15, '42'), (9, 7, ''), (1, 6, ''), (6, 1, '')]
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('perfect', [True, False])
+@pytest.mark.parametrize('width, height, pattern', SIZES)
+@pytest.mark.parametrize('seed', range(3))
+def test_distances_match_bfs_from_the_nearest_source(
+        backend: str, perfect: bool, width: int, height: int, pattern: str,
+        seed: int
+        ) -> None:
+    grid = make_maze(
+        width, height, seed, PERFECT=perfect, BACKEND=backend,
+        PATTERN=pattern, IMPRATE=40
+    )
+    cells = [cell for row in grid for cell in row]
+    sources = random.Random(seed).sample(cells, 3)
+    field = DistanceField(grid, sources)
+    from_sources = [bfs_distances(grid, source) for source in sources]
+
+    for cell in cells:
+        reached = [d[cell.x, cell.y] for d in from_sources
+                   if (cell.x, cell.y) in d]
+        expected = min(reached) if reached else None
+        assert field.distance(cell) == expected
+        if expected is None:
+            assert field.path(cell) == []
+            continue
+
+        path = field.path(cell)
+        assert path[-1] in sources
+        assert_path(grid, path, cell, path[-1], expected)
+        result = field.solve(cell)
+        assert result.length == expected
+        assert [(c.x, c.y) for c in result.path] == [
+            (c.x, c.y) for c in path
+        ]
@@ -0,0 +1,74 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.maze.bitgrid import BitGrid, GridView
+from src.maze.eller import eller_rows, pattern_rows
+from src.maze.generator import MazeGenerator
+from src.maze.maze_solver import SolveResult
+from src.maze.pattern import make_pattern
+from src.maze.print_output import print_output_main, stream_output_main
+
+from .helpers import assert_spanning_tree, make_maze
+
+# The 5 row patterns fill rows 1 to 5 of a 7 row maze, so the band
+# carved around them spans the first and the last row
+SIZES = [(9, 7), (12, 7), (9, 8), (20, 15), (1, 6), (6, 1)]
+
+
+@pytest.mark.parametrize('width, height', SIZES)
+@pytest.mark.parametrize('pattern', ['42', 'HI', ''])
+@pytest.mark.parametrize('seed', range(4))
+def test_rows_form_a_spanning_tree(
+        width: int, height: int, pattern: str, seed: int
+        ) -> None:
+    bits = BitGrid(width, height)
+    cells = make_pattern(pattern)
+    blocked = pattern_rows(
+        width, height, cells, (0, 0), (width - 1, height - 1)
+    )
+    if cells:
+        bits.mark_pattern(cells)
+
+    rows = list(eller_rows(width, height, seed / 4, seed, blocked))
+    assert len(rows) == height
+    for y, (east, south) in enumerate(rows):
+        bits.east[y * width:(y + 1) * width] = east
+        bits.south[y * width:(y + 1) * width] = south
+    assert_spanning_tree(GridView(bits))
+
+
+@pytest.mark.parametrize('output_format', ['HEX', 'PACKED'])
+@pytest.mark.parametrize('width, height', SIZES)
+def test_streamed_file_matches_the_generated_maze(
+        tmp_path: Path, output_format: str, width: int, height: int
+        ) -> None:
+    path = tmp_path / 'maze.txt'
+    config: dict[str, Any] = {
+        'WIDTH': width,
+        'HEIGHT': height,
+        'ENTRY': (0, 0),
+        'EXIT': (width - 1, height - 1),
+        'PERFECT': True,
+        'SEED': 3,
+        'ALGORITHM': 'ELLER',
+        'OUTPUT_FILE': str(path),
+        'OUTPUT_FORMAT': output_format,
+    }
+    stream_output_main(config)
+
+    # The same maze kept in memory and written without a path
+    grid = MazeGenerator(config).generate_eller()
+    expected = tmp_path / 'expected.txt'
+    print_output_main(
+        grid, dict(config, OUTPUT_FILE=str(expected)), SolveResult([], '', 0)
+    )
+    assert path.read_bytes() == expected.read_bytes()
+
+
+def test_generated_cells_are_all_visited() -> None:
+    grid = make_maze(20, 15, 1, PERFECT=True, ALGORITHM='ELLER',
+                     BACKEND='BITPLANE', PATTERN='42')
+    assert isinstance(grid, GridView)
+    assert set(grid.bits.visited) == {1}
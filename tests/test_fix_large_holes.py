@@ -0,0 +1,135 @@
+import random
+from collections.abc import Sequence
+
+import pytest
+
+from src.maze.bitgrid import BitGrid, GridView
+from src.maze.generator import Cell
+from src.maze.generator_utils import fix_large_holes
+
+
+def baseline_fix_large_holes(
+        grid: list[list[Cell]], rng: random.Random
+        ) -> None:
+    """
+    fix_large_holes before open regions were tracked incrementally:
+    rescan every 3x3 window until a full pass closes no wall. Only the
+    random source differs (rng instead of the global random).
+    """
+    height = len(grid)
+    width = len(grid[0])
+    changed = True
+
+    while changed:
+        changed = False
+
+        for start_y in range(height - 2):
+            for start_x in range(width - 2):
+
+                fully_open = True
+
+                for dy in range(3):
+                    for dx in range(3):
+                        cell = grid[start_y + dy][start_x + dx]
+
+                        if cell.pattern:
+                            fully_open = False
+                            break
+
+                        if dx < 2:
+                            right = grid[start_y + dy][start_x + dx + 1]
+                            if cell.walls['E'] or right.walls['W']:
+                                fully_open = False
+                                break
+
+                        if dy < 2:
+                            bottom = grid[start_y + dy + 1][start_x + dx]
+                            if cell.walls['S'] or bottom.walls['N']:
+                                fully_open = False
+                                break
+
+                    if not fully_open:
+                        break
+
+                if not fully_open:
+                    continue
+
+                edges = []
+
+                for dy in range(3):
+                    for dx in range(3):
+                        x = start_x + dx
+                        y = start_y + dy
+                        cell = grid[y][x]
+
+                        if dx < 2:
+                            right = grid[y][x + 1]
+                            if not cell.walls['E']:
+                                edges.append((cell, right, 'E'))
+
+                        if dy < 2:
+                            bottom = grid[y + 1][x]
+                            if not cell.walls['S']:
+                                edges.append((cell, bottom, 'S'))
+
+                if not edges:
+                    continue
+
+                cell, neighbor, direction = rng.choice(edges)
+
+                if direction == 'E':
+                    cell.walls['E'] = True
+                    neighbor.walls['W'] = True
+                else:
+                    cell.walls['S'] = True
+                    neighbor.walls['N'] = True
+
+                changed = True
+
+
+def open_grid(
+        grid: Sequence[Sequence[Cell]], seed: int, p_open: float
+        ) -> None:
+    """
+    Open every inner wall with probability p_open, and maybe mark the
+    middle cell as a pattern cell.
+    """
+    rng = random.Random(seed)
+    height = len(grid)
+    width = len(grid[0])
+    for y in range(height):
+        for x in range(width):
+            cell = grid[y][x]
+            if x < width - 1 and rng.random() < p_open:
+                cell.walls['E'] = grid[y][x + 1].walls['W'] = False
+            if y < height - 1 and rng.random() < p_open:
+                cell.walls['S'] = grid[y + 1][x].walls['N'] = False
+    if rng.random() < 0.3:
+        grid[height // 2][width // 2].pattern = True
+
+
+def walls(grid: Sequence[Sequence[Cell]]) -> list[list[dict[str, bool]]]:
+    return [[dict(cell.walls) for cell in row] for row in grid]
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('seed', range(30))
+def test_closes_the_same_walls_as_the_baseline(
+        backend: str, seed: int
+        ) -> None:
+    width, height = 3 + seed % 17, 3 + seed * 7 % 13
+    p_open = (1.0, 0.9, 0.97)[seed % 3]
+
+    expected = [[Cell(x, y) for x in range(width)] for y in range(height)]
+    open_grid(expected, seed, p_open)
+    baseline_fix_large_holes(expected, random.Random(seed))
+
+    grid: Sequence[Sequence[Cell]]
+    if backend == 'BITPLANE':
+        grid = GridView(BitGrid(width, height))
+    else:
+        grid = [[Cell(x, y) for x in range(width)] for y in range(height)]
+    open_grid(grid, seed, p_open)
+    fix_large_holes(grid, random.Random(seed))
+
+    assert walls(grid) == walls(expected)
@@ -0,0 +1,81 @@
+import io
+from typing import TextIO
+
+import pytest
+
+from src.maze import bitgrid, print_output
+from src.maze.generator import MazeGenerator
+from src.maze.print_output import print_maze_hex, print_rows_hex
+from src.rendering.render_utils import cell_to_tile_index
+
+from .helpers import Grid, make_maze
+
+
+def baseline_print_maze_hex(grid: Grid, f: TextIO) -> None:
+    """
+    print_maze_hex before the bulk writer: one tile index per cell.
+    """
+    h = len(grid)
+    w = len(grid[0])
+    for y in range(h):
+        for x in range(w):
+            cell = grid[y][x]
+            f.write(f"{cell_to_tile_index(cell):x}")
+        f.write("\n")
+
+
+def hex_text(grid: Grid, bulk: bool) -> str:
+    f = io.StringIO()
+    if bulk:
+        print_maze_hex(grid, f)
+    else:
+        baseline_print_maze_hex(grid, f)
+    return f.getvalue()
+
+
+SIZES = [(1, 9), (2, 5), (7, 6), (13, 11), (20, 15), (9, 1)]
+
+
+@pytest.fixture(params=[1 << 20, 50])
+def block_cells(request: pytest.FixtureRequest,
+                monkeypatch: pytest.MonkeyPatch) -> int:
+    """
+    Block size of the bulk writer: the default, and one that no width
+    divides, so blocks end mid-maze on partial rows counts.
+    """
+    cells: int = request.param
+    monkeypatch.setattr(bitgrid, 'HEX_BLOCK_CELLS', cells)
+    monkeypatch.setattr(print_output, 'HEX_BLOCK_CELLS', cells)
+    return cells
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('width, height', SIZES)
+@pytest.mark.parametrize('perfect', [True, False])
+def test_bulk_writer_matches_the_per_cell_writer(
+        block_cells: int, backend: str, width: int, height: int,
+        perfect: bool
+        ) -> None:
+    grid = make_maze(
+        width, height, 2, PERFECT=perfect, BACKEND=backend, PATTERN='42'
+    )
+    assert hex_text(grid, True) == hex_text(grid, False)
+
+
+@pytest.mark.parametrize('width, height', SIZES)
+def test_row_writer_matches_the_per_cell_writer(
+        block_cells: int, width: int, height: int
+        ) -> None:
+    config = {
+        'WIDTH': width,
+        'HEIGHT': height,
+        'ENTRY': (0, 0),
+        'EXIT': (width - 1, height - 1),
+        'PERFECT': True,
+        'SEED': 6,
+        'ALGORITHM': 'ELLER',
+    }
+    f = io.StringIO()
+    print_rows_hex(MazeGenerator(config).stream_rows(), f)
+    grid = MazeGenerator(config).generate_eller()
+    assert f.getvalue() == hex_text(grid, False)
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from src.maze.generator import Cell
+from src.maze.generator_utils import set_wall_between
+from src.maze.incremental import IncrementalSolver
+
+from .helpers import Grid, assert_path, bfs_distances, make_maze
+
+
+def check(grid: Grid, solver: IncrementalSolver, start: Cell, goal: Cell
+          ) -> None:
+    result = solver.solve()
+    expected = bfs_distances(grid, start).get((goal.x, goal.y))
+    if expected is None:
+        assert result.path == []
+    else:
+        assert result.length == expected
+        assert_path(grid, result.path, start, goal, expected)
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('perfect', [True, False])
+@pytest.mark.parametrize('seed', range(8))
+def test_path_lengths_match_bfs_after_edits(
+        backend: str, perfect: bool, seed: int
+        ) -> None:
+    rng = random.Random(seed)
+    width, height = rng.randint(1, 25), rng.randint(2, 25)
+    grid = make_maze(
+        width, height, seed, PERFECT=perfect, IMPRATE=40, BACKEND=backend
+    )
+    start = grid[rng.randrange(height)][rng.randrange(width)]
+    goal = grid[rng.randrange(height)][rng.randrange(width)]
+    solver = IncrementalSolver(grid, start, goal)
+    check(grid, solver, start, goal)
+
+    for edit in range(30):
+        x, y = rng.randrange(width), rng.randrange(height)
+        sides = [
+            (x + dx, y + dy)
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+            if 0 <= x + dx < width and 0 <= y + dy < height
+        ]
+        if not sides:
+            continue
+        nx, ny = rng.choice(sides)
+        closed = rng.random() < 0.5
+        if edit % 2:
+            solver.set_wall(grid[y][x], grid[ny][nx], closed)
+        else:
+            # Walls changed behind the solver's back, then reported
+            set_wall_between(grid[y][x], grid[ny][nx], closed)
+            solver.wall_changed(grid[y][x], grid[ny][nx])
+        check(grid, solver, start, goal)
+
+
+def test_defaults_to_the_marked_entry_and_exit() -> None:
+    grid = make_maze(12, 9, 3)
+    solver = IncrementalSolver(grid)
+    check(grid, solver, grid[0][0], grid[8][11])
@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from src.maze.jump_search import JumpSearch
+from src.maze.maze_solver import SolverWorkspace
+
+from .helpers import assert_path, bfs_distances, make_maze
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('imprate', [0, 40, 90])
+@pytest.mark.parametrize('seed', range(8))
+def test_path_lengths_match_bfs(
+        backend: str, imprate: int, seed: int
+        ) -> None:
+    rng = random.Random(seed)
+    width, height = rng.randint(1, 30), rng.randint(2, 30)
+    grid = make_maze(
+        width, height, seed, PERFECT=imprate == 0, IMPRATE=imprate,
+        BIAS=rng.random(), BACKEND=backend
+    )
+    search = JumpSearch(grid)
+    workspace = SolverWorkspace(width, height)
+
+    for _ in range(10):
+        start = grid[rng.randrange(height)][rng.randrange(width)]
+        goal = grid[rng.randrange(height)][rng.randrange(width)]
+        result = search.solve(start, goal)
+        expected = bfs_distances(grid, start).get((goal.x, goal.y))
+        if expected is None:
+            assert result.path == []
+            continue
+        assert result.length == expected
+        assert_path(grid, result.path, start, goal, expected)
+        # Leaping along corridors never expands more cells than A*
+        assert result.expanded <= workspace.solve(
+            grid, start, goal
+        ).expanded + 1
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from src.maze.junctions import JunctionGraph
+
+from .helpers import assert_path, bfs_distances, make_maze
+
+SIZES = [(20, 15, '42'), (9, 7, ''), (1, 6, ''), (6, 1, ''), (2, 2, '')]
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('perfect', [True, False])
+@pytest.mark.parametrize('width, height, pattern', SIZES)
+@pytest.mark.parametrize('seed', range(3))
+def test_path_lengths_match_bfs(
+        backend: str, perfect: bool, width: int, height: int, pattern: str,
+        seed: int
+        ) -> None:
+    grid = make_maze(
+        width, height, seed, PERFECT=perfect, BACKEND=backend,
+        PATTERN=pattern, IMPRATE=30 * seed
+    )
+    graph = JunctionGraph(grid)
+    cells = [cell for row in grid for cell in row]
+
+    for goal in random.Random(seed).sample(cells, 3):
+        distances = bfs_distances(grid, goal)
+        for start in cells:
+            result = graph.solve(start, goal)
+            expected = distances.get((start.x, start.y))
+            if expected is None:
+                assert result.path == []
+            else:
+                assert result.length == expected
+                assert_path(grid, result.path, start, goal, expected)
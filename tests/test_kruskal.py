@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from src.maze import bitgrid, generator
+from src.maze.bitgrid import BitGrid, GridView
+from src.maze.generator import Cell
+from src.maze.pattern import make_pattern, mark_pattern
+
+from .helpers import Grid, assert_spanning_tree
+
+OPPOSITE = {'N': 'S', 'E': 'W', 'S': 'N', 'W': 'E'}
+STEPS = {'N': (0, -1), 'E': (1, 0), 'S': (0, 1), 'W': (-1, 0)}
+
+
+def assert_pattern_closed(grid: Grid) -> None:
+    """
+    Check no neighbour of a pattern cell is open towards it.
+    """
+    for row in grid:
+        for cell in row:
+            if not cell.pattern:
+                continue
+            for side, (dx, dy) in STEPS.items():
+                assert cell.walls[side]
+                x, y = cell.x + dx, cell.y + dy
+                if 0 <= x < len(row) and 0 <= y < len(grid):
+                    assert grid[y][x].walls[OPPOSITE[side]]
+
+
+SIZES = [(20, 15, '42'), (31, 23, 'HI'), (9, 7, '42'), (1, 6, ''),
+         (6, 1, ''), (2, 2, '')]
+
+
+@pytest.mark.parametrize('width, height, pattern', SIZES)
+@pytest.mark.parametrize('seed', range(4))
+def test_cell_kruskal_carves_a_spanning_tree(
+        width: int, height: int, pattern: str, seed: int
+        ) -> None:
+    grid = [[Cell(x, y) for x in range(width)] for y in range(height)]
+    cells = make_pattern(pattern)
+    if cells:
+        mark_pattern(grid, cells)
+    generator.kruskal(grid, seed, random.Random(seed))
+    assert_spanning_tree(grid)
+    assert_pattern_closed(grid)
+
+
+@pytest.mark.parametrize('width, height, pattern', SIZES)
+@pytest.mark.parametrize('seed', range(4))
+def test_bitgrid_kruskal_carves_a_spanning_tree(
+        width: int, height: int, pattern: str, seed: int
+        ) -> None:
+    bits = BitGrid(width, height)
+    cells = make_pattern(pattern)
+    if cells:
+        bits.mark_pattern(cells)
+    bitgrid.kruskal(bits, seed, random.Random(seed))
+    assert_spanning_tree(GridView(bits))
+    assert_pattern_closed(GridView(bits))
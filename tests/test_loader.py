@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import pytest
+
+from src.maze.loader import load_maze_file
+from src.maze.packed import write_packed
+from src.maze.print_output import tile_blocks
+
+from .helpers import make_maze, write_maze
+
+SIZES = [(1, 5), (2, 3), (7, 4), (13, 9), (20, 15)]
+
+
+@pytest.mark.parametrize('output_format', ['HEX', 'PACKED'])
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('width, height', SIZES)
+@pytest.mark.parametrize('perfect', [True, False])
+def test_round_trip(
+        tmp_path: Path, output_format: str, backend: str, width: int,
+        height: int, perfect: bool
+        ) -> None:
+    path = str(tmp_path / 'maze.txt')
+    grid, result = write_maze(
+        path, width, height, 1, output_format, PERFECT=perfect,
+        PATTERN='42'
+    )
+
+    loaded, stored, recorded = load_maze_file(path, backend)
+    assert list(tile_blocks(loaded)) == list(tile_blocks(grid))
+    assert stored.directions == result.directions
+    assert [(c.x, c.y) for c in stored.path] == [
+        (c.x, c.y) for c in result.path
+    ]
+    assert recorded == {
+        'WIDTH': width,
+        'HEIGHT': height,
+        'ENTRY': (0, 0),
+        'EXIT': (width - 1, height - 1),
+        'OUTPUT_FILE': path,
+        'OUTPUT_FORMAT': output_format,
+    }
+
+
+def hex_lines(tmp_path: Path) -> tuple[str, list[str]]:
+    path = str(tmp_path / 'maze.txt')
+    write_maze(path, 6, 5, 1, 'HEX')
+    with open(path) as f:
+        return path, f.read().split('\n')
+
+
+def test_rejects_neighbours_that_disagree(tmp_path: Path) -> None:
+    path, lines = hex_lines(tmp_path)
+    # Open the east wall of the first inner cell that has one closed,
+    # leaving the west wall of its neighbour closed
+    y, x = next(
+        (y, x) for y in range(5) for x in range(5)
+        if int(lines[y][x], 16) & 2
+    )
+    digit = format(int(lines[y][x], 16) & ~2, 'X')
+    lines[y] = lines[y][:x] + digit + lines[y][x + 1:]
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+
+    with pytest.raises(ValueError, match=rf'\({x + 1},{y}\) and its W'):
+        load_maze_file(path)
+
+
+def test_rejects_a_cell_open_on_the_border(tmp_path: Path) -> None:
+    path, lines = hex_lines(tmp_path)
+    lines[0] = format(int(lines[0][0], 16) & ~1, 'X') + lines[0][1:]
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+
+    with pytest.raises(ValueError, match='open on the maze border'):
+        load_maze_file(path)
+
+
+def test_rejects_a_hex_path_through_a_wall(tmp_path: Path) -> None:
+    path, lines = hex_lines(tmp_path)
+    # The entry is the top left cell, always closed to the north
+    lines[-1] = 'N' + lines[-1]
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+
+    with pytest.raises(ValueError, match=r'step 0 \(N\) is blocked'):
+        load_maze_file(path)
+
+
+def test_rejects_a_packed_path_through_a_wall(tmp_path: Path) -> None:
+    path = str(tmp_path / 'maze.bin')
+    grid = make_maze(6, 5, 1)
+    with open(path, 'wb') as f:
+        write_packed(grid, f, (0, 0), (5, 4), 'W')
+
+    with pytest.raises(ValueError, match=r'step 0 \(W\) is blocked'):
+        load_maze_file(path)
+
+
+def test_rejects_rows_of_different_widths(tmp_path: Path) -> None:
+    path, lines = hex_lines(tmp_path)
+    lines[2] = lines[2][:-1]
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+
+    with pytest.raises(ValueError, match='Row 2 has 5 cells, expected 6'):
+        load_maze_file(path)
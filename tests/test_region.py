@@ -0,0 +1,74 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from src.maze.print_output import tile_blocks
+from src.maze.region import MazeFile
+
+from .helpers import write_maze
+
+SIZES = [(1, 9), (2, 5), (7, 6), (13, 11), (20, 15)]
+
+
+@pytest.mark.parametrize('output_format', ['HEX', 'PACKED'])
+@pytest.mark.parametrize('width, height', SIZES)
+@pytest.mark.parametrize('block_rows', [1, 3, None])
+def test_regions_match_the_written_grid(
+        tmp_path: Path, output_format: str, width: int, height: int,
+        block_rows: int | None
+        ) -> None:
+    path = str(tmp_path / 'maze.txt')
+    grid, result = write_maze(path, width, height, 2, output_format)
+    tiles = b''.join(tile_blocks(grid))
+    rng = random.Random(width)
+
+    with MazeFile(path, capacity=2, block_rows=block_rows) as maze:
+        assert (maze.width, maze.height) == (width, height)
+        assert maze.entry == (0, 0)
+        assert maze.exit == (width - 1, height - 1)
+        assert maze.format == output_format
+        assert maze.directions() == result.directions
+
+        for _ in range(20):
+            x, y = rng.randrange(width), rng.randrange(height)
+            w = rng.randint(1, width - x)
+            h = rng.randint(1, height - y)
+            assert maze.region_tiles(x, y, w, h) == [
+                tiles[row * width + x:row * width + x + w]
+                for row in range(y, y + h)
+            ]
+
+        stats = maze.stats
+        assert stats['hits'] + stats['misses'] > 0
+        assert len(maze.blocks) <= 2
+        assert stats['evictions'] == stats['misses'] - len(maze.blocks)
+
+
+def test_region_is_closed_at_its_edges(tmp_path: Path) -> None:
+    path = str(tmp_path / 'maze.txt')
+    write_maze(path, 12, 10, 3, 'HEX', PERFECT=True)
+
+    with MazeFile(path) as maze:
+        bits = maze.region(3, 2, 5, 4)
+    assert (bits.width, bits.height) == (5, 4)
+    assert bits.east[4::5] == b'\x01' * 4
+    assert bits.south[-5:] == b'\x01' * 5
+    for i in range(5):
+        assert bits.has_wall(i, 'N')
+    for i in range(0, 20, 5):
+        assert bits.has_wall(i, 'W')
+
+
+@pytest.mark.parametrize('x, y, w, h', [
+    (0, 0, 0, 1), (0, 0, 1, 0), (-1, 0, 2, 2), (5, 0, 4, 1), (0, 8, 1, 3),
+])
+def test_rejects_regions_outside_the_maze(
+        tmp_path: Path, x: int, y: int, w: int, h: int
+        ) -> None:
+    path = str(tmp_path / 'maze.txt')
+    write_maze(path, 8, 10, 1, 'PACKED')
+
+    with MazeFile(path) as maze:
+        with pytest.raises(ValueError, match='is not inside'):
+            maze.region_tiles(x, y, w, h)
@@ -0,0 +1,80 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import Any
+
+import pytest
+
+from src.maze.generator import MazeGenerator, derive_rng
+
+from .helpers import Grid
+
+THREADS = 8
+
+
+def config_for(seed: int, **entries: Any) -> dict[str, Any]:
+    config: dict[str, Any] = {
+        'WIDTH': 30,
+        'HEIGHT': 25,
+        'ENTRY': (0, 0),
+        'EXIT': (29, 24),
+        'PERFECT': False,
+        'SEED': seed,
+        'BIAS': 0.5,
+        'IMPRATE': 65,
+        'PATTERN': '42',
+    }
+    config.update(entries)
+    return config
+
+
+def walls(grid: Grid) -> list[list[dict[str, bool]]]:
+    return [[dict(cell.walls) for cell in row] for row in grid]
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('algorithm', [None, 'KRUSKAL', 'ELLER'])
+def test_same_seed_in_threads_gives_the_same_maze(
+        backend: str, algorithm: str | None
+        ) -> None:
+    config = config_for(11, BACKEND=backend, ALGORITHM=algorithm)
+    expected = walls(MazeGenerator(config).generate())
+    start = Barrier(THREADS)
+
+    def generate(index: int) -> list[list[dict[str, bool]]]:
+        # Disturb the global random source: generators must not use it
+        random.seed(index)
+        start.wait()
+        return walls(MazeGenerator(config).generate())
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        grids = list(pool.map(generate, range(THREADS)))
+
+    assert all(grid == expected for grid in grids)
+
+
+def test_derived_streams_are_reproducible() -> None:
+    first = [derive_rng(42, i).random() for i in range(10)]
+    again = [derive_rng(42, i).random() for i in range(10)]
+    assert first == again
+
+
+def test_derived_streams_differ() -> None:
+    streams = [
+        tuple(derive_rng(42, i).getrandbits(64) for _ in range(4))
+        for i in range(100)
+    ]
+    assert len(set(streams)) == len(streams)
+    other_seed = [derive_rng(43, i).getrandbits(64) for i in range(100)]
+    assert other_seed != [stream[0] for stream in streams]
+
+
+def test_derived_streams_give_different_mazes() -> None:
+    config = config_for(42)
+    mazes = [
+        walls(MazeGenerator(config, derive_rng(42, i)).generate())
+        for i in range(3)
+    ]
+    assert mazes[0] != mazes[1] != mazes[2] != mazes[0]
+    again = walls(MazeGenerator(config, derive_rng(42, 1)).generate())
+    assert again == mazes[1]
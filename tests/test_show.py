@@ -0,0 +1,25 @@
+from pathlib import Path
+from typing import Any
+
+from src.maze.loader import load_maze_file
+from src.rendering.terminal_renderer import TerminalDisplay
+
+from .helpers import write_maze
+
+
+def test_regenerating_a_shown_maze_keeps_its_file(tmp_path: Path) -> None:
+    path = str(tmp_path / 'maze.txt')
+    write_maze(path, 9, 7, 1, 'HEX')
+    with open(path, 'rb') as f:
+        written = f.read()
+
+    # As a_maze_ing.py show builds it without a config file
+    config: dict[str, Any] = {'PERFECT': True}
+    grid, result, recorded = load_maze_file(path)
+    config.update(recorded)
+    display = TerminalDisplay(grid, result, config, write_output=False)
+    display.regenerate_maze()
+
+    with open(path, 'rb') as f:
+        assert f.read() == written
+    assert display.grid is not grid
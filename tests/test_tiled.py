@@ -0,0 +1,50 @@
+import io
+
+import pytest
+
+from src.maze.print_output import print_maze_hex
+
+from .helpers import assert_connected, assert_spanning_tree, make_maze
+
+# Width, height and tile size: the pattern in the middle crosses tile
+# borders in all of them
+SIZES = [(37, 29, 5), (40, 30, 7), (23, 41, 4), (25, 25, 3), (30, 30, 2)]
+
+
+@pytest.mark.parametrize('width, height, tile_size', SIZES)
+@pytest.mark.parametrize('pattern', ['42', 'HI', ''])
+@pytest.mark.parametrize('seed', range(3))
+def test_perfect_tiled_maze_is_a_spanning_tree(
+        width: int, height: int, tile_size: int, pattern: str, seed: int
+        ) -> None:
+    grid = make_maze(
+        width, height, seed, PERFECT=True, BIAS=seed / 2,
+        PATTERN=pattern, TILE_SIZE=tile_size, WORKERS=1
+    )
+    assert_spanning_tree(grid)
+
+
+@pytest.mark.parametrize('width, height, tile_size', SIZES)
+@pytest.mark.parametrize('seed', range(3))
+def test_imperfect_tiled_maze_is_connected(
+        width: int, height: int, tile_size: int, seed: int
+        ) -> None:
+    grid = make_maze(
+        width, height, seed, IMPRATE=30 * seed + 10, PATTERN='42',
+        TILE_SIZE=tile_size, WORKERS=1
+    )
+    assert_connected(grid)
+
+
+@pytest.mark.parametrize('perfect', [True, False])
+def test_worker_count_does_not_change_the_maze(perfect: bool) -> None:
+    output = []
+    for workers in (1, 2):
+        grid = make_maze(
+            45, 33, 8, PERFECT=perfect, PATTERN='42', TILE_SIZE=10,
+            WORKERS=workers
+        )
+        f = io.StringIO()
+        print_maze_hex(grid, f)
+        output.append(f.getvalue())
+    assert output[0] == output[1]
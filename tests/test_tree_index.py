@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from src.maze.maze_solver import TreeIndex
+
+from .helpers import assert_path, bfs_distances, make_maze
+
+SIZES = [(20, 15, '42'), (9, 7, ''), (1, 6, ''), (6, 1, '')]
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('algorithm', ['GROWING_TREE', 'KRUSKAL'])
+@pytest.mark.parametrize('width, height, pattern', SIZES)
+@pytest.mark.parametrize('seed', range(3))
+def test_paths_match_bfs(
+        backend: str, algorithm: str, width: int, height: int,
+        pattern: str, seed: int
+        ) -> None:
+    entries = {'ALGORITHM': algorithm} if algorithm == 'KRUSKAL' else {}
+    grid = make_maze(
+        width, height, seed, PERFECT=True, BACKEND=backend,
+        PATTERN=pattern, **entries
+    )
+    tree = TreeIndex.build(grid)
+    assert tree is not None
+
+    cells = [cell for row in grid for cell in row]
+    for a in random.Random(seed).sample(cells, 3):
+        distances = bfs_distances(grid, a)
+        for b in cells:
+            expected = distances.get((b.x, b.y))
+            assert tree.distance(a, b) == expected
+            if expected is None:
+                assert tree.path(a, b) == []
+            else:
+                assert_path(grid, tree.path(a, b), a, b, expected)
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+def test_imperfect_maze_has_no_tree(backend: str) -> None:
+    grid = make_maze(20, 15, 1, BACKEND=backend)
+    assert TreeIndex.build(grid) is None
@@ -0,0 +1,36 @@
+import pytest
+
+from src.maze.maze_solver import SolverWorkspace, solve_maze
+
+from .helpers import make_maze
+
+
+@pytest.mark.parametrize('backend', ['CELL', 'BITPLANE'])
+@pytest.mark.parametrize('bidirectional', [None, True, False])
+def test_reused_workspace_matches_fresh_solves(
+        backend: str, bidirectional: bool | None
+        ) -> None:
+    workspace = SolverWorkspace(24, 18)
+    for seed in range(12):
+        grid = make_maze(
+            24, 18, seed, PERFECT=seed % 3 == 0, IMPRATE=(10, 65)[seed % 2],
+            PATTERN=('', '42')[seed % 2], BACKEND=backend
+        )
+        fresh = solve_maze(grid, bidirectional=bidirectional)
+        for _ in range(2):
+            reused = solve_maze(grid, workspace, bidirectional)
+            assert reused.directions == fresh.directions
+            assert reused.length == fresh.length
+            assert ([(c.x, c.y) for c in reused.path]
+                    == [(c.x, c.y) for c in fresh.path])
+
+
+@pytest.mark.parametrize('width, height', [(24, 17), (23, 18), (18, 24)])
+def test_fits_rejects_other_sizes(width: int, height: int) -> None:
+    workspace = SolverWorkspace(24, 18)
+    assert workspace.fits(make_maze(24, 18, 1))
+
+    grid = make_maze(width, height, 1)
+    assert not workspace.fits(grid)
+    assert (solve_maze(grid, workspace).directions
+            == solve_maze(grid).directions)